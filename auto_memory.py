@@ -22,19 +22,25 @@ Usage:
     # Call when discovering user preference
     auto_mem.record_preference(what_was_learned, context)
     
-    # Call at end of session
+    # Call at end of session (flushes any buffered records)
     auto_mem.end_session()
+
+Records are validated when recorded, buffered in memory and written in one
+batch when the buffer reaches ``flush_every`` items, on
+``end_session()``/``get_stats()``/``close()``, at interpreter exit, or when
+``flush(force=True)`` is called explicitly.
 """
 
+import atexit
+import logging
 import os
-import sys
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, NamedTuple
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
 from brain.scripts import (
     LayeredMemoryStore, 
     LayeredChunkStoreAdapter, 
@@ -42,6 +48,56 @@ from brain.scripts import (
     RememberOperation
 )
 
+logger = logging.getLogger(__name__)
+
+# Shared tag tuples for the fixed record_* categories
+_TAGS_SESSION_START = ('session', 'start')
+_TAGS_SESSION_END = ('session', 'end', 'summary')
+_TAGS_TASK = ('task', 'completion')
+_TAGS_DECISION = ('decision', 'architecture')
+_TAGS_PREF = ('preference', 'user')
+_TAGS_ISSUE = ('issue', 'resolution', 'fix')
+_TAGS_NOTE = ('note',)
+
+# Content templates for record_* methods (filled with str.format_map)
+_TASK_TEMPLATE = "Task {task_id} completed.\nWhat was done: {what}\nOutcome: {outcome}{files}"
+_DECISION_TEMPLATE = "Decision: {decision}\nRationale: {rationale}{alternatives}"
+_PREFERENCE_TEMPLATE = "User preference: {what}{context}"
+_PATTERN_TEMPLATE = "Code pattern ({pattern_type}): {description}\nExamples:\n{examples}"
+_ISSUE_TEMPLATE = "Issue: {issue}\nSolution: {solution}{root_cause}"
+_SESSION_END_TEMPLATE = (
+    "Session ended at {ended}.\n"
+    "Duration: {duration}\n"
+    "Things learned/recorded: {count}\n"
+    "\n"
+    "Recent activity:\n"
+    "{activity}\n"
+    "\n"
+    "Summary: {summary}"
+)
+
+# Length of the per-item summary shown in the end-of-session activity list
+_SUMMARY_WIDTH = 50
+
+
+class LearnedItem(NamedTuple):
+    """One thing recorded during a session, as listed by end_session()."""
+    kind: str
+    summary: str
+
+
+# AutoMemory instances holding records not yet written, flushed at exit
+_UNFLUSHED: "weakref.WeakSet[AutoMemory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unflushed() -> None:
+    for auto_mem in list(_UNFLUSHED):
+        try:
+            auto_mem.close()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not flush auto-memory records for {auto_mem.conversation_id}: {e}")
+
 
 class AutoMemory:
     """
@@ -55,7 +111,8 @@ class AutoMemory:
     - Session context
     """
     
-    def __init__(self, memory_path: str = '.agents/memory', conversation_id: Optional[str] = None):
+    def __init__(self, memory_path: str = '.agents/memory', conversation_id: Optional[str] = None,
+                 flush_every: int = 32):
         # We ignore memory_path for the layered store as it uses MemoryPolicy
         # But we keep the argument for backward compatibility in signature
         self.policy = MemoryPolicy(project_root=Path.cwd())
@@ -66,16 +123,69 @@ class AutoMemory:
         self.store = LayeredChunkStoreAdapter(self.raw_store)
         
         self.remember = RememberOperation(self.store)
-        self.conversation_id = conversation_id or f"session-{datetime.now().strftime('%Y-%m-%d-%H%M')}"
         self.session_start = datetime.now()
-        self.things_learned: List[Dict[str, Any]] = []
+        # Monotonic anchor for durations (immune to wall-clock jumps, cheaper to read)
+        self._session_start_mono = time.monotonic()
+        self.conversation_id = conversation_id or f"session-{self.session_start.strftime('%Y-%m-%d-%H%M')}"
+        self.things_learned: List[LearnedItem] = []
+        
+        # Pending remember() kwargs, written in one pass by flush()
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_every = max(1, flush_every)
+        
+    def _queue(self, **kwargs):
+        """Validate and buffer a remember() call, flushing once the threshold is hit."""
+        kwargs.setdefault('conversation_id', self.conversation_id)
+        # Raise bad arguments here, at the record_* call, not at flush time
+        RememberOperation.validate(
+            kwargs['content'],
+            kwargs['conversation_id'],
+            kwargs.get('confidence', 0.7),
+            kwargs.get('chunk_type'),
+        )
+        self._pending.append(kwargs)
+        _UNFLUSHED.add(self)
+        self.flush()
+        
+    def flush(self, force: bool = False) -> int:
+        """
+        Write buffered records to the store in one RememberOperation.batch().
+        
+        A record leaves the buffer once remember() has handed it to the
+        store. If one fails, it and the records after it stay buffered for
+        the next flush and the error is raised.
+        
+        Args:
+            force: Flush even if the buffer is below the flush threshold
+            
+        Returns:
+            Number of records written
+        """
+        if not self._pending or (not force and len(self._pending) < self._flush_every):
+            return 0
+        
+        remember = self.remember.remember
+        written = 0
+        try:
+            with self.remember.batch():
+                for item in self._pending:
+                    remember(**item)
+                    written += 1
+        finally:
+            del self._pending[:written]
+            if not self._pending:
+                _UNFLUSHED.discard(self)
+        return written
+    
+    def close(self):
+        """Write any buffered records (also done at interpreter exit)."""
+        self.flush(force=True)
         
     def start_session(self, context: str = ""):
         """Record session start with context."""
-        self.remember.remember(
+        self._queue(
             content=f"Session started at {self.session_start.isoformat()}. Context: {context or 'General work session'}",
-            conversation_id=self.conversation_id,
-            tags=['session', 'start'],
+            tags=_TAGS_SESSION_START,
             confidence=1.0,
             chunk_type='note'
         )
@@ -91,25 +201,21 @@ class AutoMemory:
             outcome: Success, failure, partial, etc.
             files_modified: List of files that were changed
         """
-        files_str = f"\nFiles modified: {', '.join(files_modified)}" if files_modified else ""
-        
-        content = f"""Task {task_id} completed.
-What was done: {what_was_done}
-Outcome: {outcome}{files_str}"""
+        content = _TASK_TEMPLATE.format_map({
+            'task_id': task_id,
+            'what': what_was_done,
+            'outcome': outcome,
+            'files': f"\nFiles modified: {', '.join(files_modified)}" if files_modified else "",
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['task', 'completion', task_id],
+            tags=_TAGS_TASK + (task_id,),
             confidence=0.95,
             chunk_type='note'
         )
         
-        self.things_learned.append({
-            'type': 'task',
-            'id': task_id,
-            'outcome': outcome
-        })
+        self.things_learned.append(LearnedItem(kind='task', summary=task_id[:_SUMMARY_WIDTH]))
         
     def record_decision(self, decision: str, rationale: str, 
                        alternatives: List[str] = None, confidence: float = 0.9):
@@ -122,25 +228,20 @@ Outcome: {outcome}{files_str}"""
             alternatives: Other options considered
             confidence: How confident we are in this decision (0-1)
         """
-        alt_str = ""
-        if alternatives:
-            alt_str = f"\nAlternatives considered: {', '.join(alternatives)}"
-        
-        content = f"""Decision: {decision}
-Rationale: {rationale}{alt_str}"""
+        content = _DECISION_TEMPLATE.format_map({
+            'decision': decision,
+            'rationale': rationale,
+            'alternatives': f"\nAlternatives considered: {', '.join(alternatives)}" if alternatives else "",
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['decision', 'architecture'],
+            tags=_TAGS_DECISION,
             confidence=confidence,
             chunk_type='decision'
         )
         
-        self.things_learned.append({
-            'type': 'decision',
-            'decision': decision
-        })
+        self.things_learned.append(LearnedItem(kind='decision', summary=decision[:_SUMMARY_WIDTH]))
         
     def record_preference(self, what_was_learned: str, context: str = "", 
                          confidence: float = 0.85):
@@ -152,22 +253,19 @@ Rationale: {rationale}{alt_str}"""
             context: When/how we learned this
             confidence: How sure we are (0-1)
         """
-        ctx_str = f"\nContext: {context}" if context else ""
-        
-        content = f"""User preference: {what_was_learned}{ctx_str}"""
+        content = _PREFERENCE_TEMPLATE.format_map({
+            'what': what_was_learned,
+            'context': f"\nContext: {context}" if context else "",
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['preference', 'user'],
+            tags=_TAGS_PREF,
             confidence=confidence,
             chunk_type='preference'
         )
         
-        self.things_learned.append({
-            'type': 'preference',
-            'content': what_was_learned
-        })
+        self.things_learned.append(LearnedItem(kind='preference', summary=what_was_learned[:_SUMMARY_WIDTH]))
         
     def record_file_pattern(self, pattern_type: str, description: str, examples: List[str]):
         """
@@ -178,16 +276,15 @@ Rationale: {rationale}{alt_str}"""
             description: What the pattern is
             examples: Examples of the pattern
         """
-        examples_str = '\n'.join(f"  - {ex}" for ex in examples[:3])
-        
-        content = f"""Code pattern ({pattern_type}): {description}
-Examples:
-{examples_str}"""
+        content = _PATTERN_TEMPLATE.format_map({
+            'pattern_type': pattern_type,
+            'description': description,
+            'examples': '\n'.join(f"  - {ex}" for ex in examples[:3]),
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['pattern', pattern_type, 'codebase'],
+            tags=('pattern', pattern_type, 'codebase'),
             confidence=0.9,
             chunk_type='pattern'
         )
@@ -202,55 +299,76 @@ Examples:
             solution: How it was fixed
             root_cause: Why it happened (optional)
         """
-        root_str = f"\nRoot cause: {root_cause}" if root_cause else ""
-        
-        content = f"""Issue: {issue}
-Solution: {solution}{root_str}"""
+        content = _ISSUE_TEMPLATE.format_map({
+            'issue': issue,
+            'solution': solution,
+            'root_cause': f"\nRoot cause: {root_cause}" if root_cause else "",
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['issue', 'resolution', 'fix'],
+            tags=_TAGS_ISSUE,
             confidence=0.95,
             chunk_type='note'
         )
         
     def end_session(self, summary: str = ""):
         """Record session end with summary."""
-        duration = datetime.now() - self.session_start
-        
-        things_str = "\n".join(
-            f"  - {item['type']}: {item.get('id', item.get('decision', item.get('content', 'unknown')))[:50]}"
-            for item in self.things_learned[-10:]  # Last 10 things
-        )
-        
-        content = f"""Session ended at {datetime.now().isoformat()}.
-Duration: {duration}
-Things learned/recorded: {len(self.things_learned)}
-
-Recent activity:
-{things_str}
-
-Summary: {summary or 'Work session completed'}"""
+        now = datetime.now()
+        duration = self._session_duration()
+        
+        content = _SESSION_END_TEMPLATE.format_map({
+            'ended': now.isoformat(),
+            'duration': duration,
+            'count': len(self.things_learned),
+            'activity': "\n".join(
+                f"  - {item.kind}: {item.summary}"
+                for item in self.things_learned[-10:]  # Last 10 things
+            ),
+            'summary': summary or 'Work session completed',
+        })
         
-        self.remember.remember(
+        self._queue(
             content=content,
-            conversation_id=self.conversation_id,
-            tags=['session', 'end', 'summary'],
+            tags=_TAGS_SESSION_END,
             confidence=1.0,
             chunk_type='note'
         )
+        self.flush(force=True)
+        
+    def _session_duration(self) -> timedelta:
+        """Elapsed session time measured on the monotonic clock."""
+        return timedelta(seconds=time.monotonic() - self._session_start_mono)
         
     def get_stats(self) -> Dict[str, Any]:
         """Get stats about what we've remembered."""
+        self.flush(force=True)
         return {
             'things_learned_this_session': len(self.things_learned),
             'conversation_id': self.conversation_id,
-            'session_duration': datetime.now() - self.session_start,
+            'session_duration': self._session_duration(),
             'store_stats': self.store.get_stats()
         }
 
 
+# Shared quick_remember state, keyed by project root (cwd)
+_QR_STATE: Dict[Path, RememberOperation] = {}
+_QR_LOCK = threading.Lock()
+
+
+def _get_quick_remember() -> RememberOperation:
+    """Build the quick_remember store stack once per project root and reuse it."""
+    project_root = Path.cwd()
+    with _QR_LOCK:
+        remember = _QR_STATE.get(project_root)
+        if remember is None:
+            policy = MemoryPolicy(project_root=project_root)
+            raw_store = LayeredMemoryStore(policy=policy, agent_id="quick-remember-agent")
+            remember = RememberOperation(LayeredChunkStoreAdapter(raw_store))
+            _QR_STATE[project_root] = remember
+        return remember
+
+
 # Convenience function for quick recording
 def quick_remember(content: str, tags: List[str] = None, 
                    memory_path: str = '.agents/memory',
@@ -266,21 +384,13 @@ def quick_remember(content: str, tags: List[str] = None,
             tags=['preference', 'python']
         )
     """
-    policy = MemoryPolicy(project_root=Path.cwd())
-    raw_store = LayeredMemoryStore(policy=policy, agent_id="quick-remember-agent")
-    store = LayeredChunkStoreAdapter(raw_store)
-    
-    remember = RememberOperation(store)
-    
-    result = remember.remember(
+    return _get_quick_remember().remember(
         content=content,
         conversation_id=conversation_id or f"quick-{datetime.now().isoformat()}",
-        tags=tags or ['note'],
+        tags=tags or _TAGS_NOTE,
         confidence=0.9,
         chunk_type='note'
     )
-    
-    return result
 
 
 if __name__ == "__main__":
@@ -58,8 +58,8 @@ def validate_skill_runtime(skill_dir: Path):
 def verify_installation(skill_dir: Path):
     """Run verification against skill-local runtime without repo-level install."""
     print("Verifying skill-local runtime...")
-    # Create a temporary verification script
-    verify_script = """
+    # Verification code is passed inline via -c; nothing is written to skill_dir
+    verify_code = """
 import sys
 from pathlib import Path
 try:
@@ -80,12 +80,12 @@ except Exception as e:
     print(f"Verification failed: {e}")
     sys.exit(1)
 """
-    verify_path = skill_dir / "verify_bootstrap.py"
-    verify_path.write_text(verify_script, encoding="utf-8")
 
     env = os.environ.copy()
     env["PYTHONPATH"] = str(skill_dir)
-    cmd = [sys.executable, "verify_bootstrap.py"]
+    # One-shot check: don't leave __pycache__ behind
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    cmd = [sys.executable, "-c", verify_code]
     result = subprocess.run(
         cmd,
         cwd=skill_dir,
@@ -96,14 +96,10 @@ except Exception as e:
     )
     if result.returncode != 0:
         print(f"Error running verification: {result.stdout}")
-        verify_path.unlink(missing_ok=True)
         return False
 
-    success = True
-    if success:
-        print("Verification passed (skill-local runtime).")
-    verify_path.unlink(missing_ok=True)
-    return success
+    print("Verification passed (skill-local runtime).")
+    return True
 
 def update_agents_md(target_dir: Path):
     """Add blurb to AGENTS.md."""
@@ -118,11 +114,11 @@ This project uses the RLM-MEM RLM Memory System (layered `.agents/memory/`).
 """
     
     if agents_md.exists():
-        content = agents_md.read_text(encoding="utf-8")
-        if "RLM-MEM Brain Protocol" not in content:
+        # Scan raw bytes for the marker; only the blurb itself is ever encoded
+        if b"RLM-MEM Brain Protocol" not in agents_md.read_bytes():
             print("Updating AGENTS.md...")
-            with agents_md.open("a", encoding="utf-8") as f:
-                f.write(f"\n{blurb}\n")
+            with agents_md.open("ab") as f:
+                f.write(b"\n" + blurb.encode("utf-8") + b"\n")
         else:
             print("AGENTS.md already contains memory protocol.")
     else:
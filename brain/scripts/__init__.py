@@ -4,75 +4,106 @@ RLM-MEM - Memory Storage System
 Provides RLM-based memory storage with JSON chunks and graph linking.
 """
 
-from .memory_store import (
-    ChunkStore,
-    ChunkIndex,
-    Chunk,
-    ChunkMetadata,
-    ChunkLinks,
-    ChunkType,
-    init_storage
-)
+import importlib
 
-from .auto_linker import (
-    AutoLinker,
-    create_chunk_with_links,
-    calculate_link_strength
-)
-from .remember_operation import RememberOperation
-from .recall_operation import RecallOperation, RecallResult
-from .reason_operation import ReasonOperation, ReasonResult
-from .cache_system import MemoryCache, CacheManager
-from .memory_policy import MemoryPolicy, load_memory_policy
-from .memory_layers import resolve_all_layer_paths, build_retrieval_plan
-from .memory_safety import (
-    should_allow_layer_write,
-    apply_redaction_rules,
-    is_record_visible_to_project,
-)
+# Eager exports: the layered write path used by auto_memory/bootstrap.
+from .memory_policy import MemoryPolicy
 from .layered_memory_store import LayeredMemoryStore
 from .layered_adapter import LayeredChunkStoreAdapter
-from .llm_client import (
-    LLMClient,
-    LLMResponse,
-    LLMError,
-    LLMTransientError,
-    LLMPermanentError,
-    LLMBudgetExceededError
-)
+from .remember_operation import RememberOperation
+
+# Everything else is imported on first attribute access (PEP 562).
+_LAZY = {
+    # Memory store
+    "ChunkStore": ".memory_store",
+    "ChunkIndex": ".memory_store",
+    "Chunk": ".memory_store",
+    "ChunkMetadata": ".memory_store",
+    "ChunkLinks": ".memory_store",
+    "ChunkType": ".memory_store",
+    "init_storage": ".memory_store",
+    # Auto-linker
+    "AutoLinker": ".auto_linker",
+    "create_chunk_with_links": ".auto_linker",
+    "calculate_link_strength": ".auto_linker",
+    # Recall / reason operations
+    "RecallOperation": ".recall_operation",
+    "RecallResult": ".recall_operation",
+    "ReasonOperation": ".reason_operation",
+    "ReasonResult": ".reason_operation",
+    # Cache system
+    "MemoryCache": ".cache_system",
+    "CacheManager": ".cache_system",
+    # Layered memory policy/resolver
+    "load_memory_policy": ".memory_policy",
+    "resolve_all_layer_paths": ".memory_layers",
+    "build_retrieval_plan": ".memory_layers",
+    "should_allow_layer_write": ".memory_safety",
+    "apply_redaction_rules": ".memory_safety",
+    "is_record_visible_to_project": ".memory_safety",
+    # LLM Wrapper (D2.1)
+    "LLMClient": ".llm_client",
+    "LLMResponse": ".llm_client",
+    "LLMError": ".llm_client",
+    "LLMTransientError": ".llm_client",
+    "LLMPermanentError": ".llm_client",
+    "LLMBudgetExceededError": ".llm_client",
+    # Original RLM-MEM format (personalities, sliders, LIVEHUD)
+    "RLMMEMConfig": ".original_rlm_mem",
+    "SliderConfig": ".original_rlm_mem",
+    "PersonalityMode": ".original_rlm_mem",
+    "MemoryProtocol": ".original_rlm_mem",
+    "SystemState": ".original_rlm_mem",
+    "load_rlm_mem_config": ".original_rlm_mem",
+    "activate_mode": ".original_rlm_mem",
+    "parse_slider_command": ".original_rlm_mem",
+}
+
+# REPL Environment (D1.3) - optional, missing deps surface as AttributeError
+_LAZY_OPTIONAL = {
+    "REPLSession": ".repl_environment",
+    "FINAL": ".repl_environment",
+    "llm_query": ".repl_environment",
+    "SandboxViolation": ".repl_environment",
+    "MaxIterationsError": ".repl_environment",
+    "TimeoutError": ".repl_environment",
+    "CostBudgetExceededError": ".repl_environment",
+    "read_chunk": ".repl_functions",
+    "search_chunks": ".repl_functions",
+    "list_chunks_by_tag": ".repl_functions",
+    "get_linked_chunks": ".repl_functions",
+}
+
+
+def _repl_available() -> bool:
+    try:
+        for name, module_name in _LAZY_OPTIONAL.items():
+            getattr(importlib.import_module(module_name, __name__), name)
+    except (ImportError, AttributeError):
+        return False
+    return True
+
+
+def __getattr__(name):
+    if name == "_REPL_AVAILABLE":
+        value = _repl_available()
+    elif name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    elif name in _LAZY_OPTIONAL:
+        try:
+            module = importlib.import_module(_LAZY_OPTIONAL[name], __name__)
+        except ImportError as exc:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-# Original RLM-MEM format (personalities, sliders, LIVEHUD)
-from .original_rlm_mem import (
-    RLMMEMConfig,
-    SliderConfig,
-    PersonalityMode,
-    MemoryProtocol,
-    SystemState,
-    load_rlm_mem_config,
-    activate_mode,
-    parse_slider_command
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_LAZY_OPTIONAL))
 
-# REPL Environment (D1.3)
-try:
-    from .repl_environment import (
-        REPLSession,
-        FINAL,
-        llm_query,
-        SandboxViolation,
-        MaxIterationsError,
-        TimeoutError,
-        CostBudgetExceededError
-    )
-    from .repl_functions import (
-        read_chunk,
-        search_chunks,
-        list_chunks_by_tag,
-        get_linked_chunks
-    )
-    _REPL_AVAILABLE = True
-except ImportError:
-    _REPL_AVAILABLE = False
 
 __all__ = [
     # Memory store
@@ -5,7 +5,11 @@ D1.4: Automatic link generation between chunks.
 Provides AutoLinker for automatic relationship generation between memories.
 """
 
+import functools
+import hashlib
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -20,7 +24,15 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class LinkStrength:
     """Link strength with reasoning."""
     score: float
@@ -37,10 +49,23 @@ class AutoLinker:
     - related_to: Shares any tag (bidirectional)
     """
     
+    # Maximum number of tags kept in the tag -> chunk IDs lookup cache
+    TAG_CACHE_SIZE = 256
+    # Maximum number of chunk digests remembered to skip no-op rewrites
+    WRITE_CACHE_SIZE = 4096
+    
     def __init__(self, chunk_store: ChunkStore,
                  temporal_window_minutes: int = 5):
         self.chunk_store = chunk_store
         self.temporal_window = timedelta(minutes=temporal_window_minutes)
+        # LRU cache of tag_index lookups, only inside cached_tags() blocks;
+        # kept in sync with chunks linked here
+        self._tag_cache: "Optional[OrderedDict[str, Set[str]]]" = None
+        self._tag_cache_depth = 0
+        # Digest of the last bytes written per chunk
+        self._last_written: Dict[str, bytes] = {}
+        # Resolve the save path once: the store's own save_chunk, or a direct file write
+        self._save = getattr(chunk_store, "save_chunk", None) or self._save_via_path
     
     def link_on_create(self, new_chunk: Chunk) -> Chunk:
         """
@@ -61,39 +86,64 @@ class AutoLinker:
         
         # Parse creation timestamp
         try:
-            created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+            created = _parse_iso(created_str)
         except (ValueError, AttributeError):
             logger.warning(f"Invalid created timestamp for chunk {chunk_id}")
             created = datetime.utcnow()
         
+        # Reverse edges (target_id, link_type) applied in one grouped pass
+        pending_reverse: List[Tuple[str, str]] = []
+        
+        # Membership sets mirror the link lists so dedup checks stay O(1)
+        links = new_chunk.links
+        context_set = set(links.context_of)
+        follows_set = set(links.follows)
+        related_set = set(links.related_to)
+        
         # 1. Find conversation context links
         context_chunks = self._find_conversation_chunks(conversation_id, chunk_id)
         for target_id in context_chunks:
-            if target_id not in new_chunk.links.context_of:
-                new_chunk.links.context_of.append(target_id)
+            if target_id not in context_set:
+                context_set.add(target_id)
+                links.context_of.append(target_id)
                 # Bidirectional
-                self._add_reverse_link(target_id, chunk_id, "context_of")
+                pending_reverse.append((target_id, "context_of"))
         
         # 2. Find temporal predecessors
         predecessor_chunks = self._find_temporal_predecessors(
-            created, conversation_id, chunk_id
+            created, conversation_id, chunk_id, candidates=context_chunks
         )
         for target_id in predecessor_chunks:
-            if target_id not in new_chunk.links.follows:
-                new_chunk.links.follows.append(target_id)
+            if target_id not in follows_set:
+                follows_set.add(target_id)
+                links.follows.append(target_id)
         
         # 3. Find tag-related chunks
         related_chunks = self._find_tag_related(tags, chunk_id)
         for target_id in related_chunks:
             # Avoid duplicate links - if already context_of, skip weak related_to
-            if target_id not in new_chunk.links.context_of:
-                if target_id not in new_chunk.links.related_to:
-                    new_chunk.links.related_to.append(target_id)
-                    # Bidirectional - add to target chunk as well
-                    self._add_related_to_link(target_id, chunk_id)
+            if target_id not in context_set and target_id not in related_set:
+                related_set.add(target_id)
+                links.related_to.append(target_id)
+                # Bidirectional - add to target chunk as well
+                pending_reverse.append((target_id, "related_to"))
+        
+        # Apply reverse links: one read and at most one write per target.
+        # Every target is read before anything is saved, so a batching store
+        # writes the new chunk and its targets together.
+        updated_targets = self._apply_reverse_links(chunk_id, pending_reverse)
         
-        # Save updated chunk
+        # Save updated chunk, then the targets that gained a link
         self._save_chunk(new_chunk)
+        for chunk in updated_targets:
+            self._save_chunk(chunk)
+        
+        # Keep cached tag lookups coherent with the chunk just written
+        if self._tag_cache is not None:
+            for tag in tags or []:
+                cached = self._tag_cache.get(tag)
+                if cached is not None:
+                    cached.add(chunk_id)
         
         logger.info(f"Auto-linked chunk {chunk_id}: "
                    f"context={len(context_chunks)}, "
@@ -102,37 +152,50 @@ class AutoLinker:
         
         return new_chunk
     
-    def _add_reverse_link(self, chunk_id: str, target_id: str, link_type: str):
+    def _apply_reverse_links(self, new_chunk_id: str,
+                             edges: List[Tuple[str, str]]) -> List[Chunk]:
         """
-        Add bidirectional link to existing chunk.
+        Add bidirectional links pointing at new_chunk_id to existing chunks.
+        
+        Edges are grouped by target so each target chunk is loaded once,
+        regardless of how many link types it gains. Nothing is saved here;
+        the targets that changed are returned for the caller to save.
         """
-        chunk = self.chunk_store.get_chunk(chunk_id)
-        if chunk:
-            if link_type == "context_of":
-                if target_id not in chunk.links.context_of:
-                    chunk.links.context_of.append(target_id)
-                    self._save_chunk(chunk)
-            elif link_type == "related_to":
-                if target_id not in chunk.links.related_to:
-                    chunk.links.related_to.append(target_id)
-                    self._save_chunk(chunk)
-    
-    def _add_related_to_link(self, target_id: str, new_chunk_id: str):
-        """Add related_to link from target chunk to new chunk."""
-        chunk = self.chunk_store.get_chunk(target_id)
-        if chunk:
-            if new_chunk_id not in chunk.links.related_to:
-                chunk.links.related_to.append(new_chunk_id)
-                self._save_chunk(chunk)
+        by_target: Dict[str, List[str]] = {}
+        for target_id, link_type in edges:
+            by_target.setdefault(target_id, []).append(link_type)
+        
+        updated: List[Chunk] = []
+        for target_id, link_types in by_target.items():
+            chunk = self.chunk_store.get_chunk(target_id)
+            if not chunk:
+                continue
+            changed = False
+            for link_type in link_types:
+                links = getattr(chunk.links, link_type)
+                if new_chunk_id not in links:
+                    links.append(new_chunk_id)
+                    changed = True
+            if changed:
+                updated.append(chunk)
+        return updated
     
     def _save_chunk(self, chunk: Chunk):
         """Save chunk to storage without updating access tracking."""
-        if hasattr(self.chunk_store, "save_chunk"):
-            self.chunk_store.save_chunk(chunk)
-            return
-
-        chunk_path = self.chunk_store._get_chunk_path(chunk.id)
-        chunk_path.write_text(chunk.to_json(), encoding="utf-8")
+        self._save(chunk)
+    
+    def _save_via_path(self, chunk: Chunk):
+        """Write chunk JSON straight to its file for stores without save_chunk."""
+        data = chunk.to_json().encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        
+        # Skip the rewrite when this linker already wrote identical content
+        if self._last_written.get(chunk.id) != digest:
+            chunk_path = self.chunk_store._get_chunk_path(chunk.id)
+            chunk_path.write_bytes(data)
+            self._last_written[chunk.id] = digest
+            if len(self._last_written) > self.WRITE_CACHE_SIZE:
+                del self._last_written[next(iter(self._last_written))]
     
     def _find_conversation_chunks(self, conversation_id: str,
                                    exclude: str) -> List[str]:
@@ -146,12 +209,26 @@ class AutoLinker:
     
     def _find_temporal_predecessors(self, created: datetime,
                                      conversation_id: str,
-                                     exclude: str) -> List[str]:
+                                     exclude: str,
+                                     candidates: Optional[List[str]] = None) -> List[str]:
         """
         Find chunks within temporal window before this one.
+        
+        When the conversation's chunk IDs are already known (candidates) and
+        the store's metadata index carries their creation times, they are
+        filtered in memory instead of issuing a second list_chunks scan.
         """
         window_start = created - self.temporal_window
         
+        if candidates is not None:
+            created_times = self._indexed_created_times(candidates)
+            if created_times is not None:
+                return [
+                    c for c in candidates
+                    if c != exclude
+                    and window_start <= self._align_tz(created_times[c], created) <= created
+                ]
+        
         # Get chunks from same conversation within time window
         chunks = self.chunk_store.list_chunks(
             conversation_id=conversation_id,
@@ -161,6 +238,30 @@ class AutoLinker:
         
         return [c for c in chunks if c != exclude]
     
+    def _indexed_created_times(self, chunk_ids: List[str]) -> Optional[Dict[str, datetime]]:
+        """Look up creation times in the metadata index; None if any are unavailable."""
+        index = getattr(self.chunk_store, 'metadata_index', None)
+        if index is None:
+            return None
+        
+        times: Dict[str, datetime] = {}
+        for chunk_id in chunk_ids:
+            meta = index.get(chunk_id)
+            if not meta or not meta.get("created"):
+                return None
+            try:
+                times[chunk_id] = _parse_iso(meta["created"])
+            except ValueError:
+                return None
+        return times
+    
+    @staticmethod
+    def _align_tz(value: datetime, reference: datetime) -> datetime:
+        """Make value comparable with reference (naive vs aware)."""
+        if (value.tzinfo is None) == (reference.tzinfo is None):
+            return value
+        return value.replace(tzinfo=reference.tzinfo)
+    
     def _find_tag_related(self, tags: List[str], exclude: str) -> List[str]:
         """
         Find chunks sharing any tag.
@@ -168,17 +269,59 @@ class AutoLinker:
         if not tags:
             return []
         
+        # Check if tag_index exists (it might be mocked or missing in some adapters)
+        tag_index = getattr(self.chunk_store, 'tag_index', None)
+        if not hasattr(tag_index, 'get_list'):
+            return []
+        
         related = set()
         for tag in tags:
-            # Check if tag_index exists (it might be mocked or missing in some adapters)
-            if hasattr(self.chunk_store, 'tag_index') and hasattr(self.chunk_store.tag_index, 'get_list'):
-                chunks = self.chunk_store.tag_index.get_list(tag)
-                related.update(chunks)
+            related.update(self._get_tag_chunks(tag_index, tag))
         
         # Exclude the new chunk itself
         related.discard(exclude)
         
         return list(related)
+    
+    @contextmanager
+    def cached_tags(self):
+        """
+        Cache tag_index lookups until the outermost block exits.
+        
+        Inside the block, chunks linked by this linker are added to the
+        cached sets, but chunks tagged any other way (direct create_chunk or
+        update_chunk calls, other stores or processes) are not seen until
+        the block ends. Outside it every lookup reads the tag index.
+        """
+        if self._tag_cache_depth == 0:
+            self._tag_cache = OrderedDict()
+        self._tag_cache_depth += 1
+        try:
+            yield self
+        finally:
+            self._tag_cache_depth -= 1
+            if self._tag_cache_depth == 0:
+                self._tag_cache = None
+    
+    def _get_tag_chunks(self, tag_index, tag: str) -> Set[str]:
+        """Return chunk IDs for a tag, consulting the LRU cache first."""
+        if self._tag_cache is None:
+            return set(tag_index.get_list(tag))
+        cached = self._tag_cache.get(tag)
+        if cached is not None:
+            self._tag_cache.move_to_end(tag)
+            return cached
+        
+        cached = set(tag_index.get_list(tag))
+        self._tag_cache[tag] = cached
+        if len(self._tag_cache) > self.TAG_CACHE_SIZE:
+            self._tag_cache.popitem(last=False)
+        return cached
+    
+    def clear_tag_cache(self):
+        """Drop cached tag lookups (e.g. after chunks were written elsewhere)."""
+        if self._tag_cache is not None:
+            self._tag_cache.clear()
 
 
 def calculate_link_strength(source: Chunk, target: Chunk,
@@ -191,11 +334,15 @@ def calculate_link_strength(source: Chunk, target: Chunk,
     
     elif link_type == "follows":
         # Time-decayed strength
+        if source is target:
+            return 1.0
         try:
             source_time_str = getattr(source.metadata, 'created', getattr(source.metadata, 'created_at', None))
             target_time_str = getattr(target.metadata, 'created', getattr(target.metadata, 'created_at', None))
-            source_time = datetime.fromisoformat(source_time_str.replace("Z", "+00:00"))
-            target_time = datetime.fromisoformat(target_time_str.replace("Z", "+00:00"))
+            if source_time_str is not None and source_time_str == target_time_str:
+                return 1.0
+            source_time = _parse_iso(source_time_str)
+            target_time = _parse_iso(target_time_str)
             time_diff = (source_time - target_time).total_seconds()
             minutes = abs(time_diff) / 60
             return max(0.3, 1.0 - (minutes / 5))
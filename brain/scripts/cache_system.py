@@ -3,42 +3,167 @@ RLM-MEM - Cache System (D5.1)
 Simple in-memory caching for frequently accessed data.
 """
 
+import heapq
 import time
 import logging
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from threading import Lock
+from threading import Event, Lock, Thread, local
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Single cache entry."""
     value: Any
-    timestamp: float
-    ttl: int  # Time to live in seconds
+    expires_at: float  # Absolute time.monotonic() expiry, computed once at set()
+
+
+def _run_clock_tick(cache_ref, interval: float, stop: Event):
+    """Refresh a cache's cached clock until stopped or garbage collected."""
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        cache._now = time.monotonic()
+        del cache
+
+
+class _ThreadToken:
+    """Weak-referenceable stand-in for a thread's lifetime, kept in its locals."""
+    __slots__ = ("__weakref__",)
+
+
+def _retire_slots(counters_ref, slots: List[int]):
+    """Fold a finished thread's slots into its counters' retired totals."""
+    counters = counters_ref()
+    if counters is not None:
+        counters._retire(slots)
+
+
+class _ThreadCounters:
+    """Named counters bumped without a lock.
+
+    Each thread increments its own slots, so bumps never contend; totals
+    are summed across threads on read. When a thread's locals are released
+    its counts are folded into a retired total and its slots dropped, so
+    only live threads are kept.
+    """
+    
+    def __init__(self, names: Tuple[str, ...]):
+        self._names = names
+        self._index = {name: i for i, name in enumerate(names)}
+        self._local = local()
+        self._all: Dict[int, List[int]] = {}  # id(slots) -> slots, live threads
+        self._retired = [0] * len(names)
+        self._register_lock = Lock()
+    
+    def _slots(self) -> List[int]:
+        try:
+            return self._local.slots
+        except AttributeError:
+            slots = [0] * len(self._names)
+            token = _ThreadToken()
+            with self._register_lock:
+                self._all[id(slots)] = slots
+            weakref.finalize(token, _retire_slots, weakref.ref(self), slots)
+            self._local.slots = slots
+            self._local.token = token
+            return slots
+    
+    def _retire(self, slots: List[int]):
+        with self._register_lock:
+            if self._all.pop(id(slots), None) is not None:
+                for i, count in enumerate(slots):
+                    self._retired[i] += count
+    
+    def bump(self, name: str, amount: int = 1):
+        """Add ``amount`` to counter ``name`` for the calling thread."""
+        self._slots()[self._index[name]] += amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        """Return current totals across all threads."""
+        with self._register_lock:
+            per_thread = list(self._all.values())
+            retired = list(self._retired)
+        return {
+            name: retired[i] + sum(slots[i] for slots in per_thread)
+            for i, name in enumerate(self._names)
+        }
 
 
 class MemoryCache:
-    """Thread-safe in-memory cache with TTL support."""
+    """Thread-safe in-memory cache with TTL support.
+
+    Entries are spread over ``SHARD_COUNT`` sub-dicts, each guarded by its
+    own lock, so concurrent callers only contend when their keys land in
+    the same shard. Each shard is kept in LRU order and evicts its least
+    recently used entry once it holds its share of ``max_entries``.
+    """
     
-    def __init__(self, default_ttl: int = 300):
+    SHARD_COUNT = 16  # Must be a power of two
+    
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        clock_tick: Optional[float] = None,
+        max_entries: Optional[int] = 10000,
+    ):
         """
         Initialize memory cache.
         
         Args:
             default_ttl: Default time-to-live in seconds (5 minutes)
+            clock_tick: If set, get() reads a clock refreshed every
+                ``clock_tick`` seconds by a daemon thread instead of calling
+                time.monotonic(), trading that much TTL precision for a
+                cheaper lookup. set() always reads the clock directly.
+            max_entries: Approximate capacity, split evenly across shards
+                (None for unbounded)
         """
-        self._cache: Dict[str, CacheEntry] = {}
         self._default_ttl = default_ttl
-        self._lock = Lock()
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-        self._lookups = 0
+        self._max_entries = max_entries
+        self._shard_capacity = (
+            -(-max_entries // self.SHARD_COUNT) if max_entries else None
+        )
+        self._now = time.monotonic()
+        self._tick_stop: Optional[Event] = None
+        if clock_tick:
+            self._tick_stop = Event()
+            Thread(
+                target=_run_clock_tick,
+                args=(weakref.ref(self), clock_tick, self._tick_stop),
+                name="memory-cache-clock",
+                daemon=True,
+            ).start()
+        self._shard_mask = self.SHARD_COUNT - 1
+        self._shards: List["OrderedDict[str, CacheEntry]"] = [
+            OrderedDict() for _ in range(self.SHARD_COUNT)
+        ]
+        self._locks = [Lock() for _ in range(self.SHARD_COUNT)]
+        # Per-shard min-heaps of (expires_at, key); entries for overwritten
+        # or deleted keys go stale and are skipped when popped
+        self._expiry_heaps: List[List[Tuple[float, str]]] = [
+            [] for _ in range(self.SHARD_COUNT)
+        ]
+        # Stats are bumped outside the shard locks and summed in stats()
+        self._counters = _ThreadCounters(
+            ("lookups", "hits", "misses", "evictions", "evictions_capacity")
+        )
+    
+    def close(self):
+        """Stop the background clock thread, if one is running."""
+        if self._tick_stop is not None:
+            self._tick_stop.set()
+    
+    def _shard_for(self, key: str) -> int:
+        """Return the shard index owning ``key``."""
+        return hash(key) & self._shard_mask
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -50,25 +175,34 @@ class MemoryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            self._lookups += 1
-            entry = self._cache.get(key)
-            if entry is None:
-                self._misses += 1
-                logger.debug("Memory cache miss for %s", key)
-                return None
-            
-            # Check if expired
-            if time.time() - entry.timestamp > entry.ttl:
-                del self._cache[key]
-                self._misses += 1
-                self._evictions += 1
-                logger.debug("Memory cache evicted expired entry for %s", key)
-                return None
-            
-            self._hits += 1
-            logger.debug("Memory cache hit for %s", key)
-            return entry.value
+        idx = self._shard_for(key)
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            entry = shard.get(key)
+            if entry is not None:
+                # Check if expired
+                now = self._now if self._tick_stop is not None else time.monotonic()
+                expired = now > entry.expires_at
+                if expired:
+                    del shard[key]
+                else:
+                    shard.move_to_end(key)
+        
+        counters = self._counters
+        counters.bump("lookups")
+        if entry is None:
+            counters.bump("misses")
+            logger.debug("Memory cache miss for %s", key)
+            return None
+        if expired:
+            counters.bump("misses")
+            counters.bump("evictions")
+            logger.debug("Memory cache evicted expired entry for %s", key)
+            return None
+        
+        counters.bump("hits")
+        logger.debug("Memory cache hit for %s", key)
+        return entry.value
     
     def set(self, key: str, value: Any, ttl: int = None):
         """
@@ -82,12 +216,26 @@ class MemoryCache:
         if ttl is None:
             ttl = self._default_ttl
         
-        with self._lock:
-            self._cache[key] = CacheEntry(
-                value=value,
-                timestamp=time.time(),
-                ttl=ttl
-            )
+        entry = CacheEntry(value=value, expires_at=time.monotonic() + ttl)
+        idx = self._shard_for(key)
+        evicted = 0
+        with self._locks[idx]:
+            shard = self._shards[idx]
+            heap = self._expiry_heaps[idx]
+            shard[key] = entry
+            shard.move_to_end(key)
+            heapq.heappush(heap, (entry.expires_at, key))
+            capacity = self._shard_capacity
+            if capacity is not None:
+                while len(shard) > capacity:
+                    shard.popitem(last=False)
+                    evicted += 1
+            if len(heap) > 2 * len(shard) + 64:
+                # Too many stale heap entries; rebuild from live ones
+                heap[:] = [(e.expires_at, k) for k, e in shard.items()]
+                heapq.heapify(heap)
+        if evicted:
+            self._counters.bump("evictions_capacity", evicted)
     
     def delete(self, key: str) -> bool:
         """
@@ -99,45 +247,59 @@ class MemoryCache:
         Returns:
             True if key was present and deleted
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        idx = self._shard_for(key)
+        with self._locks[idx]:
+            return self._shards[idx].pop(key, None) is not None
     
     def clear(self):
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
+        for lock, shard, heap in zip(self._locks, self._shards, self._expiry_heaps):
+            with lock:
+                shard.clear()
+                heap.clear()
     
     def cleanup(self):
         """Remove all expired entries."""
-        with self._lock:
-            now = time.time()
-            expired = [
-                key for key, entry in self._cache.items()
-                if now - entry.timestamp > entry.ttl
-            ]
-            for key in expired:
-                del self._cache[key]
-            self._evictions += len(expired)
-            if expired:
-                logger.debug("Memory cache cleanup evicted %d entries", len(expired))
-            return len(expired)
+        removed = 0
+        for idx, shard in enumerate(self._shards):
+            heap = self._expiry_heaps[idx]
+            with self._locks[idx]:
+                now = time.monotonic()
+                evicted = 0
+                # Pop only entries due by now; the head is the earliest expiry
+                while heap and heap[0][0] < now:
+                    expires_at, key = heapq.heappop(heap)
+                    entry = shard.get(key)
+                    if entry is not None and entry.expires_at == expires_at:
+                        del shard[key]
+                        evicted += 1
+                removed += evicted
+        if removed:
+            self._counters.bump("evictions", removed)
+            logger.debug("Memory cache cleanup evicted %d entries", removed)
+        return removed
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            hit_rate = (self._hits / self._lookups) if self._lookups else 0.0
-            return {
-                "size": len(self._cache),
-                "default_ttl": self._default_ttl,
-                "lookups": self._lookups,
-                "hits": self._hits,
-                "misses": self._misses,
-                "evictions": self._evictions,
-                "hit_rate": round(hit_rate, 4)
-            }
+        size = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                size += len(shard)
+        counts = self._counters.snapshot()
+        lookups = counts["lookups"]
+        hits = counts["hits"]
+        hit_rate = (hits / lookups) if lookups else 0.0
+        return {
+            "size": size,
+            "default_ttl": self._default_ttl,
+            "lookups": lookups,
+            "hits": hits,
+            "misses": counts["misses"],
+            "evictions": counts["evictions"],
+            "evictions_capacity": counts["evictions_capacity"],
+            "max_entries": self._max_entries,
+            "hit_rate": round(hit_rate, 4)
+        }
 
 
 class CacheManager:
@@ -155,15 +317,15 @@ class CacheManager:
             default_ttl: Default time-to-live in seconds
         """
         self.memory = MemoryCache(default_ttl)
-        self._lock = Lock()
-        self._metrics: Dict[str, int] = {
-            "get_calls": 0,
-            "memory_hits": 0,
-            "misses": 0,
-            "set_calls": 0,
-            "delete_calls": 0,
-            "clear_calls": 0,
-        }
+        # Lock-free per-thread call counters, summed in telemetry()
+        self._metrics = _ThreadCounters((
+            "get_calls",
+            "memory_hits",
+            "misses",
+            "set_calls",
+            "delete_calls",
+            "clear_calls",
+        ))
     
     def get(self, key: str, use_disk: bool = False) -> Optional[Any]:
         """
@@ -176,17 +338,13 @@ class CacheManager:
         Returns:
             Cached value or None
         """
-        with self._lock:
-            self._metrics["get_calls"] += 1
-
         value = self.memory.get(key)
+        self._metrics.bump("get_calls")
         if value is not None:
-            with self._lock:
-                self._metrics["memory_hits"] += 1
+            self._metrics.bump("memory_hits")
             return value
         
-        with self._lock:
-            self._metrics["misses"] += 1
+        self._metrics.bump("misses")
         return None
     
     def set(self, key: str, value: Any, ttl: int = None, use_disk: bool = False):
@@ -199,26 +357,22 @@ class CacheManager:
             ttl: Time-to-live
             use_disk: Ignored
         """
-        with self._lock:
-            self._metrics["set_calls"] += 1
+        self._metrics.bump("set_calls")
         self.memory.set(key, value, ttl)
     
     def delete(self, key: str) -> bool:
         """Delete from cache."""
-        with self._lock:
-            self._metrics["delete_calls"] += 1
+        self._metrics.bump("delete_calls")
         return self.memory.delete(key)
     
     def clear(self):
         """Clear all caches."""
-        with self._lock:
-            self._metrics["clear_calls"] += 1
+        self._metrics.bump("clear_calls")
         self.memory.clear()
 
     def telemetry(self) -> Dict[str, Any]:
         """Return manager-level telemetry with derived rates."""
-        with self._lock:
-            metrics = dict(self._metrics)
+        metrics = self._metrics.snapshot()
         total_gets = metrics["get_calls"]
         metrics["memory_hit_rate"] = round(
             (metrics["memory_hits"] / total_gets), 4
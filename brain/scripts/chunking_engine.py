@@ -6,8 +6,10 @@ Splits content into bounded semantic chunks (100-800 tokens) with content type d
 """
 
 import re
-from typing import List, Optional
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
 
 # Try to import tiktoken for accurate token counting
 try:
@@ -23,13 +25,32 @@ except ImportError:
     from memory_store import Chunk, ChunkMetadata, ChunkLinks, ChunkType
 
 
+# Paragraph boundaries and horizontal whitespace runs
+_PARA_SPLIT = re.compile(r'\n\n+')
+_WS = re.compile(r'[ \t]+')
+# Sentence boundaries: whitespace after . ? or ! that precedes a capital,
+# quote or parenthesis. A terminator at end of text needs no split point;
+# trailing whitespace is stripped after splitting.
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z"\'\(])')
+
+# Characters _force_split may break after, and how far back it looks first
+_BREAK_CHARS = ' \t\n.,;:!?'
+_BREAK_WINDOW = 128
+
+
+def _rfind_any(text: str, start: int, end: int) -> int:
+    """Return the highest index in text[start:end] holding a break char, or -1."""
+    return max(text.rfind(ch, start, end) for ch in _BREAK_CHARS)
+
+
 @dataclass
 class ChunkResult:
     """Result of chunking a piece of content."""
     content: str
     tokens: int
     type: str
-    tags: List[str] = field(default_factory=list)
+    # Shared by every result of one chunk() call, hence immutable
+    tags: Tuple[str, ...] = ()
 
 
 class ChunkingEngine:
@@ -43,6 +64,39 @@ class ChunkingEngine:
     4. Detect content type (fact, preference, pattern, note, decision)
     """
     
+    # Content-type indicators, one named group per type, scanned in one pass
+    _TYPE_RE = re.compile(
+        r'(?P<decision>\b(?:decided|chose|selected|going with|went with|opted for'
+        r'|settled on|concluded)\b)'
+        r'|(?P<pattern>\b(?:usually|often|tends to|pattern|always|typically|generally'
+        r'|frequently|regularly|every time|most of the time|whenever)\b)'
+        r'|(?P<preference>\b(?:prefer|like|want|rather|dislike|hate|wish|would like'
+        r'|favorite|favour)\b)'
+        r'|(?P<fact>\b(?:(?:is a|are a|works as|located in|is an|are an|was a|were a'
+        r'|works at|works for|lives in|born in|studied at|graduated from)\b'
+        r'|has\s+\d+|there are\s+\d+|there is\s+))',
+        re.IGNORECASE
+    )
+    # Detection priority: decision > pattern > preference > fact
+    _TYPE_PRIORITY = {"decision": 0, "pattern": 1, "preference": 2, "fact": 3}
+    _GROUP_TO_TYPE = {
+        "decision": ChunkType.DECISION.value,
+        "pattern": ChunkType.PATTERN.value,
+        "preference": ChunkType.PREFERENCE.value,
+        "fact": ChunkType.FACT.value,
+    }
+    # Types by priority rank, with note as the no-match fallback
+    _RANKED_TYPES = [
+        ChunkType.DECISION.value,
+        ChunkType.PATTERN.value,
+        ChunkType.PREFERENCE.value,
+        ChunkType.FACT.value,
+        ChunkType.NOTE.value,
+    ]
+    
+    # Worker threads used by tiktoken for batch encoding
+    ENCODE_THREADS = 4
+    
     def __init__(self, min_tokens: int = 100, max_tokens: int = 800):
         """
         Initialize the chunking engine.
@@ -80,7 +134,9 @@ class ChunkingEngine:
             
         if self._encoder is not None:
             try:
-                return len(self._encoder.encode(text))
+                # encode_ordinary, like count_tokens_batch: special-token
+                # text such as <|endoftext|> is counted, not rejected
+                return len(self._encoder.encode_ordinary(text))
             except Exception:
                 pass  # Fall back to approximation
         
@@ -88,6 +144,31 @@ class ChunkingEngine:
         # This is a rough estimate but works for most cases
         return max(1, len(text) // 4)
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Estimate token counts for several texts at once.
+        
+        With tiktoken the whole list is encoded in one encode_ordinary_batch
+        call (parallel, single FFI round trip); otherwise each text uses the
+        same len/4 approximation as count_tokens.
+        
+        Args:
+            texts: Texts to count tokens for
+            
+        Returns:
+            Token counts, in input order
+        """
+        if self._encoder is not None and texts:
+            try:
+                encoded = self._encoder.encode_ordinary_batch(
+                    texts, num_threads=self.ENCODE_THREADS
+                )
+                return [len(ids) for ids in encoded]
+            except Exception:
+                pass  # Fall back to per-text counting
+        
+        return [self.count_tokens(text) for text in texts]
+    
     def detect_content_type(self, content: str) -> str:
         """
         Detect if content is fact, preference, pattern, note, or decision.
@@ -107,55 +188,61 @@ class ChunkingEngine:
         """
         if not content:
             return ChunkType.NOTE.value
-            
-        content_lower = content.lower()
         
-        # Decision indicators (highest priority - explicit actions)
-        decision_patterns = [
-            r'\bdecided\b', r'\bchose\b', r'\bselected\b', 
-            r'\bgoing with\b', r'\bwent with\b', r'\bopted for\b',
-            r'\bsettled on\b', r'\bconcluded\b'
-        ]
-        for pattern in decision_patterns:
-            if re.search(pattern, content_lower):
-                return ChunkType.DECISION.value
-        
-        # Pattern indicators (habits, recurring behaviors) - check BEFORE preference
-        # because phrases like "generally prefer" describe patterns, not preferences
-        pattern_patterns = [
-            r'\busually\b', r'\boften\b', r'\btends to\b', r'\bpattern\b',
-            r'\balways\b', r'\btypically\b', r'\bgenerally\b',
-            r'\bfrequently\b', r'\bregularly\b', r'\bevery time\b',
-            r'\bmost of the time\b', r'\bwhenever\b'
-        ]
-        for pattern in pattern_patterns:
-            if re.search(pattern, content_lower):
-                return ChunkType.PATTERN.value
-        
-        # Preference indicators
-        preference_patterns = [
-            r'\bprefer\b', r'\blike\b', r'\bwant\b', r'\brather\b',
-            r'\bdislike\b', r'\bhate\b', r'\bwish\b', r'\bwould like\b',
-            r'\bfavorite\b', r'\bfavour\b'
-        ]
-        for pattern in preference_patterns:
-            if re.search(pattern, content_lower):
-                return ChunkType.PREFERENCE.value
-        
-        # Fact indicators (statements of truth)
-        fact_patterns = [
-            r'\bis a\b', r'\bare a\b', r'\bworks as\b', r'\blocated in\b',
-            r'\bis an\b', r'\bare an\b', r'\bwas a\b', r'\bwere a\b',
-            r'\bworks at\b', r'\bworks for\b', r'\blives in\b',
-            r'\bborn in\b', r'\bstudied at\b', r'\bgraduated from\b',
-            r'\bhas\s+\d+', r'\bthere are\s+\d+', r'\bthere is\s+'
-        ]
-        for pattern in fact_patterns:
-            if re.search(pattern, content_lower):
-                return ChunkType.FACT.value
+        # One scan finds indicators of every type; the leftmost match is not
+        # necessarily the winner, so keep the highest-priority group seen.
+        # Pattern is checked BEFORE preference because phrases like
+        # "generally prefer" describe patterns, not preferences.
+        priority = self._TYPE_PRIORITY
+        best = None
+        for match in self._TYPE_RE.finditer(content):
+            group = match.lastgroup
+            if best is None or priority[group] < priority[best]:
+                best = group
+                if priority[group] == 0:
+                    # Decision indicators (highest priority - explicit actions)
+                    break
         
         # Default: note
-        return ChunkType.NOTE.value
+        if best is None:
+            return ChunkType.NOTE.value
+        return self._GROUP_TO_TYPE[best]
+    
+    def detect_content_types(self, contents: List[str]) -> List[str]:
+        """
+        Detect content types for several texts with a single regex scan.
+        
+        The texts are joined with a NUL separator, which no indicator can
+        match across (indicators contain only letters, digits and spaces),
+        and each match is mapped back to its text by offset. Results are
+        identical to calling detect_content_type on each text.
+        
+        Args:
+            contents: Texts to classify
+            
+        Returns:
+            Content types, in input order
+        """
+        if len(contents) < 2:
+            return [self.detect_content_type(c) for c in contents]
+        
+        starts = []
+        offset = 0
+        for text in contents:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        priority = self._TYPE_PRIORITY
+        no_match = len(priority)
+        ranks = [no_match] * len(contents)
+        for match in self._TYPE_RE.finditer("\x00".join(contents)):
+            i = bisect_right(starts, match.start()) - 1
+            rank = priority[match.lastgroup]
+            if rank < ranks[i]:
+                ranks[i] = rank
+        
+        ranked_types = self._RANKED_TYPES
+        return [ranked_types[rank] for rank in ranks]
     
     def _split_into_paragraphs(self, content: str) -> List[str]:
         """
@@ -164,7 +251,7 @@ class ChunkingEngine:
         Handles edge cases like multiple consecutive newlines and whitespace.
         """
         # Split on double newlines
-        raw_paragraphs = re.split(r'\n\n+', content)
+        raw_paragraphs = _PARA_SPLIT.split(content)
         
         # Clean up each paragraph
         paragraphs = []
@@ -172,8 +259,10 @@ class ChunkingEngine:
             # Strip whitespace and normalize internal whitespace
             cleaned = p.strip()
             if cleaned:
-                # Normalize internal newlines (preserve single newlines within paragraphs)
-                cleaned = re.sub(r'[ \t]+', ' ', cleaned)
+                # Normalize internal newlines (preserve single newlines within paragraphs).
+                # Single spaces are already normalized, so skip the sub without runs/tabs.
+                if '  ' in cleaned or '\t' in cleaned:
+                    cleaned = _WS.sub(' ', cleaned)
                 paragraphs.append(cleaned)
         
         return paragraphs
@@ -184,12 +273,12 @@ class ChunkingEngine:
         
         Handles abbreviations and edge cases reasonably well.
         """
-        # Pattern for sentence boundaries
-        # Matches . ? or ! followed by space or end of string
-        # Handles quotes and parentheses
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z"\'\(])|(?<=[.!?])$'
+        # No terminator means a single sentence; skip the regex entirely
+        if '.' not in text and '?' not in text and '!' not in text:
+            cleaned = text.strip()
+            return [cleaned] if cleaned else []
         
-        sentences = re.split(sentence_pattern, text)
+        sentences = _SENTENCE_SPLIT.split(text)
         
         # Clean up
         result = []
@@ -213,49 +302,44 @@ class ChunkingEngine:
             # Cannot split by sentences, force split by token count
             return self._force_split(content)
         
+        sentence_tokens = self.count_tokens_batch(sentences)
+        max_tokens = self.max_tokens
         chunks = []
-        current_chunk = []
-        current_tokens = 0
         
-        for sentence in sentences:
-            sentence_tokens = self.count_tokens(sentence)
-            
+        # Greedy packing via prefix sums: from sentence `pos`, bisect finds
+        # the furthest end whose running total stays within max_tokens, so
+        # the loop runs once per chunk rather than once per sentence.
+        prefix = [0, *accumulate(sentence_tokens)]
+        n = len(sentences)
+        # Positions of sentences too large to share a chunk, plus a sentinel
+        oversized = [i for i, t in enumerate(sentence_tokens) if t > max_tokens]
+        oversized.append(n)
+        pos = 0
+        while pos < n:
             # If a single sentence exceeds max_tokens, force split it
-            if sentence_tokens > self.max_tokens:
-                # First, flush current chunk if any
-                if current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                    current_chunk = []
-                    current_tokens = 0
-                
-                # Force split this long sentence
-                chunks.extend(self._force_split(sentence))
+            if sentence_tokens[pos] > max_tokens:
+                chunks.extend(self._force_split(sentences[pos], sentence_tokens[pos]))
+                pos += 1
                 continue
             
-            # Check if adding this sentence would exceed max_tokens
-            if current_tokens + sentence_tokens > self.max_tokens and current_chunk:
-                # Flush current chunk
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [sentence]
-                current_tokens = sentence_tokens
-            else:
-                # Add to current chunk
-                current_chunk.append(sentence)
-                current_tokens += sentence_tokens
-        
-        # Don't forget the last chunk
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+            end = bisect_right(prefix, prefix[pos] + max_tokens, pos + 1) - 1
+            # Stop before the next oversized sentence; it is split on its own
+            end = min(end, oversized[bisect_right(oversized, pos)])
+            chunks.append(' '.join(sentences[pos:end]))
+            pos = end
         
         return chunks
     
-    def _force_split(self, content: str) -> List[str]:
+    def _force_split(self, content: str,
+                     total_tokens: Optional[int] = None) -> List[str]:
         """
         Force split content into chunks of approximately max_tokens.
         
-        Used when sentence splitting isn't sufficient.
+        Used when sentence splitting isn't sufficient. Callers that already
+        know the token count of `content` can pass it as total_tokens.
         """
-        total_tokens = self.count_tokens(content)
+        if total_tokens is None:
+            total_tokens = self.count_tokens(content)
         
         if total_tokens <= self.max_tokens:
             return [content]
@@ -281,11 +365,15 @@ class ChunkingEngine:
             search_end = min(end + 50, len(content))  # Look ahead 50 chars
             boundary = end
             
-            # Find the last space or punctuation before search_end
-            for i in range(search_end - 1, start, -1):
-                if content[i] in ' \t\n.,;:!?':
-                    boundary = i + 1
-                    break
+            # Find the last space or punctuation before search_end. The
+            # break character is almost always near the end, so search a
+            # short tail window first and only then the rest of the chunk.
+            tail = max(start + 1, search_end - _BREAK_WINDOW)
+            last = _rfind_any(content, tail, search_end)
+            if last < 0 and tail > start + 1:
+                last = _rfind_any(content, start + 1, tail)
+            if last >= 0:
+                boundary = last + 1
             
             chunk = content[start:boundary].strip()
             if chunk:
@@ -309,7 +397,7 @@ class ChunkingEngine:
         Args:
             content: Text content to chunk
             conversation_id: Source conversation ID
-            tags: Optional list of tags to apply to all chunks
+            tags: Optional list (or tuple) of tags to apply to all chunks
             
         Returns:
             List of ChunkResult objects ready for storage
@@ -317,16 +405,34 @@ class ChunkingEngine:
         if not content or not content.strip():
             return []
         
-        tags = tags or []
+        tags = tuple(tags) if tags else ()
+        
+        # Per-call memo of token counts and content types; the same strings
+        # are classified repeatedly while merging and building results.
+        token_cache: Dict[str, int] = {}
+        type_cache: Dict[str, str] = {}
+        
+        def tokens_of(text: str) -> int:
+            count = token_cache.get(text)
+            if count is None:
+                count = token_cache[text] = self.count_tokens(text)
+            return count
+        
+        def type_of(text: str) -> str:
+            content_type = type_cache.get(text)
+            if content_type is None:
+                content_type = type_cache[text] = self.detect_content_type(text)
+            return content_type
         
         # Step 1: Split into paragraphs
         paragraphs = self._split_into_paragraphs(content)
+        token_cache.update(zip(paragraphs, self.count_tokens_batch(paragraphs)))
         
         # Step 2: Process paragraphs - handle size bounds
         raw_chunks = []
         
         for paragraph in paragraphs:
-            tokens = self.count_tokens(paragraph)
+            tokens = tokens_of(paragraph)
             
             if tokens > self.max_tokens:
                 # Split large paragraph at sentence boundaries
@@ -336,25 +442,31 @@ class ChunkingEngine:
                 raw_chunks.append(paragraph)
         
         # Step 3: Merge small chunks
-        merged_chunks = self._merge_small_chunks(raw_chunks)
+        self._seed_types(type_cache, raw_chunks)
+        merged_chunks = self._merge_small_chunks(raw_chunks, tokens_of, type_of)
         
-        # Step 4: Create ChunkResult objects with type detection
+        # Step 4: Create ChunkResult objects (types were detected while merging)
         results = []
-        for chunk_content in merged_chunks:
-            chunk_tokens = self.count_tokens(chunk_content)
-            content_type = self.detect_content_type(chunk_content)
-            
+        for chunk_content, chunk_tokens, content_type in merged_chunks:
             result = ChunkResult(
                 content=chunk_content,
                 tokens=chunk_tokens,
                 type=content_type,
-                tags=tags.copy()
+                tags=tags
             )
             results.append(result)
         
         return results
     
-    def _merge_small_chunks(self, chunks: List[str]) -> List[str]:
+    def _seed_types(self, type_cache: Dict[str, str], texts: List[str]):
+        """Classify the uncached texts in one batched scan into type_cache."""
+        missing = list(dict.fromkeys(t for t in texts if t not in type_cache))
+        type_cache.update(zip(missing, self.detect_content_types(missing)))
+    
+    def _merge_small_chunks(self, chunks: List[str],
+                            tokens_of: Optional[Callable[[str], int]] = None,
+                            type_of: Optional[Callable[[str], str]] = None
+                            ) -> List[Tuple[str, int, str]]:
         """
         Merge chunks that are below min_tokens with adjacent chunks.
         
@@ -363,78 +475,95 @@ class ChunkingEngine:
         - If merging would exceed max_tokens, keep as-is (it's the best we can do)
         - Don't merge chunks with different content types (semantic boundaries)
         - Handle the last chunk specially - merge with previous if possible
+        
+        tokens_of/type_of default to count_tokens/detect_content_type; chunk()
+        passes memoized versions. Each chunk is measured and classified once;
+        merged chunks carry an additive token estimate (plus one for the
+        separator) and the shared type while merging.
+        
+        Returns (content, tokens, type) for every output chunk. Unmerged
+        chunks reuse their measurements; merged ones are measured once more,
+        in one batch, so the reported counts and types are exact.
         """
         if not chunks:
             return []
         
+        tokens_of = tokens_of or self.count_tokens
+        type_of = type_of or self.detect_content_type
+        
         if len(chunks) == 1:
-            return chunks
+            return [(chunks[0], tokens_of(chunks[0]), type_of(chunks[0]))]
+        # (content, tokens, type) for every input chunk
+        entries = [(c, tokens_of(c), type_of(c)) for c in chunks]
         
+        # Output chunks as ([paragraphs], tokens, type); paragraphs are
+        # joined once at the end so chains of merges copy each byte once
         result = []
-        i = 0
+        pending = None  # Merged entry carried over to the next position
+        last = len(entries) - 1
         
-        while i < len(chunks):
-            current = chunks[i]
-            current_tokens = self.count_tokens(current)
-            current_type = self.detect_content_type(current)
+        for i in range(len(entries)):
+            if pending is not None:
+                current_parts, current_tokens, current_type = pending
+                pending = None
+            else:
+                current, current_tokens, current_type = entries[i]
+                current_parts = [current]
             
             # If current chunk is large enough, add it
             if current_tokens >= self.min_tokens:
-                result.append(current)
-                i += 1
+                result.append((current_parts, current_tokens, current_type))
                 continue
             
             # Current chunk is too small - try to merge with next
-            if i + 1 < len(chunks):
-                next_chunk = chunks[i + 1]
-                next_tokens = self.count_tokens(next_chunk)
-                next_type = self.detect_content_type(next_chunk)
+            if i < last:
+                next_chunk, next_tokens, next_type = entries[i + 1]
                 
                 # Don't merge if content types differ (preserve semantic boundaries)
-                if current_type != next_type:
-                    result.append(current)  # Add as-is even if small
-                    i += 1
-                    continue
-                
-                # Check if merging would exceed max_tokens
+                # or if merging would exceed max_tokens
                 combined_tokens = current_tokens + next_tokens
-                
-                if combined_tokens <= self.max_tokens:
-                    # Merge current with next
-                    merged = current + "\n\n" + next_chunk
-                    # Replace next chunk with merged version
-                    chunks[i + 1] = merged
-                    i += 1
-                    continue
-                else:
-                    # Can't merge without exceeding max
-                    # Add current as-is (it's below min but we can't help it)
-                    result.append(current)
-                    i += 1
+                if current_type != next_type or combined_tokens > self.max_tokens:
+                    # Add as-is even if small
+                    result.append((current_parts, current_tokens, current_type))
                     continue
-            else:
+                
+                # Merge current with next; the merged chunk takes next's place
+                current_parts.append(next_chunk)
+                pending = (current_parts, combined_tokens + 1, current_type)
+            elif result:
                 # This is the last chunk and it's too small
                 # Try to merge with previous result if possible
-                if result:
-                    prev = result[-1]
-                    prev_tokens = self.count_tokens(prev)
-                    prev_type = self.detect_content_type(prev)
-                    combined_tokens = prev_tokens + current_tokens
-                    
-                    # Only merge if types match
-                    if combined_tokens <= self.max_tokens and prev_type == current_type:
-                        # Merge with previous
-                        result[-1] = prev + "\n\n" + current
-                    else:
-                        # Can't merge, add as-is
-                        result.append(current)
-                else:
-                    # No previous chunk, add as-is
-                    result.append(current)
+                prev_parts, prev_tokens, prev_type = result[-1]
+                combined_tokens = prev_tokens + current_tokens
                 
-                i += 1
+                # Only merge if types match
+                if combined_tokens <= self.max_tokens and prev_type == current_type:
+                    # Merge with previous
+                    prev_parts.extend(current_parts)
+                    result[-1] = (prev_parts, combined_tokens + 1, prev_type)
+                else:
+                    # Can't merge, add as-is
+                    result.append((current_parts, current_tokens, current_type))
+            else:
+                # No previous chunk, add as-is
+                result.append((current_parts, current_tokens, current_type))
         
-        return result
+        merged = [
+            (parts[0], tokens, content_type) if len(parts) == 1
+            else ("\n\n".join(parts), None, None)
+            for parts, tokens, content_type in result
+        ]
+        # A merged chunk's estimate is only used for the size guard; measure
+        # the joined text (any indicator spanning the join counts too)
+        joined = [content for content, tokens, _ in merged if tokens is None]
+        if joined:
+            exact = iter(zip(self.count_tokens_batch(joined),
+                             self.detect_content_types(joined)))
+            merged = [
+                entry if entry[1] is not None else (entry[0], *next(exact))
+                for entry in merged
+            ]
+        return merged
 
 
 def chunk_and_store(content: str, conversation_id: str, 
@@ -456,6 +585,8 @@ def chunk_and_store(content: str, conversation_id: str,
     """
     engine = ChunkingEngine(min_tokens=min_tokens, max_tokens=max_tokens)
     chunk_results = engine.chunk(content, conversation_id, tags)
+    # Stores expect a list; convert the shared tag tuple once
+    tag_list = list(chunk_results[0].tags) if chunk_results else []
     
     created_chunks = []
     for result in chunk_results:
@@ -464,7 +595,7 @@ def chunk_and_store(content: str, conversation_id: str,
             chunk_type=result.type,
             conversation_id=conversation_id,
             tokens=result.tokens,
-            tags=result.tags
+            tags=tag_list
         )
         created_chunks.append(chunk)
     
@@ -7,15 +7,28 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import json
+import time
+import zlib
 
 from .layered_memory_store import LayeredMemoryStore
 from .memory_policy import MemoryPolicy
 
+
+def _utc_now_iso() -> str:
+    """Current UTC time as 'YYYY-MM-DDTHH:MM:SS.ffffffZ', formatted without datetime."""
+    secs, rem = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(secs)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{rem // 1000:06d}Z"
+    )
+
+
 # Mock classes to match ChunkStore return types if needed
 # But RememberOperation mostly uses the returned chunk object for .id and .tokens
 # We can return a SimpleNamespace or a dict wrapper.
 
-@dataclass
+@dataclass(slots=True)
 class ChunkLinks:
     context_of: List[str] = field(default_factory=list)
     follows: List[str] = field(default_factory=list)
@@ -23,7 +36,7 @@ class ChunkLinks:
     contradicts: List[str] = field(default_factory=list)
     supports: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetadata:
     created: str
     updated: str
@@ -35,7 +48,7 @@ class ChunkMetadata:
     source: str
     expires_at: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     id: str
     content: str
@@ -96,9 +109,12 @@ class LayeredChunkStoreAdapter:
         Create a chunk in the layered store.
         Maps existing ChunkStore.create_chunk arguments to append_entry record.
         """
-        now = datetime.utcnow().isoformat() + "Z"
+        now = _utc_now_iso()
+        # CRC32 of the content: same id for the same content on every run,
+        # unlike the per-process salted hash()
+        content_crc = zlib.crc32(content.encode("utf-8"))
         record = {
-            "id": f"chunk-{datetime.utcnow().strftime('%Y-%m-%d')}-{hash(content) & 0xffffffff:08x}", # Simple ID gen
+            "id": f"chunk-{now[:10]}-{content_crc:08x}",
             "created_at": now,
             "entry_type": chunk_type,
             "content": content,
@@ -132,6 +148,10 @@ class LayeredChunkStoreAdapter:
         # Return Chunk object for compatibility
         return self._record_to_chunk(record)
 
+    def batched(self):
+        """Group the appends made in a block into one write (see LayeredMemoryStore.batched)."""
+        return self.store.batched()
+
     def save_chunk(self, chunk: Chunk) -> None:
         """
         Save an updated chunk to the store.
@@ -156,25 +176,37 @@ class LayeredChunkStoreAdapter:
 
     def get_chunk(self, chunk_id: str) -> Optional[Chunk]:
         """Get the latest version of a chunk (First found in Most-Relevant-First list)."""
-        records = self.store.get_all_records()
-        for rec in records:
-            if rec.get("id") == chunk_id:
-                return self._record_to_chunk(rec)
-        return None
+        record = self.store.get_record_by_id(chunk_id)
+        if record is None:
+            return None
+        return self._record_to_chunk(record)
 
     def list_chunks(self, conversation_id: str = None, tags: List[str] = None, 
                     created_after: datetime = None, created_before: datetime = None) -> List[str]:
-        records = self.store.get_all_records()
-        
-        # Deduplicate: keep only the first (most relevant/newest) version of each ID
-        latest_records = {}
-        for rec in records:
-            rid = rec.get("id")
-            if rid and rid not in latest_records:
-                latest_records[rid] = rec
+        # Time bounds still to check per record (no created_at index used)
+        time_filter = bool(created_after or created_before)
+        if time_filter and hasattr(self.store, "get_records_in_time_range"):
+            # Time-bounded: the store's created_at index yields only in-range
+            # records, already resolved to their newest version
+            latest_records = self.store.get_records_in_time_range(
+                created_after, created_before
+            )
+            time_filter = False
+        elif (tags or conversation_id) and hasattr(self.store, "get_records_matching"):
+            # Tag/conversation-bounded: intersect the store's postings rather
+            # than checking every record
+            latest_records = self.store.get_records_matching(tags, conversation_id)
+        else:
+            # Deduplicate: keep only the first (most relevant/newest) version of each ID
+            seen = {}
+            for rec in self.store.iter_all_records():
+                rid = rec.get("id")
+                if rid:
+                    seen.setdefault(rid, rec)
+            latest_records = seen.values()
         
         matches = []
-        for rec in latest_records.values():
+        for rec in latest_records:
             if conversation_id and rec.get("conversation_id") != conversation_id:
                 continue
             if tags:
@@ -183,7 +215,7 @@ class LayeredChunkStoreAdapter:
                     continue
             
             # Temporal filtering
-            if created_after or created_before:
+            if time_filter:
                 try:
                     created_str = rec.get("created_at", "")
                     if not created_str:
@@ -206,9 +238,8 @@ class LayeredChunkStoreAdapter:
         Return statistics about the store.
         Adapts LayeredMemoryStore which doesn't have native stats yet.
         """
-        records = self.store.get_all_records()
         return {
-            "total_chunks": len(records),
+            "total_chunks": sum(1 for _ in self.store.iter_all_records()),
             "layers": self.store.policy.read_layers
         }
 
@@ -217,13 +248,10 @@ class LayeredChunkStoreAdapter:
         Return the path to the chunk file.
         REQUIRED by AutoLinker._save_chunk.
         """
-        # Search all records to find the source path of the chunk
-        # This is inefficient (O(N)) but necessary for compatibility without an index.
-        # Ideally, we should have an ID->Path index.
-        records = self.store.get_all_records()
-        for rec in records:
-            if rec.get("id") == chunk_id:
-                return Path(rec.get("source_path"))
+        # Look up the source path of the chunk via the store's id index
+        record = self.store.get_record_by_id(chunk_id)
+        if record is not None:
+            return Path(record["source_path"])
         
         # If not found, return a dummy path or raise. 
         # AutoLinker tries to write to it. If we return a non-existent path in a valid dir,
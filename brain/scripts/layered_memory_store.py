@@ -2,17 +2,166 @@
 Layered memory store with append-only JSONL writes and file locking.
 """
 
-import json
+import atexit
+import logging
+import mmap
 import os
+import threading
 import time
+from bisect import bisect_left, bisect_right, insort
 from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
 
 from .memory_layers import build_retrieval_plan, resolve_all_layer_paths
 from .memory_policy import MemoryPolicy
 from .memory_safety import apply_redaction_rules, should_allow_layer_write
-from .memory_schema import load_jsonl_records, validate_record
+from .memory_schema import (
+    dumps_json_line,
+    load_jsonl_records_reverse,
+    loads_json_line,
+    validate_record,
+)
+
+logger = logging.getLogger(__name__)
+
+# A ("tag", tag) or ("conversation", conversation_id) posting key
+Term = Tuple[str, str]
+# (offset, length, created_key, terms) of the newest valid line for an id
+IndexEntry = Tuple[int, int, Optional[datetime], Tuple[Term, ...]]
+# (st_dev, st_ino, indexed_end, st_mtime_ns, tail_start, tail_bytes) of an
+# indexed layer file
+IndexState = Tuple[int, int, int, Optional[int], int, bytes]
+# (id, encoded line, created_key, terms) of an append awaiting write
+PendingEntry = Tuple[str, bytes, Optional[datetime], Tuple[Term, ...]]
+
+# Layer files at least this big are also prefetched asynchronously on a full
+# sequential read, overlapping disk I/O with parsing
+_PREFETCH_MIN_BYTES = 1 << 20
+
+# Bytes just before a cached read's end that must be unchanged for a grown
+# file to count as appended to rather than rewritten
+_TAIL_CHECK_BYTES = 4096
+
+
+def advise_sequential(handle, offset: int = 0) -> None:
+    """
+    Tell the kernel a file will be read front to back from `offset`.
+
+    Enlarges readahead (POSIX_FADV_SEQUENTIAL) and, for large remainders,
+    starts fetching the rest right away (POSIX_FADV_WILLNEED). A no-op where
+    posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = handle.fileno()
+    try:
+        os.posix_fadvise(fd, offset, 0, os.POSIX_FADV_SEQUENTIAL)
+        if os.fstat(fd).st_size - offset >= _PREFETCH_MIN_BYTES:
+            os.posix_fadvise(fd, offset, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Advisory only
+
+
+def _read_tail(path: Path, end: int) -> Tuple[int, bytes]:
+    """Return (start, bytes) of the up to _TAIL_CHECK_BYTES ending at `end`."""
+    start = max(0, end - _TAIL_CHECK_BYTES)
+    with path.open("rb") as handle:
+        handle.seek(start)
+        return start, handle.read(end - start)
+
+
+def _tail_unchanged(path: Path, start: int, tail: bytes) -> bool:
+    """
+    Whether the file still holds `tail` at `start`.
+
+    Appends leave those bytes alone; a rewrite of the file (deleting or
+    compacting lines) shifts or replaces them, so the cached prefix cannot
+    be extended. In-place edits further back than the window go unseen.
+    """
+    with path.open("rb") as handle:
+        handle.seek(start)
+        return handle.read(len(tail)) == tail
+
+
+# First retry delay when a lock is held; doubles up to lock_poll_seconds
+_LOCK_BACKOFF_START = 0.0001
+
+
+def _try_os_lock(fd: int) -> bool:
+    """Take an exclusive OS lock on fd without blocking; False if held."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _release_os_lock(fd: int) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+# Stores holding buffered appends, flushed at exit. A store is only held
+# here while it has unwritten entries, so one that has flushed can be
+# collected, but buffered appends are never dropped with their store.
+_BUFFERED_STORES: "Set[LayeredMemoryStore]" = set()
+
+
+@atexit.register
+def _flush_buffered_stores() -> None:
+    for store in list(_BUFFERED_STORES):
+        try:
+            store.flush()
+        except (OSError, TimeoutError) as e:
+            logger.warning(f"Could not flush buffered appends for agent {store.agent_id}: {e}")
+
+
+def _created_key(record: Dict) -> Optional[datetime]:
+    """
+    Sort key for a record's created_at: its wall-clock time, ignoring zone.
+
+    Matches how time-range filters compare records: the bound takes the
+    record's tzinfo rather than being converted into it. Returns None if the
+    timestamp is missing or unparseable.
+    """
+    try:
+        created = datetime.fromisoformat(record["created_at"].replace("Z", "+00:00"))
+    except (KeyError, ValueError, AttributeError, TypeError):
+        return None
+    return created.replace(tzinfo=None)
+
+
+def _record_terms(record: Dict) -> Tuple[Term, ...]:
+    """Posting keys of a record's string tags and conversation_id."""
+    tags = record.get("tags")
+    terms = []
+    if isinstance(tags, list):
+        terms.extend(("tag", tag) for tag in tags if isinstance(tag, str))
+    conversation_id = record.get("conversation_id")
+    if isinstance(conversation_id, str) and conversation_id:
+        terms.append(("conversation", conversation_id))
+    return tuple(terms)
 
 
 class LayeredMemoryStore:
@@ -22,6 +171,8 @@ class LayeredMemoryStore:
         agent_id: str,
         lock_timeout_seconds: float = 60.0,
         lock_poll_seconds: float = 0.005,
+        batch_size: int = 1,
+        batch_interval_ms: float = 0.0,
     ):
         if not agent_id:
             raise ValueError("agent_id is required.")
@@ -30,10 +181,92 @@ class LayeredMemoryStore:
         self._paths = resolve_all_layer_paths(policy=policy, agent_id=agent_id)
         self.lock_timeout_seconds = lock_timeout_seconds
         self.lock_poll_seconds = lock_poll_seconds
+        # Per-layer {id: (byte_offset, length, created_key, terms)} of the newest
+        # valid line for each id, plus (st_dev, st_ino, indexed_end,
+        # st_mtime_ns, tail_start, tail_bytes) of the file it covers (mtime is
+        # None after our own appends). Built lazily on first lookup and
+        # extended as layer files grow.
+        self._id_index: Dict[str, Dict[str, IndexEntry]] = {}
+        self._index_state: Dict[str, IndexState] = {}
+        # Sorted (created_key, layer_rank, -offset, id, layer) for the record
+        # each id resolves to, tagged with the layer states it was built from
+        self._time_index: List[Tuple[datetime, int, int, str, str]] = []
+        self._time_index_key: Optional[Tuple] = None
+        # Term -> ids whose resolved record carries it, same staleness key
+        self._term_index: Dict[Term, set] = {}
+        self._term_index_key: Optional[Tuple] = None
+        # Per-layer validated records in file order, keyed by the
+        # (st_dev, st_ino, size, st_mtime_ns) they were read at, plus the
+        # (start, bytes) tail window ending at that size
+        self._records_cache: Dict[
+            str, Tuple[Tuple[int, int, int, int], List[Dict], Tuple[int, bytes]]
+        ] = {}
+        self._index_lock = threading.Lock()
+        # Group commit: with batch_size > 1, appends are buffered per layer as
+        # PendingEntry tuples and written with a single fsync once
+        # batch_size records are pending or batch_interval_ms has elapsed
+        self.batch_size = max(1, int(batch_size))
+        self.batch_interval_ms = batch_interval_ms
+        self._pending: Dict[str, List[PendingEntry]] = {}
+        self._pending_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # Depth of batched() blocks entered by the current thread
+        self._batch_local = threading.local()
 
     @contextmanager
     def _file_lock(self, target_file: Path):
         lock_path = Path(str(target_file) + ".lock")
+        if fcntl is None and msvcrt is None:
+            with self._exclusive_create_lock(lock_path, target_file):
+                yield
+            return
+
+        fd = self._acquire_os_lock(lock_path, target_file)
+        try:
+            yield
+        finally:
+            # Unlink while still holding the lock: anyone already waiting on
+            # this inode sees it is stale once they get it and starts over
+            try:
+                lock_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            _release_os_lock(fd)
+
+    def _acquire_os_lock(self, lock_path: Path, target_file: Path) -> int:
+        """
+        Hold an flock/msvcrt lock on lock_path and return its fd.
+
+        Uncontended this is an open and one syscall. Under contention the
+        non-blocking attempt is retried with exponential backoff so
+        lock_timeout_seconds can still be honoured.
+        """
+        start = time.monotonic()
+        delay = _LOCK_BACKOFF_START
+        fd = None
+        while True:
+            if fd is None:
+                fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
+            if _try_os_lock(fd):
+                try:
+                    current = os.stat(lock_path)
+                except FileNotFoundError:
+                    current = None
+                if current is not None and os.path.samestat(os.fstat(fd), current):
+                    return fd
+                # Released and unlinked by the previous holder; lock the new file
+                _release_os_lock(fd)
+                fd = None
+                continue
+            if time.monotonic() - start >= self.lock_timeout_seconds:
+                os.close(fd)
+                raise TimeoutError(f"Timed out acquiring lock for {target_file}")
+            time.sleep(delay)
+            delay = min(delay * 2, self.lock_poll_seconds)
+
+    @contextmanager
+    def _exclusive_create_lock(self, lock_path: Path, target_file: Path):
+        """Fallback lock for platforms without flock or msvcrt."""
         start = time.time()
 
         while True:
@@ -86,44 +319,578 @@ class LayeredMemoryStore:
         return validated
 
     def append_entry(self, layer: str, record: Dict) -> str:
+        """
+        Append a record to a layer and return its id.
+
+        With batch_size > 1, or inside a batched() block, the record is only
+        buffered: it is not durable until a flush() (explicit, triggered by a
+        later append or read, or on leaving the block) returns.
+        """
+        entry = self._pending_entry(layer, record)
+        record_id = entry[0]
+        deferred = getattr(self._batch_local, "depth", 0) > 0
+
+        if deferred or self.batch_size > 1:
+            with self._pending_lock:
+                pending = self._pending.setdefault(layer, [])
+                pending.append(entry)
+                _BUFFERED_STORES.add(self)
+                elapsed_ms = (time.monotonic() - self._last_flush) * 1000.0
+                if not deferred and (len(pending) >= self.batch_size or (
+                    self.batch_interval_ms > 0 and elapsed_ms >= self.batch_interval_ms
+                )):
+                    try:
+                        self._flush_locked()
+                    except BaseException:
+                        # This call fails, so don't leave its record to be
+                        # written by a later flush; earlier appends stay queued
+                        if pending and pending[-1] is entry and self._pending.get(layer) is pending:
+                            pending.pop()
+                        raise
+            return record_id
+
+        self._write_entries(layer, [entry])
+        return record_id
+
+    def append_entries(self, layer: str, records: List[Dict]) -> List[str]:
+        """
+        Append records to a layer with one write and fsync, whatever the
+        batch_size, and return their ids.
+
+        Every record is validated before anything is written, so a ValueError
+        means none were appended; once this returns, all of them are durable.
+        Appends still buffered by group commit are written first.
+        """
+        entries = [self._pending_entry(layer, record) for record in records]
+        with self._pending_lock:
+            self._flush_locked()
+            if entries:
+                self._write_entries(layer, entries)
+        return [entry[0] for entry in entries]
+
+    @contextmanager
+    def batched(self):
+        """
+        Buffer this thread's appends until the outermost block exits, then
+        flush them with one fsync per layer.
+
+        Reads inside the block still flush first, so appends made between
+        two reads share a single write. If the final flush fails, the
+        entries stay buffered (as with flush()) and the error is raised.
+        """
+        local = self._batch_local
+        local.depth = getattr(local, "depth", 0) + 1
+        try:
+            yield self
+        finally:
+            local.depth -= 1
+            if local.depth == 0 and self._pending:
+                self.flush()
+
+    def _pending_entry(self, layer: str, record: Dict) -> PendingEntry:
         if layer not in self._paths:
             raise ValueError(f"Unknown layer: {layer}")
-        target = self._paths[layer]
-        target.parent.mkdir(parents=True, exist_ok=True)
+        self._paths[layer].parent.mkdir(parents=True, exist_ok=True)
 
         validated = self._prepare_record(layer=layer, record=record)
-        payload = json.dumps(validated, ensure_ascii=False) + "\n"
+        return (
+            str(validated["id"]),
+            dumps_json_line(validated),
+            _created_key(validated),
+            _record_terms(validated),
+        )
+
+    def flush(self) -> None:
+        """
+        Write out appends buffered by group commit, one fsync per layer.
+
+        If a layer's write fails, its entries (and those of layers not yet
+        written) stay buffered for the next flush and the error is raised.
+        """
+        with self._pending_lock:
+            self._flush_locked()
 
+    def _flush_locked(self) -> None:
+        # Caller holds _pending_lock, so batches reach disk in append order.
+        # Entries leave _pending only once their layer's write has succeeded.
+        for layer in list(self._pending):
+            entries = self._pending[layer]
+            if entries:
+                self._write_entries(layer, entries)
+            del self._pending[layer]
+        self._last_flush = time.monotonic()
+        _BUFFERED_STORES.discard(self)
+
+    def _write_entries(self, layer: str, entries: List[PendingEntry]) -> None:
+        target = self._paths[layer]
         with self._file_lock(target):
-            with target.open("a", encoding="utf-8", newline="\n") as handle:
-                handle.write(payload)
+            with target.open("ab") as handle:
+                offset = handle.tell()
+                handle.write(b"".join(entry[1] for entry in entries))
                 handle.flush()
                 os.fsync(handle.fileno())
+            for record_id, data, created_key, terms in entries:
+                self._index_appended(layer, record_id, offset, len(data), created_key, terms)
+                offset += len(data)
+
+    def _index_appended(
+        self,
+        layer: str,
+        record_id: str,
+        offset: int,
+        length: int,
+        created_key: Optional[datetime],
+        terms: Tuple[Term, ...],
+    ) -> None:
+        """Record our own append if the layer index is current up to it."""
+        with self._index_lock:
+            state = self._index_state.get(layer)
+            if state is None or state[2] != offset:
+                return
+            index = self._id_index[layer]
+            read_layers = list(self.policy.read_layers)
+            states = self._layer_states(read_layers)
+            time_current = self._time_index_key == states
+            terms_current = self._term_index_key == states
+            # Record this id currently resolves to, if any
+            resolved = next(
+                (self._id_index[l][record_id] for l in read_layers
+                 if record_id in self._id_index.get(l, ())),
+                None,
+            )
+            resolves_here = layer in read_layers and (
+                resolved is None
+                or all(record_id not in self._id_index.get(l, ())
+                       for l in read_layers[:read_layers.index(layer)])
+            )
+
+            index[record_id] = (offset, length, created_key, terms)
+            # The tail window still precedes the new end; mtime is re-read later
+            self._index_state[layer] = state[:2] + (offset + length, None) + state[4:]
+            states = self._layer_states(read_layers)
+
+            if time_current and (layer not in read_layers or resolved is None):
+                # A brand-new id cannot displace another record; keep the time
+                # index current instead of rebuilding it on the next query
+                if layer in read_layers and created_key is not None:
+                    insort(self._time_index, (
+                        created_key, read_layers.index(layer), -offset, record_id, layer
+                    ))
+                self._time_index_key = states
+
+            if terms_current:
+                if resolves_here:
+                    # The append is the new resolved record; move its postings
+                    if resolved is not None:
+                        for term in resolved[3]:
+                            self._term_index[term].discard(record_id)
+                    for term in terms:
+                        self._term_index.setdefault(term, set()).add(record_id)
+                self._term_index_key = states
+
+    def _layer_states(self, layers) -> Tuple:
+        # mtime is left out: confirming an unchanged file doesn't change what
+        # the derived indexes were built from
+        return tuple(
+            None if state is None else state[:3] + state[4:]
+            for state in map(self._index_state.get, layers)
+        )
+
+    def _refresh_index(self, layer: str) -> Dict[str, IndexEntry]:
+        """
+        Bring the id index for one layer up to date with its file.
+
+        Appends (ours or other writers') are indexed incrementally from the
+        last indexed offset; a replaced, truncated or rewritten file (one no
+        longer holding the bytes before that offset) is re-indexed.
+        Caller must hold _index_lock.
+        """
+        path = self._paths[layer]
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._id_index[layer] = {}
+            self._index_state.pop(layer, None)
+            return self._id_index[layer]
+
+        state = self._index_state.get(layer)
+        if state is not None and state[:4] == (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns):
+            return self._id_index[layer]
+        if (
+            state is None
+            or state[:2] != (st.st_dev, st.st_ino)
+            or st.st_size < state[2]
+            # Same size, new mtime: rewritten in place (appends always grow)
+            or (st.st_size == state[2] and state[3] is not None)
+            or not _tail_unchanged(path, state[4], state[5])
+        ):
+            index = self._id_index[layer] = {}
+            start = 0
+        elif st.st_size == state[2]:
+            # Only our own appends since the last stat; note the mtime
+            self._index_state[layer] = state[:3] + (st.st_mtime_ns,) + state[4:]
+            return self._id_index[layer]
+        else:
+            index = self._id_index[layer]
+            start = state[2]
+
+        end = start
+        for offset, length, terminated, validated in self._scan_lines(path, start):
+            # An unterminated last line may still be being written; index
+            # it, but rescan it once the file grows
+            end = offset + length if terminated else offset
+            if validated is not None:
+                index[str(validated["id"])] = (
+                    offset, length, _created_key(validated), _record_terms(validated)
+                )
+
+        self._index_state[layer] = (
+            (st.st_dev, st.st_ino, end, st.st_mtime_ns) + _read_tail(path, end)
+        )
+        return index
+
+    @staticmethod
+    def _scan_lines(path: Path, start: int) -> Iterator[Tuple[int, int, bool, Optional[Dict]]]:
+        """
+        Yield (offset, length, newline_terminated, validated_record_or_None)
+        for each line of a layer file from byte offset `start`.
+        """
+        offset = start
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size <= start:
+                return
+            advise_sequential(handle, start)
+            # Lines are cut straight out of the page cache with a C-level
+            # find; the file is only ever appended to or replaced, so the
+            # mapped range stays valid
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                end = len(mapped)
+                while offset < end:
+                    newline = mapped.find(b"\n", offset)
+                    terminated = newline != -1
+                    stop = newline + 1 if terminated else end
+                    raw_line = mapped[offset:stop]
+                    validated = None
+                    if raw_line.strip():
+                        try:
+                            parsed = loads_json_line(raw_line)
+                        except ValueError:
+                            parsed = None
+                        if parsed is not None:
+                            validated, warning = validate_record(parsed, 0, path)
+                            if warning is not None:
+                                validated = None
+                    yield offset, stop - offset, terminated, validated
+                    offset = stop
+
+    def _layer_records(
+        self, layer: str, path: Path, key_only: bool = False
+    ) -> Optional[List[Dict]]:
+        """
+        Return one layer's validated records in file order, from cache when
+        the file is unchanged. Appended lines are parsed incrementally; a
+        replaced, truncated or rewritten file is re-read. With key_only, a
+        stale cache returns None instead of reading. Caller must hold
+        _index_lock and must not mutate the returned records.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._records_cache.pop(layer, None)
+            return []
+
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = self._records_cache.get(layer)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if key_only:
+            return None
+        if (
+            cached is not None
+            and cached[0][:2] == key[:2]
+            and st.st_size > cached[0][2]
+            and _tail_unchanged(path, *cached[2])
+        ):
+            start, cached_records = cached[0][2], cached[1]
+        else:
+            start, cached_records = 0, []
+
+        end = start
+        complete = True
+        appended = []
+        for offset, length, terminated, validated in self._scan_lines(path, start):
+            end = offset + length
+            complete = terminated
+            if validated is not None:
+                appended.append(validated)
+        # A new list: earlier callers may still be iterating the cached one
+        records = cached_records + appended
+
+        if complete:
+            self._records_cache[layer] = (
+                (st.st_dev, st.st_ino, end, st.st_mtime_ns), records, _read_tail(path, end)
+            )
+        else:
+            # Last line may still be being written; don't cache a partial read
+            self._records_cache.pop(layer, None)
+        return records
+
+    def get_record_by_id(self, record_id: str) -> Optional[Dict]:
+        """
+        Retrieve the record get_all_records() would list first for an id.
+
+        Read layers are checked in precedence order and the newest valid
+        version in the first layer holding the id is returned, read from
+        its single JSONL line via the id index. The record is augmented with
+        'source_layer' and 'source_path'.
+        """
+        # Reads see buffered appends
+        if self._pending:
+            self.flush()
+        plan = build_retrieval_plan(policy=self.policy, agent_id=self.agent_id)
+        for entry in plan:
+            layer = entry["layer"]
+            path = entry["path"]
+            with self._index_lock:
+                location = self._refresh_index(layer).get(record_id)
+            if location is None:
+                continue
+
+            record = self._read_indexed_line(path, location, record_id)
+            if record is None:
+                # File changed under the index; re-index this layer and retry
+                with self._index_lock:
+                    self._index_state.pop(layer, None)
+                    location = self._refresh_index(layer).get(record_id)
+                if location is None:
+                    continue
+                record = self._read_indexed_line(path, location, record_id)
+                if record is None:
+                    continue
+
+            record["source_layer"] = layer
+            record["source_path"] = str(path)
+            return record
+        return None
+
+    def record_ids(self) -> Set[str]:
+        """
+        Ids of the valid records in the read layers (those get_all_records()
+        would list), taken from the id index without reading the records.
+        """
+        if self._pending:
+            self.flush()
+        plan = build_retrieval_plan(policy=self.policy, agent_id=self.agent_id)
+        ids: Set[str] = set()
+        with self._index_lock:
+            for entry in plan:
+                ids.update(self._refresh_index(entry["layer"]))
+        return ids
+
+    def get_records_in_time_range(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """
+        Retrieve records whose created_at falls within [after, before].
+
+        Only the record each id resolves to (as in get_record_by_id) is
+        considered, and results come back in get_all_records() order. Bounds
+        are compared against the record's wall-clock time, as list filters
+        always have. Records with unparseable timestamps are excluded. The
+        range is sliced out of a sorted created_at index by binary search,
+        so only matching lines are read and parsed.
+        """
+        if self._pending:
+            self.flush()
+        plan = build_retrieval_plan(policy=self.policy, agent_id=self.agent_id)
+        layers = [entry["layer"] for entry in plan]
+        paths = {entry["layer"]: entry["path"] for entry in plan}
+        after = created_after.replace(tzinfo=None) if created_after else None
+        before = created_before.replace(tzinfo=None) if created_before else None
+
+        with self._index_lock:
+            for layer in layers:
+                self._refresh_index(layer)
+            key = self._layer_states(layers)
+            if self._time_index_key != key:
+                self._time_index = self._build_time_index(layers)
+                self._time_index_key = key
+            time_index = self._time_index
+            lo = 0 if after is None else bisect_left(time_index, after, key=itemgetter(0))
+            hi = (
+                len(time_index) if before is None
+                else bisect_right(time_index, before, key=itemgetter(0))
+            )
+            hits = sorted(time_index[lo:hi], key=itemgetter(1, 2))
+            locations = [
+                (layer, record_id, self._id_index[layer][record_id])
+                for _, _, _, record_id, layer in hits
+            ]
+
+        return self._read_locations(paths, locations)
+
+    def get_records_matching(
+        self,
+        tags: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Retrieve records carrying every tag in `tags` and, if given, the
+        `conversation_id`.
+
+        Like get_records_in_time_range, only the record each id resolves to
+        is considered and results come back in get_all_records() order. The
+        candidates are the intersection of per-term id postings, smallest
+        first, so only matching lines are read and parsed and layers holding
+        none of them are never touched.
+        """
+        if self._pending:
+            self.flush()
+        plan = build_retrieval_plan(policy=self.policy, agent_id=self.agent_id)
+        layers = [entry["layer"] for entry in plan]
+        paths = {entry["layer"]: entry["path"] for entry in plan}
+        terms = {("tag", tag) for tag in tags or ()}
+        if conversation_id:
+            terms.add(("conversation", conversation_id))
 
-        return str(validated["id"])
+        with self._index_lock:
+            for layer in layers:
+                self._refresh_index(layer)
+            key = self._layer_states(layers)
+            if self._term_index_key != key:
+                self._term_index = self._build_term_index(layers)
+                self._term_index_key = key
+            postings = sorted(
+                (self._term_index.get(term, set()) for term in terms), key=len
+            )
+            if postings:
+                candidates = postings[0].intersection(*postings[1:])
+            else:
+                candidates = set().union(*(self._id_index[layer] for layer in layers))
+
+            hits = []
+            for record_id in candidates:
+                for rank, layer in enumerate(layers):
+                    location = self._id_index[layer].get(record_id)
+                    if location is not None:
+                        hits.append((rank, -location[0], layer, record_id, location))
+                        break
+            hits.sort(key=itemgetter(0, 1))
+            locations = [(layer, record_id, location) for _, _, layer, record_id, location in hits]
+
+        return self._read_locations(paths, locations)
+
+    def _read_locations(
+        self, paths: Dict[str, Path], locations: List[Tuple[str, str, IndexEntry]]
+    ) -> List[Dict]:
+        """Read indexed (layer, id, location) lines as attributed records."""
+        records = []
+        for layer, record_id, location in locations:
+            record = self._read_indexed_line(paths[layer], location, record_id)
+            if record is None:
+                # File changed under the index; fall back to a point lookup
+                record = self.get_record_by_id(record_id)
+                if record is None:
+                    continue
+            else:
+                record["source_layer"] = layer
+                record["source_path"] = str(paths[layer])
+            records.append(record)
+        return records
 
-    def get_all_records(self) -> List[Dict]:
+    def _build_time_index(self, layers: List[str]) -> List[Tuple[datetime, int, int, str, str]]:
+        """Sort the resolved record of every id by created_at. Caller holds _index_lock."""
+        seen = set()
+        entries = []
+        for rank, layer in enumerate(layers):
+            for record_id, (offset, _length, created_key, _terms) in self._id_index[layer].items():
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+                if created_key is not None:
+                    entries.append((created_key, rank, -offset, record_id, layer))
+        entries.sort()
+        return entries
+
+    def get_records_with_tags(self, tags: List[str]) -> List[Dict]:
+        """Retrieve records carrying every tag in `tags`; see get_records_matching."""
+        return self.get_records_matching(tags=tags)
+
+    def _build_term_index(self, layers: List[str]) -> Dict[Term, set]:
+        """Post every id under the terms of its resolved record. Caller holds _index_lock."""
+        seen = set()
+        term_index: Dict[Term, set] = {}
+        for layer in layers:
+            for record_id, (_offset, _length, _created, terms) in self._id_index[layer].items():
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+                for term in terms:
+                    term_index.setdefault(term, set()).add(record_id)
+        return term_index
+
+    @staticmethod
+    def _read_indexed_line(path: Path, location: IndexEntry, record_id: str) -> Optional[Dict]:
+        offset, length = location[:2]
+        try:
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                parsed = loads_json_line(handle.read(length))
+        except (OSError, ValueError):
+            return None
+        validated, warning = validate_record(parsed, 0, path)
+        if warning is not None or str(validated["id"]) != record_id:
+            return None
+        return validated
+
+    def iter_all_records(self, limit: Optional[int] = None) -> Iterator[Dict]:
         """
-        Retrieve records from all configured read layers, in precedence order.
+        Yield records from all configured read layers, in precedence order.
         Each record is augmented with 'source_layer' and 'source_path'.
         
-        Within each layer, records are returned in REVERSE chronological order
+        Within each layer, records are yielded in REVERSE chronological order
         (newest first) to ensure 'Last Write Wins' logic is easily satisfied
-        by taking the first match in the list.
+        by taking the first match.
+
+        Parsed records are cached per layer and only re-read when the layer
+        file changes (appends are parsed incrementally). With `limit`, at
+        most that many records are yielded; a layer whose cache is stale is
+        then read backwards from its end, parsing only the lines needed.
         """
+        if self._pending:
+            self.flush()
         plan = build_retrieval_plan(policy=self.policy, agent_id=self.agent_id)
-        all_records = []
+        remaining = limit
 
         for entry in plan:
+            if remaining is not None and remaining <= 0:
+                return
             layer = entry["layer"]
             path = entry["path"]
+            source_path = str(path)
 
-            records, _warnings = load_jsonl_records(path)
+            with self._index_lock:
+                records = self._layer_records(layer, path, key_only=limit is not None)
             # Add newest records from this layer first
-            for record in reversed(records):
-                # Add source attribution as required by rlm-mem-c07.2.2
+            if records is not None:
+                newest_first = reversed(records)
+                if remaining is not None:
+                    newest_first = islice(newest_first, remaining)
+            else:
+                newest_first = load_jsonl_records_reverse(path, limit=remaining)
+
+            for cached in newest_first:
+                # Add source attribution as required by rlm-mem-c07.2.2;
+                # copy so callers never mutate the cached record
+                record = dict(cached)
                 record["source_layer"] = layer
-                record["source_path"] = str(path)
-                all_records.append(record)
+                record["source_path"] = source_path
+                if remaining is not None:
+                    remaining -= 1
+                yield record
 
-        return all_records
+    def get_all_records(self, limit: Optional[int] = None) -> List[Dict]:
+        """List form of iter_all_records()."""
+        return list(self.iter_all_records(limit))
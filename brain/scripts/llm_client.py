@@ -4,11 +4,39 @@ LLM Query Wrapper (D2.1)
 Provides a standardized interface for LLM calls with retry logic and cost tracking.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
 import os
+import re
 import time
 from typing import Any, Dict, List, Optional
 
+# Try to import tiktoken for accurate token counting
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Error messages that mark a failure as retryable
+_TRANSIENT_RE = re.compile(r"rate limit|timeout|temporarily", re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _encoder_for(model: str):
+    """tiktoken encoder for a model (cl100k_base if unknown), or None."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None  # Fall back to character-based estimation
+
 
 @dataclass
 class LLMResponse:
@@ -68,6 +96,10 @@ class LLMClient:
         "local": {"input": 0.0, "output": 0.0},
         "mock": {"input": 0.0, "output": 0.0}
     }
+    # Token counts of long texts (repeated system prompts, context blocks)
+    # are memoized by digest so the text itself is not retained
+    _TOKEN_CACHE_SIZE = 512
+    _TOKEN_CACHE_MIN_CHARS = 256
 
     def __init__(
         self,
@@ -103,6 +135,7 @@ class LLMClient:
             "total_tokens": 0,
             "total_cost_usd": 0.0
         }
+        self._token_counts: "OrderedDict[bytes, int]" = OrderedDict()
 
     def _load_api_key(self) -> Optional[str]:
         env_key = self._ENV_KEYS.get(self.provider)
@@ -113,7 +146,22 @@ class LLMClient:
     def _count_tokens(self, text: str) -> int:
         if not text:
             return 0
-        return max(1, len(text) // 4)
+        encoder = _encoder_for(self.model)
+        if encoder is None:
+            return max(1, len(text) // 4)
+        if len(text) < self._TOKEN_CACHE_MIN_CHARS:
+            return len(encoder.encode_ordinary(text))
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        count = self._token_counts.get(key)
+        if count is not None:
+            self._token_counts.move_to_end(key)
+            return count
+        count = len(encoder.encode_ordinary(text))
+        self._token_counts[key] = count
+        if len(self._token_counts) > self._TOKEN_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+        return count
 
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         rates = self._rate_table.get(self.provider, {"input": 0.0, "output": 0.0})
@@ -124,8 +172,7 @@ class LLMClient:
     def _is_transient_error(self, error: Exception) -> bool:
         if isinstance(error, LLMTransientError):
             return True
-        message = str(error).lower()
-        return any(keyword in message for keyword in ("rate limit", "timeout", "temporarily"))
+        return _TRANSIENT_RE.search(str(error)) is not None
 
     def _ensure_budget(self, allow_equal: bool = False) -> None:
         if self._max_cost_usd is None:
@@ -10,16 +10,50 @@ Usage:
 
 import argparse
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from .layered_memory_store import LayeredMemoryStore
+from .layered_memory_store import LayeredMemoryStore, advise_sequential
 from .memory_policy import load_memory_policy, MemoryPolicy
 from .layered_adapter import LayeredChunkStoreAdapter
 from .memory_layers import resolve_all_layer_paths
+from .memory_schema import loads_json_line
 from .recall_operation import RecallOperation
 
+# Leading "YYYY-MM-DDTHH:MM:SS" of an extended ISO-8601 timestamp; these
+# prefixes order the same lexicographically as the times they name
+_ISO_SECONDS_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+# Escape-free "created_at" string members in a raw JSONL line, capturing the
+# seconds prefix when the value is in canonical form (empty otherwise)
+_CREATED_AT_FIELD = re.compile(
+    rb'"created_at"\s*:\s*"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})?[^"\\]*"'
+)
+
+
+def _created_before(created_raw, cutoff: datetime, cutoff_prefix: str) -> bool:
+    """
+    Return True if created_raw is a valid timestamp whose wall-clock time
+    (any offset ignored) is before cutoff.
+
+    Records clearly newer than the cutoff are settled with one string
+    compare of the seconds prefix; only candidates for pruning (and
+    non-canonical timestamps) are parsed to confirm.
+    """
+    if isinstance(created_raw, str) and _ISO_SECONDS_PREFIX.match(created_raw):
+        if created_raw[:19] > cutoff_prefix:
+            return False
+    try:
+        created_at = datetime.fromisoformat(created_raw.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if created_at.tzinfo is not None:
+        created_at = created_at.replace(tzinfo=None)
+    return created_at < cutoff
+
+
 def setup_store(project_root: Path = None) -> LayeredMemoryStore:
     if project_root is None:
         project_root = Path.cwd()
@@ -83,6 +117,8 @@ def cmd_search(args):
 def cmd_prune(args):
     store = setup_store()
     cutoff = datetime.utcnow() - timedelta(days=args.days)
+    cutoff_prefix = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
+    cutoff_bytes = cutoff_prefix.encode("ascii")
     paths = resolve_all_layer_paths(policy=store.policy, agent_id=store.agent_id)
     pruned = 0
     layers = 0
@@ -92,37 +128,37 @@ def cmd_prune(args):
         if target is None or not target.exists():
             continue
         layers += 1
-        with target.open("r", encoding="utf-8") as handle:
-            lines = handle.readlines()
-        retained = []
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                retained.append(line)
-                continue
-            try:
-                record = json.loads(stripped)
-            except json.JSONDecodeError:
-                retained.append(line)
-                continue
-            created_raw = record.get("created_at")
-            if not created_raw:
-                retained.append(line)
-                continue
+        # Stream survivors into a sibling temp file and swap it in atomically;
+        # holding the lock throughout keeps concurrent appends from being lost
+        tmp = target.with_name(target.name + ".tmp")
+        layer_pruned = 0
+        with store._file_lock(target):
             try:
-                created_at = datetime.fromisoformat(created_raw.replace("Z", "+00:00"))
-            except ValueError:
-                retained.append(line)
-                continue
-            if created_at.tzinfo is not None:
-                created_at = created_at.replace(tzinfo=None)
-            if created_at < cutoff:
-                pruned += 1
-                continue
-            retained.append(line)
-        if retained != lines:
-            with store._file_lock(target):
-                target.write_text("".join(retained), encoding="utf-8", newline="\n")
+                with target.open("rb") as rin, tmp.open("wb") as wout:
+                    advise_sequential(rin)
+                    for line in rin:
+                        stripped = line.strip()
+                        if stripped:
+                            # Keep clearly newer records without parsing: with a
+                            # single created_at member it must be the top-level one
+                            found = _CREATED_AT_FIELD.findall(stripped)
+                            if len(found) == 1 and found[0] > cutoff_bytes:
+                                wout.write(line)
+                                continue
+                            try:
+                                record = loads_json_line(stripped)
+                            except ValueError:
+                                record = None
+                            created_raw = record.get("created_at") if isinstance(record, dict) else None
+                            if created_raw and _created_before(created_raw, cutoff, cutoff_prefix):
+                                layer_pruned += 1
+                                continue
+                        wout.write(line)
+                if layer_pruned:
+                    os.replace(tmp, target)
+            finally:
+                tmp.unlink(missing_ok=True)
+        pruned += layer_pruned
 
     print(f"Pruned {pruned} record(s) across {layers} layer(s).")
 
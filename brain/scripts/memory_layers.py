@@ -2,8 +2,10 @@
 Layered memory path resolution and retrieval planning.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from .memory_policy import ALLOWED_LAYERS, MemoryPolicy
 
@@ -12,6 +14,24 @@ def _memory_file(base_dir: Path) -> Path:
     return (base_dir / "memory.jsonl").resolve()
 
 
+@lru_cache(maxsize=64)
+def _resolved_layer_paths(
+    project_root: Path, user_root: Path, agent_id: str, cwd: Optional[str]
+) -> Tuple[Path, Path, Path, Path]:
+    """
+    Resolved (project_agent, project_global, user_agent, user_global) files.
+
+    Cached so retrieval plans don't re-run resolve() on every query; `cwd`
+    is part of the key whenever a root is relative.
+    """
+    return (
+        _memory_file(project_root / "agents" / agent_id),
+        _memory_file(project_root / "global"),
+        _memory_file(user_root / "agents" / agent_id),
+        _memory_file(user_root / "global"),
+    )
+
+
 def resolve_all_layer_paths(policy: MemoryPolicy, agent_id: str) -> Dict[str, Path]:
     if not agent_id:
         raise ValueError("agent_id is required.")
@@ -20,12 +40,16 @@ def resolve_all_layer_paths(policy: MemoryPolicy, agent_id: str) -> Dict[str, Pa
 
     project_root = policy.project_memory_root
     user_root = policy.user_memory_root
+    relative = not (project_root.is_absolute() and user_root.is_absolute())
 
+    project_agent, project_global, user_agent, user_global = _resolved_layer_paths(
+        project_root, user_root, agent_id, os.getcwd() if relative else None
+    )
     return {
-        "project_agent": _memory_file(project_root / "agents" / agent_id),
-        "project_global": _memory_file(project_root / "global"),
-        "user_agent": _memory_file(user_root / "agents" / agent_id),
-        "user_global": _memory_file(user_root / "global"),
+        "project_agent": project_agent,
+        "project_global": project_global,
+        "user_agent": user_agent,
+        "user_global": user_global,
     }
 
 
@@ -2,16 +2,21 @@
 Layered memory policy model and config loader.
 """
 
+import copy
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 ALLOWED_LAYERS = {"project_agent", "project_global", "user_agent", "user_global"}
 USER_GLOBAL_LAYERS = {"user_agent", "user_global"}
 
+# Absolute config path -> ((st_mtime_ns, st_size), parsed config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class MemoryPolicy:
     enabled: bool = True
     read_layers: List[str] = field(
@@ -22,28 +27,50 @@ class MemoryPolicy:
     retention_days: int = 90
     redaction_rules: List[str] = field(default_factory=list)
     project_root: Optional[Union[Path, str]] = None
+    # (input, derived root) memos for the two properties below
+    _project_root_memo: Optional[Tuple[Any, Path]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _user_root_memo: Optional[Tuple[str, Path]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def project_memory_root(self) -> Optional[Path]:
         if self.project_root is None:
             return None
-        root = Path(self.project_root)
-        return root / ".agents" / "memory"
+        memo = self._project_root_memo
+        # project_root is a str or Path, both immutable: identity is enough
+        if memo is None or memo[0] is not self.project_root:
+            memo = (self.project_root, Path(self.project_root) / ".agents" / "memory")
+            self._project_root_memo = memo
+        return memo[1]
 
     @property
     def user_memory_root(self) -> Path:
-        return Path.home() / ".agents" / "memory"
+        # What Path.home() expands; re-derived if HOME changes
+        home = os.path.expanduser("~")
+        memo = self._user_root_memo
+        if memo is None or memo[0] != home:
+            memo = (home, Path(home) / ".agents" / "memory")
+            self._user_root_memo = memo
+        return memo[1]
+
+
+_BOOL_WORDS = frozenset(("true", "false"))
+_NULL_WORDS = frozenset(("null", "none"))
 
 
 def _coerce_scalar(value: str) -> Any:
-    lowered = value.strip().lower()
-    if lowered in {"true", "false"}:
+    stripped = value.strip()
+    lowered = stripped.lower()
+    if lowered in _BOOL_WORDS:
         return lowered == "true"
-    if lowered in {"null", "none"}:
+    if lowered in _NULL_WORDS:
         return None
-    if value.strip().isdigit():
-        return int(value.strip())
-    return value.strip()
+    if stripped.isdigit():
+        return int(stripped)
+    return stripped
 
 
 def _parse_simple_yaml(yaml_text: str) -> Dict[str, Any]:
@@ -53,43 +80,65 @@ def _parse_simple_yaml(yaml_text: str) -> Dict[str, Any]:
     - top-level list values with "- item"
     """
     data: Dict[str, Any] = {}
-    current_list_key: Optional[str] = None
+    # append of the list the current "- item" lines belong to
+    append_item = None
 
     for raw_line in yaml_text.splitlines():
-        line = raw_line.rstrip()
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        stripped = raw_line.strip()
+        if not stripped or stripped[0] == "#":
             continue
         if stripped.startswith("- "):
-            if current_list_key is None:
+            if append_item is None:
                 raise ValueError("Invalid list item without a parent key.")
-            data[current_list_key].append(_coerce_scalar(stripped[2:]))
+            append_item(_coerce_scalar(stripped[2:]))
             continue
-        if ":" not in stripped:
-            raise ValueError(f"Invalid config line: {line}")
-        key, value = stripped.split(":", 1)
+        key, sep, value = stripped.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid config line: {raw_line.rstrip()}")
         key = key.strip()
         value = value.strip()
         if value == "":
-            data[key] = []
-            current_list_key = key
+            items: List[Any] = []
+            data[key] = items
+            append_item = items.append
         else:
             data[key] = _coerce_scalar(value)
-            current_list_key = None
+            append_item = None
 
     return data
 
 
+def clear_policy_cache() -> None:
+    """Forget parsed config files (they are otherwise reused until they change)."""
+    _CONFIG_CACHE.clear()
+
+
 def _load_config_data(config_path: Path) -> Dict[str, Any]:
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         return {}
+    cache_key = str(config_path.absolute())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    parsed = _parse_config_file(config_path)
+    _CONFIG_CACHE[cache_key] = (stamp, parsed)
+    return copy.deepcopy(parsed)
+
+
+def _parse_config_file(config_path: Path) -> Dict[str, Any]:
     raw_text = config_path.read_text(encoding="utf-8")
     if not raw_text.strip():
         return {}
     try:
         import yaml  # type: ignore
 
-        parsed = yaml.safe_load(raw_text) or {}
+        # libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        parsed = yaml.load(raw_text, Loader=loader) or {}
         if not isinstance(parsed, dict):
             raise ValueError("Config root must be a map/object.")
         return parsed
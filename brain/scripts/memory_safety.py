@@ -3,6 +3,7 @@ Redaction and data-boundary policy helpers for layered memory.
 """
 
 import re
+from functools import lru_cache
 
 from .memory_policy import MemoryPolicy
 
@@ -17,22 +18,32 @@ def should_allow_layer_write(layer: str, policy: MemoryPolicy) -> bool:
     return True
 
 
+@lru_cache(maxsize=32)
+def _compile_redaction_rules(rules: tuple) -> tuple:
+    """
+    Compile redaction rules once per rule set.
+
+    Returns a prefilter matching any rule keyword, plus the per-rule
+    substitution patterns in the order they are applied.
+    """
+    escaped_rules = [re.escape(rule) for rule in rules]
+    prefilter = re.compile("|".join(escaped_rules), re.IGNORECASE)
+    patterns = []
+    for escaped in escaped_rules:
+        patterns.append(re.compile(rf"({escaped}\s*[:=]\s*){_VALUE_PATTERN}", re.IGNORECASE))
+        patterns.append(re.compile(rf"({escaped}\s+){_VALUE_PATTERN}", re.IGNORECASE))
+    return prefilter, patterns
+
+
 def apply_redaction_rules(text: str, rules: list[str]) -> str:
     effective_rules = rules or DEFAULT_REDACTION_RULES
+    prefilter, patterns = _compile_redaction_rules(tuple(effective_rules))
+    # Every pattern needs its keyword, so text without any is left as is
+    if prefilter.search(text) is None:
+        return text
     redacted = text
-    for rule in effective_rules:
-        escaped = re.escape(rule)
-        patterns = [
-            rf"({escaped}\s*[:=]\s*){_VALUE_PATTERN}",
-            rf"({escaped}\s+){_VALUE_PATTERN}",
-        ]
-        for pattern in patterns:
-            redacted = re.sub(
-                pattern,
-                r"\1[REDACTED]",
-                redacted,
-                flags=re.IGNORECASE,
-            )
+    for pattern in patterns:
+        redacted = pattern.sub(r"\1[REDACTED]", redacted)
     return redacted
 
 
@@ -3,8 +3,16 @@ Layered memory schema validation utilities.
 """
 
 import json
+import os
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Use orjson for the JSONL hot paths when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 REQUIRED_FIELDS = (
@@ -25,6 +33,9 @@ ALLOWED_SCOPES = {
 
 AGENT_SCOPES = {"project_agent", "user_agent"}
 
+# One C-level lookup of every required field; raises KeyError if any is absent
+_required_values = itemgetter(*REQUIRED_FIELDS)
+
 WarningDict = Dict[str, Any]
 RecordDict = Dict[str, Any]
 
@@ -60,8 +71,12 @@ def validate_record(
             actual_type=type(record).__name__,
         )
 
-    missing_fields = [field for field in REQUIRED_FIELDS if not record.get(field)]
-    if missing_fields:
+    try:
+        complete = all(_required_values(record))
+    except KeyError:
+        complete = False
+    if not complete:
+        missing_fields = [field for field in REQUIRED_FIELDS if not record.get(field)]
         return None, _warning(
             code="missing_required_fields",
             message="Record missing required fields.",
@@ -90,6 +105,15 @@ def validate_record(
             scope=scope,
         )
 
+    # Already normalized (the common case for stored lines): no copy needed
+    if (
+        record.get("tags") is not None
+        and record.get("confidence") is not None
+        and record.get("source")
+        and "expires_at" in record
+    ):
+        return record, None
+
     normalized = dict(record)
     if "tags" not in normalized or normalized["tags"] is None:
         normalized["tags"] = []
@@ -103,38 +127,129 @@ def validate_record(
     return normalized, None
 
 
-def load_jsonl_records(path: Union[str, Path]) -> Tuple[List[RecordDict], List[WarningDict]]:
-    """Load JSONL file and return valid records plus structured validation warnings."""
+def loads_json_line(raw: Union[str, bytes]) -> Any:
+    """
+    Parse one JSONL line.
+
+    Lines orjson rejects but json accepts (NaN literals, huge integers) are
+    retried with json.loads, so both paths accept the same input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def dumps_json_line(record: RecordDict) -> bytes:
+    """Serialize a record as one UTF-8 JSONL line, trailing newline included."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def iter_jsonl_records(
+    path: Union[str, Path],
+) -> Iterator[Tuple[Optional[RecordDict], Optional[WarningDict]]]:
+    """
+    Stream a JSONL file, yielding (record, None) per valid line or
+    (None, warning) per invalid one. Blank lines are skipped.
+    """
     source_path = Path(path)
-    valid_records: List[RecordDict] = []
-    warnings: List[WarningDict] = []
+    try:
+        handle = source_path.open("r", encoding="utf-8")
+    except FileNotFoundError:
+        return
 
-    if not source_path.exists():
-        return valid_records, warnings
-
-    with source_path.open("r", encoding="utf-8") as handle:
+    with handle:
         for line_number, raw_line in enumerate(handle, start=1):
             line = raw_line.strip()
             if not line:
                 continue
             try:
-                parsed = json.loads(line)
+                parsed = loads_json_line(line)
             except json.JSONDecodeError as exc:
-                warnings.append(
-                    _warning(
-                        code="invalid_json",
-                        message="Could not decode JSON line.",
-                        source_path=source_path,
-                        line_number=line_number,
-                        error=str(exc),
-                    )
+                yield None, _warning(
+                    code="invalid_json",
+                    message="Could not decode JSON line.",
+                    source_path=source_path,
+                    line_number=line_number,
+                    error=str(exc),
                 )
                 continue
 
             validated, warning = validate_record(parsed, line_number, source_path)
             if warning is not None:
-                warnings.append(warning)
-                continue
-            valid_records.append(validated)
+                yield None, warning
+            else:
+                yield validated, None
 
+
+def load_jsonl_records(path: Union[str, Path]) -> Tuple[List[RecordDict], List[WarningDict]]:
+    """Load JSONL file and return valid records plus structured validation warnings."""
+    valid_records: List[RecordDict] = []
+    warnings: List[WarningDict] = []
+    for record, warning in iter_jsonl_records(path):
+        if warning is not None:
+            warnings.append(warning)
+        else:
+            valid_records.append(record)
     return valid_records, warnings
+
+
+def _parse_valid_line(line: bytes, source_path: Path) -> Optional[RecordDict]:
+    """Parse and validate one raw JSONL line; None if blank or invalid."""
+    if not line.strip():
+        return None
+    try:
+        parsed = loads_json_line(line)
+    except ValueError:
+        return None
+    validated, warning = validate_record(parsed, 0, source_path)
+    return None if warning is not None else validated
+
+
+def load_jsonl_records_reverse(
+    path: Union[str, Path],
+    limit: Optional[int] = None,
+    block_size: int = 1 << 16,
+) -> Iterator[RecordDict]:
+    """
+    Yield valid records from a JSONL file newest-first, stopping after `limit`.
+
+    The file is read backwards in `block_size` blocks, so only as much of its
+    tail as needed is read and parsed. Invalid lines are skipped silently.
+    """
+    source_path = Path(path)
+    if limit is not None and limit <= 0:
+        return
+    try:
+        handle = source_path.open("rb")
+    except FileNotFoundError:
+        return
+
+    yielded = 0
+    with handle:
+        position = handle.seek(0, os.SEEK_END)
+        # Start of the earliest line seen so far; it may continue further back
+        head = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            handle.seek(position)
+            lines = (handle.read(size) + head).split(b"\n")
+            head = lines[0]
+            for line in reversed(lines[1:]):
+                record = _parse_valid_line(line, source_path)
+                if record is not None:
+                    yield record
+                    yielded += 1
+                    if yielded == limit:
+                        return
+        record = _parse_valid_line(head, source_path)
+        if record is not None:
+            yield record
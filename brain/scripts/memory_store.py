@@ -5,13 +5,20 @@ D1.1: Core storage module for RLM-based memory system
 Provides ChunkStore for CRUD operations and ChunkIndex for fast lookups.
 """
 
+import atexit
 import json
+import os
+import re
 import uuid
 import shutil
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional, List, Dict, Set, Any
+from typing import Optional, List, Dict, Set, Any, Tuple, Union
 from enum import Enum
 import logging
 
@@ -19,6 +26,48 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use orjson for chunk and index files when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> str:
+    """
+    Serialize to JSON, via orjson when available.
+
+    orjson only indents by two spaces and always writes UTF-8, so other
+    layouts, and values it rejects (lone surrogates, huge integers,
+    non-string keys), go through the stdlib encoder.
+    """
+    if orjson is not None and indent == 2 and not ensure_ascii:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def _dumps_log_line(data: Any) -> bytes:
+    """Serialize to one compact UTF-8 JSON line, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("ascii")
+
+
+def _loads_json(raw: Union[str, bytes]) -> Any:
+    """Parse JSON, via orjson when available (falling back for NaN etc.)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 class ChunkType(str, Enum):
     """Types of memory chunks."""
@@ -29,7 +78,7 @@ class ChunkType(str, Enum):
     DECISION = "decision"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetadata:
     """Metadata for a memory chunk."""
     created: str  # ISO 8601 timestamp
@@ -40,14 +89,21 @@ class ChunkMetadata:
     last_accessed: Optional[str] = None
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "created": self.created,
+            "conversation_id": self.conversation_id,
+            "source": self.source,
+            "confidence": self.confidence,
+            "access_count": self.access_count,
+            "last_accessed": self.last_accessed
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> "ChunkMetadata":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkLinks:
     """Links between chunks for graph traversal."""
     context_of: List[str] = field(default_factory=list)
@@ -57,14 +113,21 @@ class ChunkLinks:
     contradicts: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Copies, like dataclasses.asdict, so callers can't alias our lists
+        return {
+            "context_of": list(self.context_of),
+            "follows": list(self.follows),
+            "related_to": list(self.related_to),
+            "supports": list(self.supports),
+            "contradicts": list(self.contradicts)
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> "ChunkLinks":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """
     A memory chunk for RLM storage.
@@ -113,12 +176,31 @@ class Chunk:
     
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string (human-readable)."""
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return _dumps_json(self.to_dict(), indent=indent)
+    
+    def copy(self) -> "Chunk":
+        """Copy with independent metadata, links and tag lists."""
+        links = self.links
+        return Chunk(
+            id=self.id,
+            content=self.content,
+            tokens=self.tokens,
+            type=self.type,
+            metadata=replace(self.metadata),
+            links=ChunkLinks(
+                context_of=list(links.context_of),
+                follows=list(links.follows),
+                related_to=list(links.related_to),
+                supports=list(links.supports),
+                contradicts=list(links.contradicts),
+            ),
+            tags=list(self.tags)
+        )
     
     @classmethod
     def from_json(cls, json_str: str) -> "Chunk":
         """Deserialize from JSON string with validation."""
-        data = json.loads(json_str)
+        data = _loads_json(json_str)
         # Basic schema validation
         required = ["id", "content", "tokens", "type", "metadata"]
         for field_name in required:
@@ -127,6 +209,115 @@ class Chunk:
         return cls.from_dict(data)
 
 
+# Only allow ASCII alphanumerics, hyphens, underscores and dots
+_CHUNK_ID_RE = re.compile(r"[A-Za-z0-9._-]+")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# created_us value for a "created" string that must be compared as datetime
+_UNINDEXED = object()
+
+
+def _aware_us(value: datetime) -> Optional[int]:
+    """Microseconds since the epoch for an aware datetime; None if naive."""
+    if value.tzinfo is None:
+        return None
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _created_us(meta: Dict[str, Any]) -> Any:
+    """
+    Creation time of a metadata_index entry in epoch microseconds, None if
+    it has no "created" value, or _UNINDEXED if it does not parse to an
+    aware datetime.
+    """
+    created_str = meta.get("created", "")
+    if not created_str:
+        return None
+    created_us = meta.get("created_us")
+    if isinstance(created_us, int):
+        return created_us
+    try:
+        created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+    except ValueError:
+        return _UNINDEXED
+    return _UNINDEXED if created.tzinfo is None else _aware_us(created)
+
+
+class _ListingIndex:
+    """
+    In-memory lookup structures for list_chunks, derived from metadata_index:
+    listing order, chunk IDs per conversation, and creation times sorted for
+    range queries.
+    """
+    
+    def __init__(self):
+        self.positions: Dict[str, int] = {}
+        self.by_conversation: Dict[Optional[str], List[str]] = {}
+        self.created_us: Dict[str, Any] = {}
+        # Sorted (created_us, chunk_id) of chunks with an indexed time
+        self.by_created: List[Tuple[int, str]] = []
+        # Chunks with no indexed time; date filters must look at them directly
+        self.undated: Set[str] = set()
+        self._next_position = 0
+    
+    def add(self, chunk_id: str, meta: Optional[Dict[str, Any]]) -> None:
+        if chunk_id in self.positions:
+            return
+        self.positions[chunk_id] = self._next_position
+        self._next_position += 1
+        meta = meta or {}
+        self.by_conversation.setdefault(meta.get("conversation_id"), []).append(chunk_id)
+        created_us = _created_us(meta)
+        self.created_us[chunk_id] = created_us
+        if isinstance(created_us, int):
+            insort(self.by_created, (created_us, chunk_id))
+        else:
+            self.undated.add(chunk_id)
+    
+    def remove(self, chunk_id: str, meta: Optional[Dict[str, Any]]) -> None:
+        if self.positions.pop(chunk_id, None) is None:
+            return
+        ids = self.by_conversation.get((meta or {}).get("conversation_id"))
+        if ids is not None and chunk_id in ids:
+            ids.remove(chunk_id)
+        created_us = self.created_us.pop(chunk_id)
+        if isinstance(created_us, int):
+            at = bisect_left(self.by_created, (created_us, chunk_id))
+            if at < len(self.by_created) and self.by_created[at][1] == chunk_id:
+                del self.by_created[at]
+        else:
+            self.undated.discard(chunk_id)
+    
+    def in_order(self, chunk_ids) -> List[str]:
+        """Listed chunk IDs among chunk_ids, in listing order."""
+        positions = self.positions
+        return sorted((cid for cid in chunk_ids if cid in positions), key=positions.__getitem__)
+    
+    def created_between(self, after_us: Optional[int], before_us: Optional[int]) -> List[str]:
+        """Chunk IDs that can fall inside the range, in listing order."""
+        lo = 0 if after_us is None else bisect_left(self.by_created, (after_us,))
+        # (before_us + 1,) sorts after every (before_us, chunk_id)
+        hi = (len(self.by_created) if before_us is None
+              else bisect_right(self.by_created, (before_us + 1,)))
+        matches = [cid for _, cid in self.by_created[lo:hi]]
+        matches.extend(self.undated)
+        return self.in_order(matches)
+
+
+# Stores holding access counters not yet written back, flushed at exit
+_PENDING_ACCESS_STORES: "weakref.WeakSet[ChunkStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_access() -> None:
+    for store in list(_PENDING_ACCESS_STORES):
+        try:
+            store.flush_access()
+        except OSError as e:
+            logger.warning(f"Could not flush access counters for {store.base_path}: {e}")
+
+
 class ChunkStore:
     """
     JSON-based chunk storage with automatic indexing.
@@ -136,58 +327,90 @@ class ChunkStore:
         ├── chunks/           # Chunk files organized by month
         │   └── YYYY-MM/
         │       └── chunk-XXX.json
-        ├── index/            # Index files
+        ├── index/            # Index snapshots (+ <name>.log operation logs)
         │   ├── metadata_index.json
         │   ├── tag_index.json
         │   └── link_graph.json
         └── archive/          # Soft-deleted chunks
+    
+    Parsed chunks are cached per file (validated against mtime and size),
+    and the access counters bumped by get_chunk are buffered in memory and
+    written back once ACCESS_FLUSH_EVERY chunks have pending counters, on
+    flush_access()/close(), or at interpreter exit.
     """
     
-    def __init__(self, base_path: str = "brain/memory"):
+    # Chunks with buffered access counters before they are written back
+    ACCESS_FLUSH_EVERY = 32
+    
+    def __init__(self, base_path: str = "brain/memory", cache_size: int = 1024):
         self.base_path = Path(base_path)
         self.chunks_path = self.base_path / "chunks"
         self.index_path = self.base_path / "index"
         self.archive_path = self.base_path / "archive"
         
-        # Ensure directories exist
-        self.chunks_path.mkdir(parents=True, exist_ok=True)
-        self.index_path.mkdir(parents=True, exist_ok=True)
-        self.archive_path.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist; one listing of base_path covers the
+        # common case where all three already do
+        try:
+            with os.scandir(self.base_path) as entries:
+                present = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
+        for path in (self.chunks_path, self.index_path, self.archive_path):
+            if path.name not in present:
+                path.mkdir(parents=True, exist_ok=True)
         
         # Initialize indexes
         self.metadata_index = ChunkIndex(self.index_path / "metadata_index.json")
         self.tag_index = ChunkIndex(self.index_path / "tag_index.json")
         self.link_graph = ChunkIndex(self.index_path / "link_graph.json")
         
+        # chunk_id -> ((st_mtime_ns, st_size), Chunk) of the last parse/write
+        self._chunk_cache: "OrderedDict[str, Tuple[Tuple[int, int], Chunk]]" = OrderedDict()
+        self._cache_size = cache_size
+        # chunk_id -> (access_count, last_accessed) not yet written to disk
+        self._access_buffer: Dict[str, Tuple[int, str]] = {}
+        # Month directories already created by _get_chunk_path
+        self._mkdir_cache: Set[str] = set()
+        # (UTC day number, "YYYY-MM-DD") used by _generate_id
+        self._id_day: Tuple[int, str] = (-1, "")
+        # Derived from metadata_index on first filtered list_chunks call
+        self._listing: Optional[_ListingIndex] = None
+        
         logger.info(f"ChunkStore initialized at {base_path}")
     
     def _generate_id(self) -> str:
         """Generate unique chunk ID with timestamp."""
-        now = datetime.utcnow()
-        date_str = now.strftime("%Y-%m-%d")
+        day = int(time.time() // 86400)
+        if day != self._id_day[0]:
+            self._id_day = (day, time.strftime("%Y-%m-%d", time.gmtime(day * 86400)))
         unique = uuid.uuid4().hex[:8]
-        return f"chunk-{date_str}-{unique}"
+        return f"chunk-{self._id_day[1]}-{unique}"
     
     def _get_chunk_path(self, chunk_id: str) -> Path:
         """Get file path for chunk, organized by month."""
         # Extract date from ID: chunk-YYYY-MM-DD-XXX
-        parts = chunk_id.split("-")
-        if len(parts) >= 4:
-            year_month = f"{parts[1]}-{parts[2]}"
+        if (chunk_id.startswith("chunk-") and chunk_id[10:11] == "-"
+                and chunk_id[6:10].isdigit() and chunk_id[11:13].isdigit()
+                and chunk_id[13:14] == "-"):
+            year_month = chunk_id[6:13]
         else:
-            year_month = datetime.utcnow().strftime("%Y-%m")
+            parts = chunk_id.split("-")
+            if len(parts) >= 4:
+                year_month = f"{parts[1]}-{parts[2]}"
+            else:
+                year_month = datetime.utcnow().strftime("%Y-%m")
         
         month_dir = self.chunks_path / year_month
-        month_dir.mkdir(exist_ok=True)
+        if year_month not in self._mkdir_cache:
+            month_dir.mkdir(exist_ok=True)
+            self._mkdir_cache.add(year_month)
         return month_dir / f"{chunk_id}.json"
     
     def _validate_chunk_id(self, chunk_id: str) -> bool:
         """Validate chunk ID format to prevent path traversal."""
         if not chunk_id or not isinstance(chunk_id, str):
             return False
-        # Only allow alphanumeric, hyphens, underscores
-        allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.")
-        return all(c in allowed_chars for c in chunk_id)
+        return _CHUNK_ID_RE.fullmatch(chunk_id) is not None
     
     def create_chunk(self, content: str, chunk_type: str,
                      conversation_id: str, tokens: int,
@@ -210,7 +433,8 @@ class ChunkStore:
             The created Chunk
         """
         chunk_id = self._generate_id()
-        now = datetime.utcnow().isoformat() + "Z"
+        created = datetime.utcnow()
+        now = created.isoformat() + "Z"
         
         metadata = ChunkMetadata(
             created=now,
@@ -233,28 +457,33 @@ class ChunkStore:
         
         # Write to file
         chunk_path = self._get_chunk_path(chunk_id)
-        chunk_path.write_text(chunk.to_json(), encoding="utf-8")
-        
-        # Update indexes
-        self.metadata_index.add(chunk_id, {
-            "type": chunk_type,
-            "conversation_id": conversation_id,
-            "created": now,
-            "confidence": confidence
-        })
-        
-        for tag in (tags or []):
-            self.tag_index.add_to_list(tag, chunk_id)
+        self._write_chunk(chunk_path, chunk)
+        
+        # Update indexes, saving each once
+        with self.metadata_index, self.tag_index:
+            self.metadata_index.add(chunk_id, {
+                "type": chunk_type,
+                "conversation_id": conversation_id,
+                "created": now,
+                "created_us": _aware_us(created.replace(tzinfo=timezone.utc)),
+                "confidence": confidence
+            })
+            
+            for tag in (tags or []):
+                self.tag_index.add_to_list(tag, chunk_id)
+        if self._listing is not None:
+            self._listing.add(chunk_id, self.metadata_index.get(chunk_id))
         
         logger.info(f"Created chunk {chunk_id} ({tokens} tokens)")
         return chunk
     
-    def get_chunk(self, chunk_id: str) -> Optional[Chunk]:
+    def get_chunk(self, chunk_id: str, track_access: bool = True) -> Optional[Chunk]:
         """
         Retrieve chunk by ID.
         
         Args:
             chunk_id: The chunk identifier
+            track_access: Bump access_count/last_accessed (buffered write)
         
         Returns:
             Chunk if found, None otherwise
@@ -263,26 +492,79 @@ class ChunkStore:
             logger.warning(f"Invalid chunk ID format: {chunk_id}")
             return None
         
-        chunk_path = self._get_chunk_path(chunk_id)
-        
-        if not chunk_path.exists():
+        chunk = self._load_chunk(chunk_id, self._get_chunk_path(chunk_id))
+        if chunk is None:
             return None
         
-        try:
-            json_str = chunk_path.read_text(encoding="utf-8")
-            chunk = Chunk.from_json(json_str)
-            
-            # Update access tracking
+        # Counters not yet written back take precedence over the file's
+        buffered = self._access_buffer.get(chunk_id)
+        if buffered is not None and buffered[0] > chunk.metadata.access_count:
+            chunk.metadata.access_count, chunk.metadata.last_accessed = buffered
+        
+        if track_access:
             chunk.metadata.access_count += 1
             chunk.metadata.last_accessed = datetime.utcnow().isoformat() + "Z"
-            
-            # Write back updated metadata
-            chunk_path.write_text(chunk.to_json(), encoding="utf-8")
-            
-            return chunk
+            self._access_buffer[chunk_id] = (
+                chunk.metadata.access_count, chunk.metadata.last_accessed
+            )
+            if len(self._access_buffer) >= self.ACCESS_FLUSH_EVERY:
+                self.flush_access()
+            else:
+                _PENDING_ACCESS_STORES.add(self)
+        
+        return chunk
+    
+    def flush_access(self) -> None:
+        """Write buffered access counters back to their chunk files."""
+        buffered, self._access_buffer = self._access_buffer, {}
+        _PENDING_ACCESS_STORES.discard(self)
+        for chunk_id, (access_count, last_accessed) in buffered.items():
+            chunk_path = self._get_chunk_path(chunk_id)
+            chunk = self._load_chunk(chunk_id, chunk_path)
+            # Skip chunks deleted or already saved with these counters
+            if chunk is None or chunk.metadata.access_count >= access_count:
+                continue
+            chunk.metadata.access_count = access_count
+            chunk.metadata.last_accessed = last_accessed
+            self._write_chunk(chunk_path, chunk)
+    
+    def close(self) -> None:
+        """Flush buffered state to disk."""
+        self.flush_access()
+    
+    def _load_chunk(self, chunk_id: str, chunk_path: Path) -> Optional[Chunk]:
+        """Return a private copy of a chunk, parsing its file only if changed."""
+        try:
+            st = chunk_path.stat()
+        except FileNotFoundError:
+            self._chunk_cache.pop(chunk_id, None)
+            return None
+        
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._chunk_cache.get(chunk_id)
+        if cached is not None and cached[0] == key:
+            self._chunk_cache.move_to_end(chunk_id)
+            return cached[1].copy()
+        
+        try:
+            chunk = Chunk.from_json(chunk_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Corrupted chunk file {chunk_id}: {e}")
             return None
+        self._cache_chunk(key, chunk)
+        return chunk.copy()
+    
+    def _write_chunk(self, chunk_path: Path, chunk: Chunk) -> None:
+        """Write a chunk file and cache what was written."""
+        chunk_path.write_text(chunk.to_json(), encoding="utf-8")
+        st = chunk_path.stat()
+        self._cache_chunk((st.st_mtime_ns, st.st_size), chunk.copy())
+    
+    def _cache_chunk(self, key: Tuple[int, int], chunk: Chunk) -> None:
+        self._chunk_cache[chunk.id] = (key, chunk)
+        self._chunk_cache.move_to_end(chunk.id)
+        if len(self._chunk_cache) > self._cache_size:
+            self._chunk_cache.popitem(last=False)
     
     def update_chunk(self, chunk_id: str, **updates) -> Optional[Chunk]:
         """
@@ -320,15 +602,16 @@ class ChunkStore:
         
         # Write back
         chunk_path = self._get_chunk_path(chunk_id)
-        chunk_path.write_text(chunk.to_json(), encoding="utf-8")
+        self._write_chunk(chunk_path, chunk)
         
         # Update indexes
         if "tags" in updates:
             new_tags = set(chunk.tags)
-            for tag in old_tags - new_tags:
-                self.tag_index.remove_from_list(tag, chunk_id)
-            for tag in new_tags - old_tags:
-                self.tag_index.add_to_list(tag, chunk_id)
+            with self.tag_index:
+                for tag in old_tags - new_tags:
+                    self.tag_index.remove_from_list(tag, chunk_id)
+                for tag in new_tags - old_tags:
+                    self.tag_index.add_to_list(tag, chunk_id)
         
         logger.info(f"Updated chunk {chunk_id}")
         return chunk
@@ -349,21 +632,26 @@ class ChunkStore:
         
         chunk_path = self._get_chunk_path(chunk_id)
         
-        if not chunk_path.exists():
+        try:
+            if permanent:
+                # Permanent deletion
+                chunk_path.unlink()
+                logger.info(f"Permanently deleted chunk {chunk_id}")
+            else:
+                # Soft delete - move to archive
+                archive_path = self.archive_path / f"{chunk_id}.json"
+                shutil.move(str(chunk_path), str(archive_path))
+                logger.info(f"Archived chunk {chunk_id}")
+        except FileNotFoundError:
             return False
         
-        if permanent:
-            # Permanent deletion
-            chunk_path.unlink()
-            logger.info(f"Permanently deleted chunk {chunk_id}")
-        else:
-            # Soft delete - move to archive
-            archive_path = self.archive_path / f"{chunk_id}.json"
-            shutil.move(str(chunk_path), str(archive_path))
-            logger.info(f"Archived chunk {chunk_id}")
-        
         # Update indexes
+        self._chunk_cache.pop(chunk_id, None)
+        self._access_buffer.pop(chunk_id, None)
+        meta = self.metadata_index.get(chunk_id)
         self.metadata_index.remove(chunk_id)
+        if self._listing is not None:
+            self._listing.remove(chunk_id, meta)
         # Note: tag_index cleanup would require reading the chunk first
         
         return True
@@ -378,11 +666,25 @@ class ChunkStore:
         Returns:
             List of matching chunk IDs
         """
-        # Start with all chunks from metadata index
-        all_chunks = self.metadata_index.get_all_keys()
+        # Date bounds as epoch microseconds; naive bounds keep the
+        # datetime comparison (and its naive-vs-aware TypeError)
+        after_us = _aware_us(created_after) if created_after else None
+        before_us = _aware_us(created_before) if created_before else None
+        dated = bool(created_after or created_before)
+        indexed = (dated
+                   and (not created_after or after_us is not None)
+                   and (not created_before or before_us is not None))
+        
+        if conversation_id or tags or indexed:
+            listing = self._listing_index()
+            candidates = self._filter_candidates(listing, conversation_id, tags,
+                                                 after_us, before_us)
+        else:
+            listing = None
+            candidates = self.metadata_index.get_all_keys()
         result = []
         
-        for chunk_id in all_chunks:
+        for chunk_id in candidates:
             metadata = self.metadata_index.get(chunk_id)
             if not metadata:
                 continue
@@ -392,31 +694,68 @@ class ChunkStore:
                 continue
             
             # Filter by date
-            created_str = metadata.get("created", "")
-            if created_str:
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                if created_after and created < created_after:
-                    continue
-                if created_before and created > created_before:
-                    continue
+            if dated:
+                created_us = listing.created_us[chunk_id] if indexed else _UNINDEXED
+                if created_us is _UNINDEXED:
+                    created_str = metadata.get("created", "")
+                    if created_str:
+                        created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                        if created_after and created < created_after:
+                            continue
+                        if created_before and created > created_before:
+                            continue
+                elif created_us is not None:
+                    if after_us is not None and created_us < after_us:
+                        continue
+                    if before_us is not None and created_us > before_us:
+                        continue
             
             result.append(chunk_id)
         
-        # Filter by tags (intersection - must have ALL tags)
-        if tags:
-            # Start with chunks that have the first tag
-            tag_matches = set(self.tag_index.get_list(tags[0]))
-            # Intersect with each additional tag
-            for tag in tags[1:]:
-                tag_matches &= set(self.tag_index.get_list(tag))
-            result = [cid for cid in result if cid in tag_matches]
-        
         return result
     
+    def _filter_candidates(self, listing: _ListingIndex,
+                           conversation_id: Optional[str],
+                           tags: Optional[List[str]],
+                           after_us: Optional[int],
+                           before_us: Optional[int]) -> List[str]:
+        """
+        Chunk IDs that can match the filters, in listing order, looked up
+        in the conversation, tag and creation-time indexes.
+        """
+        if conversation_id:
+            candidates = listing.by_conversation.get(conversation_id, [])
+        elif not tags:
+            return listing.created_between(after_us, before_us)
+        if not tags:
+            return list(candidates)
+        
+        # Intersection - must have ALL tags
+        tag_matches = set(self.tag_index.get_list(tags[0]))
+        for tag in tags[1:]:
+            tag_matches &= set(self.tag_index.get_list(tag))
+        if conversation_id:
+            return [cid for cid in candidates if cid in tag_matches]
+        # Tag lists can still name deleted chunks
+        return listing.in_order(tag_matches)
+    
+    def _listing_index(self) -> _ListingIndex:
+        """Build the derived listing index from metadata_index on first use."""
+        if self._listing is None:
+            listing = _ListingIndex()
+            for chunk_id in self.metadata_index.get_all_keys():
+                listing.add(chunk_id, self.metadata_index.get(chunk_id))
+            self._listing = listing
+        return self._listing
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
         total_chunks = len(self.metadata_index.get_all_keys())
-        archived_chunks = len(list(self.archive_path.glob("*.json")))
+        try:
+            with os.scandir(self.archive_path) as entries:
+                archived_chunks = sum(1 for entry in entries if entry.name.endswith(".json"))
+        except FileNotFoundError:
+            archived_chunks = 0
         
         # Count by type
         type_counts = {}
@@ -438,72 +777,204 @@ class ChunkIndex:
     """
     Simple JSON-based index for fast lookups.
     
-    Maintains an in-memory cache with periodic disk persistence.
+    Maintains an in-memory cache persisted as a JSON snapshot plus an
+    append-only operation log (``<name>.log``, one JSON line per mutation).
+    The files are read on first access, not at construction. Each mutation
+    is appended (and fsynced) immediately unless made inside a
+    ``with index:`` block, in which case the block's operations are appended
+    once when the outermost block exits. A last log line torn by a crash is
+    skipped on load, and the next append starts on a fresh line after it.
+    Once the log outgrows the snapshot, compact() folds it into a new
+    snapshot.
     """
     
+    # Log size below which the log is never compacted
+    COMPACT_MIN_LOG_BYTES = 64 * 1024
+    
     def __init__(self, index_path: Path):
         self.index_path = Path(index_path)
+        self.log_path = self.index_path.with_suffix(".log")
         self._cache: Dict[str, Any] = {}
         self._list_indexes: Dict[str, Set[str]] = {}  # For tag -> chunks mapping
-        self._load()
+        self._loaded = False
+        self._parent_ready = False
+        self._pending_ops: List[Dict[str, Any]] = []
+        self._batch_depth = 0
+        self._snapshot_size = 0
+        self._log_size = 0
+    
+    def __enter__(self) -> "ChunkIndex":
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
     
     def _load(self):
-        """Load index from disk."""
+        """Load the snapshot from disk, then replay the operation log."""
+        self._loaded = True
         if self.index_path.exists():
             try:
-                data = json.loads(self.index_path.read_text(encoding="utf-8"))
+                raw = self.index_path.read_bytes()
+                data = _loads_json(raw)
                 self._cache = data.get("entries", {})
                 self._list_indexes = {
                     k: set(v) for k, v in data.get("lists", {}).items()
                 }
+                self._snapshot_size = len(raw)
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Could not load index {self.index_path}: {e}")
                 self._cache = {}
                 self._list_indexes = {}
+        
+        try:
+            with self.log_path.open("rb") as handle:
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        # Torn by a crash mid-append (or still being written
+                        # by another process); never rewritten here, flush()
+                        # starts its own entries on a fresh line
+                        logger.warning(
+                            f"Skipping incomplete last entry in {self.log_path}"
+                        )
+                        break
+                    self._log_size += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply(_loads_json(line))
+                    except (ValueError, TypeError, KeyError) as e:
+                        logger.warning(f"Skipping bad entry in {self.log_path}: {e}")
+        except FileNotFoundError:
+            pass
+    
+    def _apply(self, op: Dict[str, Any]):
+        """Replay one logged operation onto the in-memory index."""
+        kind, key = op["op"], op["k"]
+        if kind == "add":
+            self._cache[key] = op.get("v")
+        elif kind == "remove":
+            self._cache.pop(key, None)
+        elif kind == "list_add":
+            self._list_indexes.setdefault(key, set()).add(op["v"])
+        elif kind == "list_remove":
+            if key in self._list_indexes:
+                self._list_indexes[key].discard(op["v"])
+    
+    def _ensure_parent(self):
+        if not self._parent_ready:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
     
     def _save(self):
-        """Persist index to disk."""
+        """Write a full snapshot, atomically replacing the previous file."""
         data = {
             "entries": self._cache,
             "lists": {k: list(v) for k, v in self._list_indexes.items()},
             "updated": datetime.utcnow().isoformat() + "Z"
         }
-        self.index_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        try:
+            raw = _dumps_json(data).encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates: keep them as \u escapes
+            raw = json.dumps(data, indent=2).encode("ascii")
+        self._ensure_parent()
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(raw)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.index_path)
+        self._snapshot_size = len(raw)
+    
+    def _log(self, op: Dict[str, Any]):
+        """Record a mutation; append it now unless inside a batch."""
+        self._pending_ops.append(op)
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """Append pending mutations to the log, compacting it if it has grown."""
+        if not self._pending_ops:
+            return
+        self._ensure_parent()
+        payload = b"".join(_dumps_log_line(op) for op in self._pending_ops)
+        with self.log_path.open("a+b") as handle:
+            # Don't extend a line torn by a crash: that would merge it with
+            # our first entry and lose both on the next load
+            end = handle.seek(0, os.SEEK_END)
+            if end:
+                handle.seek(end - 1)
+                if handle.read(1) != b"\n":
+                    payload = b"\n" + payload
+            handle.write(payload)
+            # Same durability as the snapshot written by compact()
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending_ops = []
+        self._log_size += len(payload)
+        if self._log_size > max(self._snapshot_size * 2, self.COMPACT_MIN_LOG_BYTES):
+            self.compact()
+    
+    def compact(self):
+        """Fold the operation log into a fresh snapshot and drop the log."""
+        if not self._loaded:
+            self._load()
+        self._save()
+        self._pending_ops = []
+        self.log_path.unlink(missing_ok=True)
+        self._log_size = 0
     
     def add(self, key: str, value: Any):
         """Add entry to index."""
+        if not self._loaded:
+            self._load()
         self._cache[key] = value
-        self._save()
+        self._log({"op": "add", "k": key, "v": value})
     
     def get(self, key: str) -> Optional[Any]:
         """Get entry by key."""
+        if not self._loaded:
+            self._load()
         return self._cache.get(key)
     
     def remove(self, key: str):
         """Remove entry from index."""
+        if not self._loaded:
+            self._load()
         if key in self._cache:
             del self._cache[key]
-            self._save()
+            self._log({"op": "remove", "k": key})
     
     def get_all_keys(self) -> List[str]:
         """Get all keys in index."""
+        if not self._loaded:
+            self._load()
         return list(self._cache.keys())
     
     def add_to_list(self, list_key: str, item: str):
         """Add item to a list index (e.g., tag -> chunks)."""
+        if not self._loaded:
+            self._load()
         if list_key not in self._list_indexes:
             self._list_indexes[list_key] = set()
         self._list_indexes[list_key].add(item)
-        self._save()
+        self._log({"op": "list_add", "k": list_key, "v": item})
     
     def remove_from_list(self, list_key: str, item: str):
         """Remove item from a list index."""
+        if not self._loaded:
+            self._load()
         if list_key in self._list_indexes:
             self._list_indexes[list_key].discard(item)
-            self._save()
+            self._log({"op": "list_remove", "k": list_key, "v": item})
     
     def get_list(self, list_key: str) -> List[str]:
         """Get all items in a list."""
+        if not self._loaded:
+            self._load()
         return list(self._list_indexes.get(list_key, []))
 
 
@@ -6,26 +6,139 @@ Usage:
 """
 
 import argparse
-import json
 import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from .layered_memory_store import LayeredMemoryStore
     from .memory_policy import MemoryPolicy
-    from .layered_adapter import LayeredChunkStoreAdapter
+    from .memory_schema import loads_json_line
 except ImportError:
     # Allow running as script
     sys.path.append(str(Path.cwd()))
     from brain.scripts.layered_memory_store import LayeredMemoryStore
     from brain.scripts.memory_policy import MemoryPolicy
-    from brain.scripts.layered_adapter import LayeredChunkStoreAdapter
+    from brain.scripts.memory_schema import loads_json_line
 
-def migrate_chunks(src_dir: Path, dest_layer: str, default_scope: str, dry_run: bool = False, backup: bool = False):
+# Records written per append + fsync while migrating
+MIGRATION_BATCH_SIZE = 1000
+
+# Below this many files, worker start-up costs more than the parsing saves
+MIGRATION_PARALLEL_MIN_FILES = 256
+
+# Paths handed to the worker pool at a time, so queued work stays bounded
+MIGRATION_PARSE_WINDOW = 4096
+
+# Minimum seconds between progress line redraws
+MIGRATION_PROGRESS_INTERVAL = 0.2
+
+def _transform(
+    path_str: str, default_scope: str, fallback_created: str
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Read one legacy chunk file and map it to the layered record schema.
+    Chunks without a created_at get `fallback_created`, the run's start time.
+
+    Returns (record, None) or (None, error); runs in worker processes, so
+    failures come back as values rather than raising out of the pool.
+    """
+    try:
+        data = loads_json_line(Path(path_str).read_bytes())
+        meta = data.get("metadata", {})
+
+        # Map legacy fields to new schema
+        return {
+            "id": data.get("id"),
+            "content": data.get("content"),
+            "entry_type": data.get("type", "note"),
+            "scope": default_scope,
+            "project_id": "rlm-mem", # Default
+            "tags": data.get("tags", []),
+            "created_at": meta.get("created_at", fallback_created),
+            "metadata": {
+                "migrated_from": path_str,
+                "original_metadata": meta
+            }
+        }, None
+    except Exception as e:
+        return None, str(e)
+
+def _transform_all(
+    files: Iterable[Path], default_scope: str, fallback_created: str, workers: Optional[int]
+) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """
+    Yield (path, record, error) per file in order, fanning out to worker
+    processes for large runs. `files` is consumed lazily.
+    """
+    paths = map(str, files)
+    head = list(islice(paths, MIGRATION_PARALLEL_MIN_FILES))
+    if workers == 1 or len(head) < MIGRATION_PARALLEL_MIN_FILES:
+        for path_str in chain(head, paths):
+            yield (path_str,) + _transform(path_str, default_scope, fallback_created)
+        return
+    paths = chain(head, paths)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        # Executor.map submits its whole input up front, so feed it in windows
+        while window := list(islice(paths, MIGRATION_PARSE_WINDOW)):
+            results = ex.map(
+                _transform, window,
+                [default_scope] * len(window), [fallback_created] * len(window),
+                chunksize=64,
+            )
+            for path_str, result in zip(window, results):
+                yield (path_str,) + result
+
+def _write_batch(
+    store: LayeredMemoryStore, dest_layer: str, batch: List[Tuple[str, Dict]]
+) -> Tuple[int, int]:
+    """
+    Write (path, record) pairs with one append + fsync; return (migrated, errors).
+
+    A record that fails validation aborts the batch before anything is
+    written, so the batch is retried record by record to pin it down. A
+    failed write fails the whole batch: none of it is counted as migrated.
+    """
+    try:
+        store.append_entries(dest_layer, [record for _, record in batch])
+        return len(batch), 0
+    except ValueError:
+        pass
+    except Exception as e:
+        print(f"\nFailed to write {len(batch)} chunks ({batch[0][0]} .. {batch[-1][0]}): {e}")
+        return 0, len(batch)
+
+    migrated = errors = 0
+    for file_path, record in batch:
+        try:
+            store.append_entries(dest_layer, [record])
+            migrated += 1
+        except Exception as e:
+            print(f"\nFailed to migrate {file_path}: {e}")
+            errors += 1
+    return migrated, errors
+
+def migrate_chunks(
+    src_dir: Path,
+    dest_layer: str,
+    default_scope: str,
+    dry_run: bool = False,
+    backup: bool = False,
+    workers: Optional[int] = None,
+):
     """
     Migrate legacy JSON chunks to layered store with idempotency and safety rails.
+    
+    Records are group-committed MIGRATION_BATCH_SIZE at a time rather than
+    fsynced one by one, and only count as migrated once their batch is
+    written. Files are parsed across `workers` processes (default:
+    one per CPU) once there are MIGRATION_PARALLEL_MIN_FILES of them; writes
+    stay in this process and in file order.
     """
     if not src_dir.exists():
         print(f"Error: Source directory {src_dir} does not exist.")
@@ -39,7 +152,6 @@ def migrate_chunks(src_dir: Path, dest_layer: str, default_scope: str, dry_run:
         policy.write_layers.append(dest_layer)
         
     store = LayeredMemoryStore(policy=policy, agent_id="migration-tool")
-    adapter = LayeredChunkStoreAdapter(store)
     
     # 0. Backup destination if requested
     if backup and not dry_run:
@@ -50,60 +162,60 @@ def migrate_chunks(src_dir: Path, dest_layer: str, default_scope: str, dry_run:
             print(f"Backing up destination {dest_layer} to {backup_path}")
             shutil.copy2(dest_path, backup_path)
 
-    # 1. Load existing IDs to prevent duplicates (Idempotency)
-    existing_chunks = set(adapter.list_chunks())
+    # 1. Load existing IDs to prevent duplicates (Idempotency); the store's
+    # id index answers this without loading every record
+    existing_chunks = store.record_ids()
     print(f"Loaded {len(existing_chunks)} existing chunks for deduplication.")
 
     count = 0
     skipped = 0
     errors = 0
     
-    # Find all JSON files in subdirectories (e.g. 2026-02/chunk-*.json)
-    files = list(src_dir.rglob("chunk-*.json"))
-    print(f"Found {len(files)} legacy chunks to migrate.")
+    # Walk all JSON files in subdirectories (e.g. 2026-02/chunk-*.json) lazily
+    files = src_dir.rglob("chunk-*.json")
+    print(f"Migrating legacy chunks from {src_dir}...")
 
     if dry_run:
         print("--- DRY RUN MODE: No writes will be performed ---")
 
-    for file_path in files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            data = json.loads(content)
-            
-            chunk_id = data.get("id")
-            
-            # Idempotency Check
-            if chunk_id in existing_chunks:
-                skipped += 1
-                continue
-
-            # Map legacy fields to new schema
-            record = {
-                "id": chunk_id,
-                "content": data.get("content"),
-                "entry_type": data.get("type", "note"),
-                "scope": default_scope,
-                "project_id": "rlm-mem", # Default
-                "tags": data.get("tags", []),
-                "created_at": data.get("metadata", {}).get("created_at", datetime.utcnow().isoformat() + "Z"),
-                "metadata": {
-                    "migrated_from": str(file_path),
-                    "original_metadata": data.get("metadata", {})
-                }
-            }
-            
-            if not dry_run:
-                store.append_entry(dest_layer, record)
-            else:
-                print(f"[DRY RUN] Would migrate {chunk_id}")
-            
-            count += 1
-            if count % 10 == 0 and not dry_run:
-                print(f"Migrated {count} chunks...", end="\r")
-                
-        except Exception as e:
-            print(f"\nFailed to migrate {file_path}: {e}")
+    # One fallback timestamp for the whole run rather than a clock read per record
+    fallback_created = datetime.utcnow().isoformat() + "Z"
+    last_progress = time.monotonic()
+    batch: List[Tuple[str, Dict]] = []
+
+    for file_path, record, error in _transform_all(files, default_scope, fallback_created, workers):
+        if error is not None:
+            print(f"\nFailed to migrate {file_path}: {error}")
             errors += 1
+            continue
+        chunk_id = record["id"]
+        
+        # Idempotency Check
+        if chunk_id is not None and str(chunk_id) in existing_chunks:
+            skipped += 1
+            continue
+        
+        if dry_run:
+            print(f"[DRY RUN] Would migrate {chunk_id}")
+            count += 1
+            continue
+        
+        batch.append((file_path, record))
+        if len(batch) >= MIGRATION_BATCH_SIZE:
+            migrated, failed = _write_batch(store, dest_layer, batch)
+            count += migrated
+            errors += failed
+            batch = []
+            now = time.monotonic()
+            if now - last_progress >= MIGRATION_PROGRESS_INTERVAL:
+                print(f"Migrated {count} chunks...", end="\r", flush=True)
+                last_progress = now
+
+    if batch:
+        # Write out the final partial batch
+        migrated, failed = _write_batch(store, dest_layer, batch)
+        count += migrated
+        errors += failed
 
     print(f"\nMigration complete.")
     if dry_run:
@@ -120,10 +232,14 @@ def main():
     parser.add_argument("--scope", default="project_global", help="Scope label for records")
     parser.add_argument("--dry-run", action="store_true", help="Do not write changes")
     parser.add_argument("--backup", action="store_true", help="Back up destination file before writing")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: one per CPU)")
     
     args = parser.parse_args()
     
-    migrate_chunks(Path(args.src), args.layer, args.scope, dry_run=args.dry_run, backup=args.backup)
+    migrate_chunks(
+        Path(args.src), args.layer, args.scope,
+        dry_run=args.dry_run, backup=args.backup, workers=args.workers,
+    )
 
 if __name__ == "__main__":
     main()
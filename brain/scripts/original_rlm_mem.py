@@ -6,10 +6,52 @@ Reads personalities, sliders, and generates LIVEHUD output.
 import re
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
+# Personality file patterns
+_TITLE_RE = re.compile(r'^# (.+?) — (.+)$', re.MULTILINE)
+_DESC_RE = re.compile(r'^> (.+)$', re.MULTILINE)
+_TRAITS_SECTION_RE = re.compile(r'## Core Traits(.*?)(?=## Anti|\Z)', re.DOTALL)
+_TRAIT_HEADER_RE = re.compile(r'### (.+?)\n')
+_ANTI_RE = re.compile(
+    r'## Anti-Patterns.*?\n\n\|[^|]+\|[^|]+\|\n\|[-:| ]+\|\n((?:\|[^|]+\|[^|]+\|\n)+)'
+)
+_ANTI_ROW_RE = re.compile(r'\|([^|\n]+)\|([^|\n]+)\|')
+
+# Slider file patterns
+_RANGE_RE = re.compile(r'Slider Range:\s*(\d+)%.*?→\s*(\d+)%')
+_DEFAULT_RE = re.compile(r'## Default:\s*(\d+)%')
+_CORE_FN_RE = re.compile(r'## Core Function\n\n(.+?)(?=\n\n|\Z)', re.DOTALL)
+_CAL_RE = re.compile(
+    r'## Calibration Levels.*?\n\n\|[^|]+\|[^|]+\|[^|]+\|\n\|[-:| ]+\|\n((?:\|[^|]+\|[^|]+\|[^|]+\|\n)+)'
+)
+_CAL_ROW_RE = re.compile(r'\|([^|\n]+)\|([^|\n]+)\|([^|\n]+)\|')
+
+# Slider commands, tried left to right at the start of the command:
+# "set [slider] to [X]", "[slider] at [X]", "max [slider]", "min [slider]"
+_SLIDER_CMD_RE = re.compile(
+    r'set\s+(?P<set_name>\w+)\s+to\s+(?P<set_value>\d+)'
+    r'|(?P<at_name>\w+)\s+at\s+(?P<at_value>\d+)'
+    r'|max\s+(?P<max_name>\w+)'
+    r'|min\s+(?P<min_name>\w+)'
+)
+
+# Static LIVEHUD frame lines (80 columns)
+_HUD_TOP = "╔" + "═" * 78 + "╗"
+_HUD_MID = "╠" + "═" * 78 + "╣"
+_HUD_BOT = "╚" + "═" * 78 + "╝"
+_HUD_EMPTY = "║" + " " * 78 + "║"
+
+
+@lru_cache(maxsize=256)
+def _bar(filled: int, width: int) -> str:
+    """Bar with `filled` of `width` cells filled; cached, as few bars are distinct."""
+    return "█" * filled + "░" * (width - filled)
+
+
 @dataclass
 class SliderConfig:
     """Represents a RLM-MEM slider configuration."""
@@ -24,8 +66,7 @@ class SliderConfig:
     
     def to_bar(self, width: int = 16) -> str:
         """Generate visual progress bar."""
-        filled = int((self.current / 100) * width)
-        return "█" * filled + "░" * (width - filled)
+        return _bar(int((self.current / 100) * width), width)
 
 
 @dataclass
@@ -86,6 +127,8 @@ class RLMMEMConfig:
         self.memory = MemoryProtocol()
         self.system = SystemState()
         self.personalities: Dict[str, PersonalityMode] = {}
+        # (state key, rendered HUD) from the last generate_livehud() call
+        self._hud_cache: Optional[Tuple[tuple, str]] = None
         self._load_personalities()
         self._load_sliders()
     
@@ -100,26 +143,19 @@ class RLMMEMConfig:
             content = md_file.read_text(encoding='utf-8')
             
             # Parse title
-            title_match = re.search(r'^# (.+?) — (.+)$', content, re.MULTILINE)
+            title_match = _TITLE_RE.search(content)
             title = title_match.group(2) if title_match else name
             
             # Parse description
-            desc_match = re.search(r'^> (.+)$', content, re.MULTILINE)
+            desc_match = _DESC_RE.search(content)
             description = desc_match.group(1) if desc_match else ""
             
             # Parse core traits
             traits = []
-            traits_section = re.search(
-                r'## Core Traits(.*?)(?=## Anti|\Z)', 
-                content, 
-                re.DOTALL
-            )
+            traits_section = _TRAITS_SECTION_RE.search(content)
             if traits_section:
                 # Find ### headers for each trait
-                trait_headers = re.findall(
-                    r'### (.+?)\n', 
-                    traits_section.group(1)
-                )
+                trait_headers = _TRAIT_HEADER_RE.findall(traits_section.group(1))
                 for header in trait_headers:
                     traits.append({
                         'name': header.strip(),
@@ -128,16 +164,12 @@ class RLMMEMConfig:
             
             # Parse anti-patterns
             anti_patterns = []
-            anti_section = re.search(
-                r'## Anti-Patterns.*?\n\n\|[^|]+\|[^|]+\|\n\|[-:| ]+\|\n((?:\|[^|]+\|[^|]+\|\n)+)',
-                content
-            )
+            anti_section = _ANTI_RE.search(content)
             if anti_section:
-                rows = anti_section.group(1).strip().split('\n')
-                for row in rows:
-                    cells = [c.strip() for c in row.split('|')[1:-1]]
-                    if len(cells) >= 2 and not cells[0].startswith('---'):
-                        anti_patterns.append((cells[0], cells[1]))
+                for row in _ANTI_ROW_RE.finditer(anti_section.group(1)):
+                    pattern = row.group(1).strip()
+                    if not pattern.startswith('---'):
+                        anti_patterns.append((pattern, row.group(2).strip()))
             
             self.personalities[name] = PersonalityMode(
                 name=name,
@@ -162,40 +194,31 @@ class RLMMEMConfig:
             slider = self.sliders[name]
             
             # Parse range
-            range_match = re.search(
-                r'Slider Range:\s*(\d+)%.*?→\s*(\d+)%', 
-                content
-            )
+            range_match = _RANGE_RE.search(content)
             if range_match:
                 slider.range_min = int(range_match.group(1))
                 slider.range_max = int(range_match.group(2))
             
             # Parse default
-            default_match = re.search(r'## Default:\s*(\d+)%', content)
+            default_match = _DEFAULT_RE.search(content)
             if default_match:
                 slider.default = int(default_match.group(1))
                 slider.current = slider.default
             
             # Parse description
-            desc_match = re.search(
-                r'## Core Function\n\n(.+?)(?=\n\n|\Z)', 
-                content, 
-                re.DOTALL
-            )
+            desc_match = _CORE_FN_RE.search(content)
             if desc_match:
                 slider.description = desc_match.group(1).strip()
             
             # Parse calibration levels
-            cal_match = re.search(
-                r'## Calibration Levels.*?\n\n\|[^|]+\|[^|]+\|[^|]+\|\n\|[-:| ]+\|\n((?:\|[^|]+\|[^|]+\|[^|]+\|\n)+)',
-                content
-            )
+            cal_match = _CAL_RE.search(content)
             if cal_match:
-                rows = cal_match.group(1).strip().split('\n')
-                for row in rows:
-                    cells = [c.strip() for c in row.split('|')[1:-1]]
-                    if len(cells) >= 3 and not cells[0].startswith('---'):
-                        slider.calibration_levels.append((cells[0], cells[1], cells[2]))
+                for row in _CAL_ROW_RE.finditer(cal_match.group(1)):
+                    level = row.group(1).strip()
+                    if not level.startswith('---'):
+                        slider.calibration_levels.append(
+                            (level, row.group(2).strip(), row.group(3).strip())
+                        )
     
     def set_mode(self, mode: str):
         """Switch to a personality mode."""
@@ -204,6 +227,7 @@ class RLMMEMConfig:
             raise ValueError(f"Unknown mode: {mode}. Available: {list(self.PERSONALITY_PRESETS.keys())}")
         
         self.current_mode = mode
+        self._hud_cache = None
         adjustments = self.PERSONALITY_PRESETS[mode]
         
         # Reset to defaults first
@@ -222,54 +246,73 @@ class RLMMEMConfig:
             raise ValueError(f"Unknown slider: {name}. Available: {list(self.sliders.keys())}")
         
         self.sliders[key].current = max(0, min(100, value))
+        self._hud_cache = None
+    
+    def _state_key(self) -> tuple:
+        """Everything the LIVEHUD renders, for detecting unchanged state."""
+        memory, system = self.memory, self.system
+        return (
+            self.current_mode,
+            tuple((s.name, s.emoji, s.current, s.default) for s in self.sliders.values()),
+            memory.past, memory.present, memory.future,
+            system.context, system.tools, system.memory_files,
+            system.pending_writes, system.vibe,
+        )
     
     def generate_livehud(self) -> str:
-        """Generate the LIVEHUD gauge dashboard."""
+        """
+        Generate the LIVEHUD gauge dashboard.
+        
+        The last rendering is reused while the state it shows is unchanged,
+        including after direct edits to sliders, memory or system fields.
+        """
+        state = self._state_key()
+        if self._hud_cache is not None and self._hud_cache[0] == state:
+            return self._hud_cache[1]
+        
         lines = [
-            "╔══════════════════════════════════════════════════════════════════════════════╗",
+            _HUD_TOP,
             f"║  ◈ RLM-MEM LIVEHUD ◈                                                        ║",
             f"║  Session: Active  │  Mode: {self.current_mode:<20}                   ║",
-            "╠══════════════════════════════════════════════════════════════════════════════╣",
-            "║                                                                              ║",
+            _HUD_MID,
+            _HUD_EMPTY,
             "║  ▸ COGNITIVE SLIDERS                              Current   Default          ║",
             "║  │                                                                           ║",
-        ]
-        
-        # Add sliders
-        for key, slider in self.sliders.items():
-            bar = slider.to_bar(16)
-            lines.append(
-                f"║  ├─ {slider.emoji} {slider.name:<11} [{bar}]       {slider.current:>3}%      {slider.default:>3}%             ║"
-            )
-        
-        # Memory protocol
-        lines.extend([
-            "║                                                                              ║",
-            "╠══════════════════════════════════════════════════════════════════════════════╣",
-            "║                                                                              ║",
+            # Sliders
+            *(
+                f"║  ├─ {slider.emoji} {slider.name:<11} [{slider.to_bar(16)}]       {slider.current:>3}%      {slider.default:>3}%             ║"
+                for slider in self.sliders.values()
+            ),
+            # Memory protocol
+            _HUD_EMPTY,
+            _HUD_MID,
+            _HUD_EMPTY,
             "║  ▸ MEMORY PROTOCOL                                                           ║",
             "║  │                                                                           ║",
-            f"║  ├─ 🧠 Past:    [{self._truncate(self.memory.past, 47):<47}] ║",
-            f"║  ├─ 👁️ Present: [{self._truncate(self.memory.present, 47):<47}] ║",
-            f"║  └─ 🔮 Future:  [{self._truncate(self.memory.future, 47):<47}] ║",
-            "║                                                                              ║",
-            "╠══════════════════════════════════════════════════════════════════════════════╣",
-            "║                                                                              ║",
+            f"║  ├─ 🧠 Past:    [{self._fit(self.memory.past, 47)}] ║",
+            f"║  ├─ 👁️ Present: [{self._fit(self.memory.present, 47)}] ║",
+            f"║  └─ 🔮 Future:  [{self._fit(self.memory.future, 47)}] ║",
+            _HUD_EMPTY,
+            _HUD_MID,
+            _HUD_EMPTY,
             "║  ▸ SYSTEM STATE                                                              ║",
             "║  │                                                                           ║",
             f"║  ├─ 💾 Context: [{self.system.context:<10}] │ 🔧 Tools: [{self.system.tools:<15}]        ║",
             f"║  ├─ 📂 Memory:  [{self.system.memory_files:>3} files loaded] │ [{self.system.pending_writes:>3} pending write]                         ║",
             f"║  └─ ⚡ Vibe:    [{self.system.vibe:<47}] ║",
-            "║                                                                              ║",
-            "╚══════════════════════════════════════════════════════════════════════════════╝",
-        ])
+            _HUD_EMPTY,
+            _HUD_BOT,
+        ]
         
-        return '\n'.join(lines)
+        hud = '\n'.join(lines)
+        self._hud_cache = (state, hud)
+        return hud
     
-    def _truncate(self, text: str, width: int) -> str:
-        """Truncate text to fit in LIVEHUD width."""
+    @staticmethod
+    def _fit(text: str, width: int) -> str:
+        """Pad or truncate text to exactly `width` LIVEHUD columns."""
         if len(text) <= width:
-            return text
+            return text.ljust(width)
         return text[:width-3] + "..."
     
     def get_personality_summary(self, mode: Optional[str] = None) -> str:
@@ -308,29 +351,18 @@ class RLMMEMConfig:
 
 def parse_slider_command(command: str) -> Optional[Tuple[str, int]]:
     """Parse a slider adjustment command."""
-    command = command.lower().strip()
-    
-    # "Set [slider] to [X]%"
-    match = re.match(r'set\s+(\w+)\s+to\s+(\d+)', command)
-    if match:
-        return (match.group(1), int(match.group(2)))
-    
-    # "[Slider] at [X]%"
-    match = re.match(r'(\w+)\s+at\s+(\d+)', command)
-    if match:
-        return (match.group(1), int(match.group(2)))
-    
-    # "Max [slider]"
-    match = re.match(r'max\s+(\w+)', command)
-    if match:
-        return (match.group(1), 100)
-    
-    # "Min [slider]"
-    match = re.match(r'min\s+(\w+)', command)
-    if match:
-        return (match.group(1), 0)
+    match = _SLIDER_CMD_RE.match(command.lower().strip())
+    if match is None:
+        return None
     
-    return None
+    kind = match.lastgroup
+    if kind == "set_value":
+        return (match.group("set_name"), int(match.group("set_value")))
+    if kind == "at_value":
+        return (match.group("at_name"), int(match.group("at_value")))
+    if kind == "max_name":
+        return (match.group("max_name"), 100)
+    return (match.group("min_name"), 0)
 
 
 # Convenience functions
@@ -5,6 +5,7 @@ High-level memory analysis and synthesis using RLM.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
+import re
 import time
 
 # Handle both relative and direct imports
@@ -16,6 +17,11 @@ except ImportError:
     from recall_operation import RecallOperation, RecallResult
 
 
+# Case-insensitive insight cues, matched without lower-casing the content
+_PREFER_RE = re.compile("prefer", re.IGNORECASE)
+_LIKE_RE = re.compile("like", re.IGNORECASE)
+
+
 @dataclass
 class ReasonResult:
     """Result of a REASON operation."""
@@ -304,9 +310,9 @@ class ReasonOperation:
         
         # Simple insight extraction - look for patterns
         for content in contents:
-            if "prefer" in content.lower():
+            if _PREFER_RE.search(content):
                 insights.append(f"Preference identified: {content[:100]}...")
-            if "like" in content.lower():
+            if _LIKE_RE.search(content):
                 insights.append(f"Positive sentiment: {content[:100]}...")
         
         # Remove duplicates while preserving order
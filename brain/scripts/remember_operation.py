@@ -10,6 +10,7 @@ REMEMBER is the high-level operation that:
 - Returns confirmation
 """
 
+from contextlib import ExitStack, contextmanager
 from typing import List, Optional
 
 try:
@@ -43,6 +44,43 @@ class RememberOperation:
         # Note: AutoLinker expects a store that behaves like ChunkStore
         self.linker = linker or AutoLinker(store)
     
+    @staticmethod
+    def validate(content: str, conversation_id: str, confidence: float = 0.7,
+                 chunk_type: str = None) -> bool:
+        """
+        Check remember() arguments without storing anything.
+        
+        Returns:
+            False if content is empty or whitespace-only, True otherwise
+        
+        Raises:
+            ValueError: For invalid inputs
+            TypeError: For None content
+        """
+        if content is None:
+            raise TypeError("Content cannot be None")
+        
+        if not isinstance(content, str):
+            raise TypeError(f"Content must be string, got {type(content).__name__}")
+        
+        if not conversation_id:
+            raise ValueError("conversation_id is required")
+        
+        # Empty content is reported by remember(), not raised
+        if not content.strip():
+            return False
+        
+        # Validate confidence
+        if not 0.0 <= confidence <= 1.0:
+            raise ValueError(f"Confidence must be between 0.0 and 1.0, got {confidence}")
+        
+        # Validate type override if provided
+        if chunk_type is not None:
+            valid_types = [t.value for t in ChunkType]
+            if chunk_type not in valid_types:
+                raise ValueError(f"Invalid chunk_type: {chunk_type}. Must be one of: {valid_types}")
+        return True
+    
     def remember(self, content: str, conversation_id: str,
                  tags: list = None, confidence: float = 0.7,
                  chunk_type: str = None) -> dict:
@@ -68,17 +106,7 @@ class RememberOperation:
             TypeError: For None content
         """
         # Validation - CRITICAL
-        if content is None:
-            raise TypeError("Content cannot be None")
-        
-        if not isinstance(content, str):
-            raise TypeError(f"Content must be string, got {type(content).__name__}")
-        
-        if not conversation_id:
-            raise ValueError("conversation_id is required")
-        
-        # Check for empty or whitespace-only content
-        if not content.strip():
+        if not self.validate(content, conversation_id, confidence, chunk_type):
             return {
                 "success": False,
                 "error": "Content is empty or whitespace-only",
@@ -87,16 +115,6 @@ class RememberOperation:
                 "chunks_created": 0
             }
         
-        # Validate confidence
-        if not 0.0 <= confidence <= 1.0:
-            raise ValueError(f"Confidence must be between 0.0 and 1.0, got {confidence}")
-        
-        # Validate type override if provided
-        if chunk_type is not None:
-            valid_types = [t.value for t in ChunkType]
-            if chunk_type not in valid_types:
-                raise ValueError(f"Invalid chunk_type: {chunk_type}. Must be one of: {valid_types}")
-        
         # Step 1: Chunk the content
         chunk_results = self.engine.chunk(content, conversation_id, tags)
         
@@ -110,6 +128,8 @@ class RememberOperation:
             }
         
         # Step 2: Create chunks in store with auto-linking
+        # Stores expect a list; convert the shared tag tuple once
+        tag_list = list(chunk_results[0].tags)
         created_chunks = []
         for result in chunk_results:
             # Use type override if provided, otherwise use detected type
@@ -120,7 +140,7 @@ class RememberOperation:
                 chunk_type=final_type,
                 conversation_id=conversation_id,
                 tokens=result.tokens,
-                tags=result.tags,
+                tags=tag_list,
                 confidence=confidence
             )
             
@@ -136,3 +156,43 @@ class RememberOperation:
             "total_tokens": total_tokens,
             "chunks_created": len(created_chunks)
         }
+    
+    @contextmanager
+    def batch(self):
+        """
+        Context manager grouping the store writes of several remember() calls.
+        
+        With a store that supports it (LayeredChunkStoreAdapter), chunk and
+        link writes made between two store reads share one fsync instead of
+        one each; other stores write as usual. The linker's tag lookups are
+        cached for the duration of the block (see AutoLinker.cached_tags).
+        """
+        with ExitStack() as stack:
+            batched = getattr(self.store, "batched", None)
+            if batched is not None:
+                stack.enter_context(batched())
+            stack.enter_context(self.linker.cached_tags())
+            yield self
+    
+    def remember_many(self, items: List[dict]) -> List[dict]:
+        """
+        Remember several pieces of content in one batch().
+        
+        Each item is processed exactly like remember(). The store writes of
+        the whole batch are grouped as described in batch(); all of them are
+        on disk once this returns.
+        
+        Args:
+            items: List of dicts of remember() keyword arguments
+                   (content, conversation_id, tags, confidence, chunk_type)
+        
+        Returns:
+            List of confirmation dicts, one per item, in input order
+        
+        Raises:
+            ValueError: For invalid inputs (items before it are still stored)
+            TypeError: For None content
+        """
+        remember = self.remember
+        with self.batch():
+            return [remember(**item) for item in items]
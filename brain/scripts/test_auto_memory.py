@@ -0,0 +1,120 @@
+"""
+Tests for AutoMemory record buffering.
+
+Run: python -m unittest brain.scripts.test_auto_memory -v
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import auto_memory
+from auto_memory import AutoMemory
+from brain.scripts.remember_operation import RememberOperation
+
+
+class TestAutoMemoryBuffering(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.auto_mem = AutoMemory(conversation_id="conv-auto", flush_every=3)
+
+    def tearDown(self):
+        auto_memory._UNFLUSHED.discard(self.auto_mem)
+        os.chdir(self.old_cwd)
+        self.tmpdir.cleanup()
+
+    def stored(self):
+        return self.auto_mem.store.list_chunks(conversation_id="conv-auto")
+
+    def test_records_are_written_at_threshold(self):
+        self.auto_mem.start_session("threshold")
+        self.auto_mem.record_preference("Prefers tabs")
+        self.assertEqual(self.stored(), [])
+        self.assertEqual(len(self.auto_mem._pending), 2)
+
+        self.auto_mem.record_decision("Use JSONL", "Append-only")
+        self.assertEqual(self.auto_mem._pending, [])
+        self.assertEqual(len(self.stored()), 3)
+        self.assertNotIn(self.auto_mem, auto_memory._UNFLUSHED)
+
+    def test_forced_flush_and_close_write_partial_buffer(self):
+        self.auto_mem.start_session("forced")
+        self.assertEqual(self.auto_mem.flush(), 0)
+        self.assertEqual(self.auto_mem.flush(force=True), 1)
+        self.assertEqual(len(self.stored()), 1)
+
+        self.auto_mem.record_preference("Prefers spaces")
+        self.assertIn(self.auto_mem, auto_memory._UNFLUSHED)
+        self.auto_mem.close()
+        self.assertEqual(len(self.stored()), 2)
+
+    def test_invalid_record_raises_when_recorded(self):
+        self.auto_mem.start_session("invalid")
+        with self.assertRaises(ValueError):
+            self.auto_mem.record_decision("Bad", "Too sure", confidence=1.5)
+        self.auto_mem.record_preference("Prefers short names")
+        self.auto_mem.end_session("done")
+
+        self.assertEqual(self.auto_mem._pending, [])
+        self.assertEqual(len(self.stored()), 3)
+        self.assertEqual([item.kind for item in self.auto_mem.things_learned], ["preference"])
+
+    def test_failed_write_keeps_unwritten_records(self):
+        self.auto_mem.start_session("failure")
+        self.auto_mem.record_preference("Prefers tabs")
+        remember = self.auto_mem.remember.remember
+        calls = []
+
+        def flaky(**item):
+            calls.append(item)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return remember(**item)
+
+        with mock.patch.object(self.auto_mem.remember, "remember", side_effect=flaky):
+            with self.assertRaises(OSError):
+                self.auto_mem.record_decision("Use JSONL", "Append-only")
+
+        self.assertEqual(len(self.stored()), 1)
+        self.assertEqual(
+            [item["chunk_type"] for item in self.auto_mem._pending],
+            ["preference", "decision"],
+        )
+        self.assertEqual(self.auto_mem.flush(force=True), 2)
+        self.assertEqual(len(self.stored()), 3)
+
+
+class TestRememberManyBatching(unittest.TestCase):
+    def test_remember_many_groups_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                auto_mem = AutoMemory(conversation_id="conv-batch")
+                items = [
+                    {"content": f"Batched note {i}", "conversation_id": "conv-batch",
+                     "tags": ["batch"], "confidence": 0.9, "chunk_type": "note"}
+                    for i in range(4)
+                ]
+                raw_store = auto_mem.raw_store
+                with mock.patch.object(
+                    raw_store, "_write_entries", wraps=raw_store._write_entries
+                ) as write:
+                    results = auto_mem.remember.remember_many(items)
+
+                self.assertTrue(all(result["success"] for result in results))
+                # Without batching every chunk and every reverse link is its
+                # own write; grouped, each item costs about one
+                appended = sum(len(call.args[1]) for call in write.call_args_list)
+                self.assertGreater(appended, write.call_count)
+                self.assertLessEqual(write.call_count, len(items) + 1)
+                self.assertEqual(len(auto_mem.store.list_chunks(conversation_id="conv-batch")), 4)
+            finally:
+                os.chdir(old_cwd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,6 +70,43 @@ class TestMemoryCache(unittest.TestCase):
         
         removed = cache.cleanup()
         self.assertEqual(removed, 2)
+
+    def test_cleanup_skips_refreshed_entries(self):
+        """Should not evict a key re-set with a longer TTL."""
+        cache = MemoryCache(default_ttl=1)
+        cache.set("short", "value")
+        cache.set("refreshed", "old")
+        cache.set("refreshed", "new", ttl=60)
+        
+        time.sleep(1.1)
+        
+        self.assertEqual(cache.cleanup(), 1)
+        self.assertEqual(cache.get("refreshed"), "new")
+
+    def test_clock_tick_expiration(self):
+        """Should expire entries using the background clock tick."""
+        cache = MemoryCache(default_ttl=1, clock_tick=0.05)
+        self.addCleanup(cache.close)
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        
+        time.sleep(1.2)
+        
+        self.assertIsNone(cache.get("key"))
+
+    def test_capacity_evicts_least_recently_used(self):
+        """Should evict the least recently used key once a shard is full."""
+        cache = MemoryCache(default_ttl=60, max_entries=MemoryCache.SHARD_COUNT)
+        # One slot per shard: pick two keys that share a shard
+        target = cache._shard_for("k0")
+        keys = [k for k in (f"k{i}" for i in range(1000))
+                if cache._shard_for(k) == target][:2]
+        cache.set(keys[0], 0)
+        cache.set(keys[1], 1)
+        
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertEqual(cache.get(keys[1]), 1)
+        self.assertEqual(cache.stats()["evictions_capacity"], 1)
     
     def test_stats(self):
         """Should return stats."""
@@ -80,6 +117,44 @@ class TestMemoryCache(unittest.TestCase):
         self.assertEqual(stats["size"], 2)
         self.assertEqual(stats["default_ttl"], 60)
 
+    def test_concurrent_access(self):
+        """Should keep counts consistent across shards under threads."""
+        import threading
+
+        def worker(n):
+            for i in range(200):
+                key = f"k{n}-{i}"
+                self.cache.set(key, i)
+                self.assertEqual(self.cache.get(key), i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["size"], 1600)
+        self.assertEqual(stats["hits"], 1600)
+        self.assertEqual(stats["lookups"], 1600)
+
+    def test_finished_threads_keep_counts_but_drop_slots(self):
+        """Should fold a finished thread's counters into the totals."""
+        import gc
+        import threading
+
+        def worker():
+            self.cache.get("absent")
+
+        for _ in range(20):
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+        gc.collect()
+
+        self.assertEqual(self.cache.stats()["misses"], 20)
+        self.assertEqual(len(self.cache._counters._all), 0)
+
 
 class TestCacheManager(unittest.TestCase):
     """Test simplified cache manager."""
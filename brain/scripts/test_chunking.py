@@ -160,6 +160,22 @@ class TestContentTypeDetection(unittest.TestCase):
                     self.engine.detect_content_type(text),
                     ChunkType.NOTE.value
                 )
+    
+    def test_batch_detection_matches_single(self):
+        """Batched detection should match per-text detection."""
+        texts = [
+            "We decided to use Python",
+            "I usually prefer tabs",
+            "there is",
+            "5 apples",
+            "",
+            "She lives in Paris",
+            "Hello world"
+        ]
+        self.assertEqual(
+            self.engine.detect_content_types(texts),
+            [self.engine.detect_content_type(t) for t in texts]
+        )
 
 
 class TestParagraphSplitting(unittest.TestCase):
@@ -4,6 +4,8 @@ Tests for layered memory retrieval with source attribution.
 Run: python -m unittest brain.scripts.test_layered_retrieval -v
 """
 
+import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -91,5 +93,196 @@ class TestLayeredRetrieval(unittest.TestCase):
             self.assertEqual(all_records[0]["id"], "g1")
             self.assertEqual(all_records[1]["id"], "a1")
 
+    def test_get_record_by_id_matches_full_scan(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            policy = MemoryPolicy(
+                project_root=project_root,
+                read_layers=["project_agent", "project_global"],
+                write_layers=["project_agent", "project_global"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"created_at": "2026-02-11T00:00:00Z", "entry_type": "fact",
+                    "project_id": "rlm-mem"}
+
+            store.append_entry(layer="project_global", record=dict(
+                base, id="shared", scope="project_global", content="global"))
+            self.assertEqual(store.get_record_by_id("shared")["content"], "global")
+
+            # Newer version in the same layer, and a copy in a higher layer
+            store.append_entry(layer="project_agent", record=dict(
+                base, id="shared", scope="project_agent", content="agent v1"))
+            store.append_entry(layer="project_agent", record=dict(
+                base, id="shared", scope="project_agent", content="agent v2"))
+
+            # Appended by a second store instance (another writer)
+            other = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            other.append_entry(layer="project_global", record=dict(
+                base, id="late", scope="project_global", content="late"))
+
+            record = store.get_record_by_id("shared")
+            expected = next(r for r in store.get_all_records() if r["id"] == "shared")
+            self.assertEqual(record, expected)
+            self.assertEqual(record["content"], "agent v2")
+            self.assertEqual(record["source_layer"], "project_agent")
+            self.assertEqual(store.get_record_by_id("late")["content"], "late")
+            self.assertIsNone(store.get_record_by_id("missing"))
+
+    def test_cached_records_track_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_global"],
+                write_layers=["project_global"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            other = LayeredMemoryStore(policy=policy, agent_id="agent-2")
+            base = {"created_at": "2026-02-11T00:00:00Z", "scope": "project_global",
+                    "entry_type": "note", "project_id": "rlm-mem"}
+
+            store.append_entry("project_global", dict(base, id="one", content="1"))
+            first = store.get_all_records()
+            first[0]["content"] = "mutated by caller"
+
+            other.append_entry("project_global", dict(base, id="two", content="2"))
+            self.assertEqual([r["content"] for r in store.get_all_records()], ["2", "1"])
+
+            # A rewritten file is re-read rather than extended
+            path = Path(first[0]["source_path"])
+            path.write_text(path.read_text(encoding="utf-8").splitlines(True)[1], encoding="utf-8")
+            self.assertEqual([r["id"] for r in store.get_all_records()], ["two"])
+
+    def test_rewritten_file_that_grew_is_reread(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_global"],
+                write_layers=["project_global"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"created_at": "2026-02-11T00:00:00Z", "scope": "project_global",
+                    "entry_type": "note", "project_id": "rlm-mem"}
+            store.append_entry("project_global", dict(base, id="one", content="1"))
+            store.append_entry("project_global", dict(base, id="two", content="2"))
+            listed = store.get_all_records()
+            self.assertEqual([r["id"] for r in listed], ["two", "one"])
+
+            # Drop "one" and add more lines in place: same inode, larger file
+            path = Path(listed[0]["source_path"])
+            lines = path.read_text(encoding="utf-8").splitlines(True)
+            extra = [json.dumps(dict(base, id=i, content=i)) + "\n" for i in ("replaced", "new2")]
+            with path.open("r+", encoding="utf-8") as handle:
+                handle.write("".join(lines[1:] + extra))
+                handle.truncate()
+
+            self.assertEqual([r["id"] for r in store.get_all_records()], ["new2", "replaced", "two"])
+            self.assertEqual([r["id"] for r in listed], ["two", "one"])
+
+    def test_id_index_notices_in_place_rewrites(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_global"],
+                write_layers=["project_global"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"created_at": "2026-02-11T00:00:00Z", "scope": "project_global",
+                    "entry_type": "note", "project_id": "rlm-mem"}
+            store.append_entry("project_global", dict(base, id="one", content="1"))
+            store.append_entry("project_global", dict(base, id="two", content="2"))
+            self.assertEqual(store.record_ids(), {"one", "two"})
+            path = Path(store.get_record_by_id("one")["source_path"])
+
+            # Same size, different content
+            st = path.stat()
+            path.write_text(path.read_text(encoding="utf-8").replace('"one"', '"uno"'),
+                            encoding="utf-8")
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            self.assertEqual(store.record_ids(), {"uno", "two"})
+
+            # Larger than before, with the old lines gone
+            extra = [json.dumps(dict(base, id=i, content=i)) + "\n" for i in ("three", "four")]
+            with path.open("r+", encoding="utf-8") as handle:
+                handle.write("".join(extra))
+                handle.truncate()
+            self.assertEqual(store.record_ids(), {"three", "four"})
+            self.assertIsNone(store.get_record_by_id("two"))
+
+    def test_record_ids_match_listed_records(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_agent", "project_global"],
+                write_layers=["project_agent", "project_global"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1", batch_size=10)
+            base = {"created_at": "2026-02-11T00:00:00Z", "entry_type": "note",
+                    "project_id": "rlm-mem", "agent_id": "agent-1", "content": "x"}
+            store.append_entry("project_global", dict(base, id="g", scope="project_global"))
+            store.append_entry("project_agent", dict(base, id=7, scope="project_agent"))
+            store.append_entry("project_agent", dict(base, id="g", scope="project_agent"))
+
+            # Buffered writes are flushed before the ids are read
+            self.assertEqual(store.record_ids(), {"g", "7"})
+            self.assertEqual(store.record_ids(),
+                             {str(r["id"]) for r in store.get_all_records()})
+
+    def test_get_records_in_time_range_uses_resolved_versions(self):
+        from datetime import datetime
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_agent"],
+                write_layers=["project_agent"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"scope": "project_agent", "agent_id": "agent-1",
+                    "entry_type": "note", "content": "c", "project_id": "rlm-mem"}
+            store.append_entry("project_agent", dict(base, id="early", created_at="2026-02-11T00:00:00Z"))
+            store.append_entry("project_agent", dict(base, id="late", created_at="2026-02-11T02:00:00Z"))
+            store.append_entry("project_agent", dict(base, id="moved", created_at="2026-02-11T01:00:00Z"))
+            # Newer version of "moved" falls outside the range
+            store.append_entry("project_agent", dict(base, id="moved", created_at="2026-02-11T03:00:00Z"))
+
+            in_range = store.get_records_in_time_range(
+                datetime(2026, 2, 11, 0, 30), datetime(2026, 2, 11, 2, 0)
+            )
+            self.assertEqual([r["id"] for r in in_range], ["late"])
+
+            after = store.get_records_in_time_range(created_after=datetime(2026, 2, 11, 1, 0))
+            # get_all_records() order: newest line first
+            self.assertEqual([r["id"] for r in after], ["moved", "late"])
+
+    def test_get_records_with_tags_uses_resolved_versions(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(
+                project_root=Path(tmpdir),
+                read_layers=["project_agent"],
+                write_layers=["project_agent"],
+            )
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"scope": "project_agent", "agent_id": "agent-1", "entry_type": "note",
+                    "content": "c", "project_id": "rlm-mem", "created_at": "2026-02-11T00:00:00Z"}
+            store.append_entry("project_agent", dict(base, id="both", tags=["a", "b"]))
+            store.append_entry("project_agent", dict(base, id="only-a", tags=["a"]))
+            self.assertEqual([r["id"] for r in store.get_records_with_tags(["a"])], ["only-a", "both"])
+
+            # Retagging an id moves it between postings
+            store.append_entry("project_agent", dict(base, id="both", tags=["b"]))
+            store.append_entry("project_agent", dict(base, id="only-a", tags=["a", "b"]))
+            self.assertEqual([r["id"] for r in store.get_records_with_tags(["a"])], ["only-a"])
+            self.assertEqual(
+                [r["id"] for r in store.get_records_with_tags(["b", "a"])], ["only-a"]
+            )
+            self.assertEqual(store.get_records_with_tags(["missing"]), [])
+
+            store.append_entry("project_agent", dict(base, id="other-conv", tags=["b"],
+                                                     conversation_id="conv-2"))
+            self.assertEqual(
+                [r["id"] for r in store.get_records_matching(["b"], conversation_id="conv-2")],
+                ["other-conv"],
+            )
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
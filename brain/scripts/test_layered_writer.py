@@ -4,12 +4,16 @@ Tests for append-only layered JSONL writer with locking.
 Run: python -m unittest brain.scripts.test_layered_writer -v
 """
 
+import gc
 import json
 import tempfile
 import threading
 import unittest
+import weakref
 from pathlib import Path
+from unittest import mock
 
+from brain.scripts import layered_memory_store
 from brain.scripts.layered_memory_store import LayeredMemoryStore
 from brain.scripts.memory_policy import MemoryPolicy
 
@@ -102,6 +106,76 @@ class TestLayeredWriter(unittest.TestCase):
                 self.assertIn("id", parsed)
                 self.assertIn("content", parsed)
 
+    def test_batched_appends_flush_in_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            policy = MemoryPolicy(project_root=project_root)
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-c", batch_size=3)
+            target = project_root / ".agents" / "memory" / "agents" / "agent-c" / "memory.jsonl"
+
+            def record(idx: int) -> dict:
+                return {
+                    "id": f"rec-{idx}",
+                    "created_at": f"2026-02-11T00:00:0{idx}Z",
+                    "scope": "project_agent",
+                    "entry_type": "fact",
+                    "content": f"row {idx}",
+                    "project_id": "rlm-mem",
+                }
+
+            store.append_entry("project_agent", record(0))
+            store.append_entry("project_agent", record(1))
+            self.assertFalse(target.exists())
+
+            store.append_entry("project_agent", record(2))
+            store.append_entry("project_agent", record(3))
+            lines = target.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["id"] for line in lines], ["rec-0", "rec-1", "rec-2"])
+
+            # Reads flush pending appends first
+            self.assertEqual(store.get_record_by_id("rec-3")["content"], "row 3")
+            self.assertEqual(len(target.read_text(encoding="utf-8").splitlines()), 4)
+            self.assertEqual(store.get_record_by_id("rec-1")["content"], "row 1")
+
+    def test_failed_flush_keeps_earlier_buffered_appends(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(project_root=Path(tmpdir))
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-c", batch_size=3)
+            base = {"created_at": "2026-02-11T00:00:00Z", "entry_type": "fact",
+                    "content": "row", "project_id": "rlm-mem"}
+
+            store.append_entry("project_agent", dict(base, id="r0"))
+            store.append_entry("project_agent", dict(base, id="r1"))
+            with mock.patch.object(store, "_write_entries", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    store.append_entry("project_agent", dict(base, id="r2"))
+                with self.assertRaises(OSError):
+                    store.flush()
+
+            # The failing append is not written later; acknowledged ones are
+            self.assertEqual(store.record_ids(), {"r0", "r1"})
+
+    def test_exit_hook_flushes_without_keeping_stores_alive(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(project_root=Path(tmpdir))
+            store = LayeredMemoryStore(policy=policy, agent_id="agent-d", batch_size=4)
+            base = {"created_at": "2026-02-11T00:00:00Z", "entry_type": "fact",
+                    "content": "row", "project_id": "rlm-mem"}
+            target = store._paths["project_agent"]
+
+            store.append_entry("project_agent", dict(base, id="r0"))
+            self.assertFalse(target.exists())
+            layered_memory_store._flush_buffered_stores()
+            self.assertEqual(len(target.read_text(encoding="utf-8").splitlines()), 1)
+
+            # Once flushed, nothing at module level refers to the store
+            store.append_entry("project_agent", dict(base, id="r1"))
+            store.flush()
+            ref = weakref.ref(store)
+            del store
+            gc.collect()
+            self.assertIsNone(ref())
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -128,6 +128,37 @@ class TestLayeredWriterConcurrencyIntegrity(unittest.TestCase):
                     all(record["agent_id"] == store.agent_id for record in valid_records)
                 )
 
+    def test_held_file_lock_times_out_other_writers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            policy = MemoryPolicy(project_root=project_root)
+            holder = LayeredMemoryStore(policy=policy, agent_id="agent-a")
+            waiter = LayeredMemoryStore(
+                policy=policy, agent_id="agent-a", lock_timeout_seconds=0.05
+            )
+            target = project_root / ".agents" / "memory" / "agents" / "agent-a" / "memory.jsonl"
+            target.parent.mkdir(parents=True)
+            errors: list[Exception] = []
+
+            def worker() -> None:
+                try:
+                    with waiter._file_lock(target):
+                        pass
+                except Exception as exc:
+                    errors.append(exc)
+
+            with holder._file_lock(target):
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join()
+
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0], TimeoutError)
+            self.assertFalse(Path(str(target) + ".lock").exists())
+
+            with waiter._file_lock(target):
+                pass
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -148,6 +148,48 @@ class TestAutoLinker(unittest.TestCase):
         # Should NOT have related_to link (would be duplicate)
         self.assertNotIn(chunk1.id, chunk2.links.related_to)
 
+    def test_tag_cache_tracks_new_chunks(self):
+        """Test cached tag lookups include chunks linked after the first lookup."""
+        unique_id = uuid.uuid4().hex[:8]
+        created = []
+        with self.linker.cached_tags():
+            for i in range(3):
+                chunk = self.store.create_chunk(
+                    f"Cache message {i}",
+                    "note",
+                    f"conv-cache-{i}-{unique_id}",
+                    5,
+                    tags=["cached-tag"]
+                )
+                created.append(self.linker.link_on_create(chunk))
+
+            self.assertIn("cached-tag", self.linker._tag_cache)
+        self.assertIsNone(self.linker._tag_cache)
+        self.assertIn(created[0].id, created[2].links.related_to)
+        self.assertIn(created[1].id, created[2].links.related_to)
+
+    def test_chunks_tagged_outside_linker_are_related(self):
+        """Test chunks tagged directly in the store are seen by later links."""
+        unique_id = uuid.uuid4().hex[:8]
+        tag = f"outside-{unique_id}"
+        first = self.linker.link_on_create(self.store.create_chunk(
+            "Linked first", "note", f"conv-a-{unique_id}", 5, tags=[tag]
+        ))
+        direct = self.store.create_chunk(
+            "Created directly", "note", f"conv-b-{unique_id}", 5, tags=[tag]
+        )
+        retagged = self.store.create_chunk(
+            "Retagged later", "note", f"conv-c-{unique_id}", 5, tags=[]
+        )
+        self.store.update_chunk(retagged.id, tags=[tag])
+        last = self.linker.link_on_create(self.store.create_chunk(
+            "Linked last", "note", f"conv-d-{unique_id}", 5, tags=[tag]
+        ))
+
+        self.assertEqual(
+            set(last.links.related_to), {first.id, direct.id, retagged.id}
+        )
+
 
 class TestLinkStrength(unittest.TestCase):
     """Test link strength calculation."""
@@ -4,8 +4,10 @@ Tests for layered memory policy loader.
 Run: python -m unittest brain.scripts.test_memory_policy -v
 """
 
+import os
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
 from brain.scripts.memory_policy import MemoryPolicy, load_memory_policy
@@ -16,6 +18,19 @@ class TestMemoryPolicyLoader(unittest.TestCase):
         policy = MemoryPolicy(project_root=".")
         self.assertEqual(policy.project_memory_root, Path(".") / ".agents" / "memory")
 
+    def test_memory_roots_follow_project_root_and_home_changes(self):
+        policy = MemoryPolicy(project_root="/tmp/one")
+        self.assertIs(policy.project_memory_root, policy.project_memory_root)
+
+        policy.project_root = Path("/tmp/two")
+        self.assertEqual(policy.project_memory_root, Path("/tmp/two/.agents/memory"))
+        self.assertEqual(policy, MemoryPolicy(project_root=Path("/tmp/two")))
+
+        with mock.patch.dict(os.environ, {"HOME": "/tmp/home-a"}):
+            self.assertEqual(policy.user_memory_root, Path.home() / ".agents" / "memory")
+        with mock.patch.dict(os.environ, {"HOME": "/tmp/home-b"}):
+            self.assertEqual(policy.user_memory_root, Path.home() / ".agents" / "memory")
+
     def test_default_policy_is_local_only_when_config_missing(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             policy = load_memory_policy(project_root=tmpdir)
@@ -64,6 +79,22 @@ class TestMemoryPolicyLoader(unittest.TestCase):
         self.assertEqual(policy.write_layers, ["project_agent", "user_agent"])
         self.assertEqual(policy.redaction_rules, ["api_key", "token"])
 
+    def test_loader_reuses_parsed_config_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir) / ".agents" / "memory"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            config_path = config_dir / "config.yaml"
+            config_path.write_text("redaction_rules:\n  - token\n", encoding="utf-8")
+
+            first = load_memory_policy(project_root=tmpdir)
+            first.redaction_rules.append("mutated")
+            second = load_memory_policy(project_root=tmpdir)
+            self.assertEqual(second.redaction_rules, ["token"])
+
+            config_path.write_text("redaction_rules:\n  - api_key\n  - secret\n", encoding="utf-8")
+            third = load_memory_policy(project_root=tmpdir)
+            self.assertEqual(third.redaction_rules, ["api_key", "secret"])
+
     def test_loader_rejects_unsafe_write_layers_without_opt_in(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_dir = Path(tmpdir) / ".agents" / "memory"
@@ -9,7 +9,12 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from brain.scripts.memory_schema import load_jsonl_records, validate_record
+from brain.scripts.memory_schema import (
+    iter_jsonl_records,
+    load_jsonl_records,
+    load_jsonl_records_reverse,
+    validate_record,
+)
 
 
 class TestLayeredSchemaValidation(unittest.TestCase):
@@ -119,6 +124,65 @@ class TestLayeredSchemaValidation(unittest.TestCase):
         self.assertIn("line", warnings[0])
         self.assertIn("path", warnings[0])
 
+    def test_load_jsonl_records_reverse_yields_newest_first(self):
+        records = [
+            {
+                "id": f"mem-{idx}",
+                "created_at": "2026-02-11T00:00:00Z",
+                "scope": "project_global",
+                "entry_type": "fact",
+                "content": "x" * idx,
+                "project_id": "rlm-mem",
+            }
+            for idx in range(6)
+        ]
+        lines = [json.dumps(record) for record in records]
+        lines.insert(2, "{invalid json")
+        lines.insert(4, "")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.jsonl"
+            # No trailing newline: the last line is still a record
+            path.write_text("\n".join(lines), encoding="utf-8")
+            forward, _warnings = load_jsonl_records(path)
+
+            # Tiny blocks force lines to span several reads
+            newest_first = list(load_jsonl_records_reverse(path, block_size=16))
+            limited = list(load_jsonl_records_reverse(path, limit=2, block_size=16))
+
+        self.assertEqual(newest_first, forward[::-1])
+        self.assertEqual([record["id"] for record in limited], ["mem-5", "mem-4"])
+
+    def test_iter_jsonl_records_streams_records_and_warnings_in_order(self):
+        record = {
+            "id": "mem-1",
+            "created_at": "2026-02-11T00:00:00Z",
+            "scope": "project_global",
+            "entry_type": "fact",
+            "content": "hello",
+            "project_id": "rlm-mem",
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.jsonl"
+            path.write_text(
+                "{invalid json\n\n" + json.dumps(record) + "\n",
+                encoding="utf-8",
+            )
+            stream = iter_jsonl_records(path)
+            first = next(stream)
+            second = next(stream)
+            rest = list(stream)
+            missing = list(iter_jsonl_records(Path(tmpdir) / "absent.jsonl"))
+
+        self.assertIsNone(first[0])
+        self.assertEqual(first[1]["code"], "invalid_json")
+        self.assertEqual(first[1]["line"], 1)
+        self.assertEqual(second[0]["id"], "mem-1")
+        self.assertIsNone(second[1])
+        self.assertEqual(rest, [])
+        self.assertEqual(missing, [])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -4,8 +4,13 @@ Tests for migration tool idempotency.
 
 import unittest
 import tempfile
+import io
 import json
+import uuid
+from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
+from brain.scripts import migration_tool
 from brain.scripts.migration_tool import migrate_chunks
 from brain.scripts.layered_adapter import LayeredChunkStoreAdapter
 from brain.scripts.layered_memory_store import LayeredMemoryStore
@@ -51,5 +56,78 @@ class TestMigrationIdempotency(unittest.TestCase):
         final_count = len(adapter.list_chunks())
         self.assertEqual(initial_count, final_count)
 
+    def test_partial_final_batch_is_written(self):
+        ids = [f"legacy-batch-{i}" for i in range(3)]
+        for i, chunk_id in enumerate(ids):
+            (self.legacy_dir / f"chunk-batch-{i}.json").write_text(json.dumps({
+                "id": chunk_id,
+                "content": f"Batched content {i}",
+                "type": "note",
+                "metadata": {"created_at": "2025-01-02T00:00:00Z"}
+            }), encoding="utf-8")
+
+        with mock.patch.object(migration_tool, "MIGRATION_BATCH_SIZE", 2):
+            migrate_chunks(self.legacy_dir, "project_global", "project_global")
+
+        policy = MemoryPolicy(project_root=Path.cwd())
+        store = LayeredMemoryStore(policy=policy, agent_id="verify")
+        listed = set(LayeredChunkStoreAdapter(store).list_chunks())
+        for chunk_id in ids + [self.chunk_id]:
+            self.assertIn(chunk_id, listed)
+
+    def test_failed_batch_write_is_not_counted_as_migrated(self):
+        # Unique ids: the destination layer is shared with the other tests
+        (self.legacy_dir / "chunk-1.json").unlink()
+        suffix = uuid.uuid4().hex[:8]
+        for name in ("a", "b"):
+            (self.legacy_dir / f"chunk-{name}.json").write_text(json.dumps({
+                "id": f"legacy-{name}-{suffix}", "content": f"Content {name}",
+                "metadata": {"created_at": "2025-01-01T00:00:00Z"}
+            }), encoding="utf-8")
+
+        out = io.StringIO()
+        with mock.patch.object(migration_tool, "MIGRATION_BATCH_SIZE", 2), \
+                mock.patch.object(LayeredMemoryStore, "_write_entries",
+                                  side_effect=OSError("disk full")), redirect_stdout(out):
+            migrate_chunks(self.legacy_dir, "project_global", "project_global")
+        self.assertIn("Successfully migrated: 0", out.getvalue())
+        self.assertIn("Errors: 2", out.getvalue())
+
+        # Missing content fails validation on its own; the rest still lands
+        (self.legacy_dir / "chunk-c.json").write_text(json.dumps({
+            "id": f"legacy-c-{suffix}", "metadata": {"created_at": "2025-01-01T00:00:00Z"}
+        }), encoding="utf-8")
+        out = io.StringIO()
+        with mock.patch.object(migration_tool, "MIGRATION_BATCH_SIZE", 3), redirect_stdout(out):
+            migrate_chunks(self.legacy_dir, "project_global", "project_global")
+        self.assertIn("Successfully migrated: 2", out.getvalue())
+        self.assertIn("Errors: 1", out.getvalue())
+
+    def test_parallel_parse_keeps_file_order_and_reports_bad_files(self):
+        ids = [f"legacy-par-{i}" for i in range(4)]
+        for i, chunk_id in enumerate(ids):
+            (self.legacy_dir / f"chunk-par-{i}.json").write_text(json.dumps({
+                "id": chunk_id,
+                "content": f"Parallel content {i}",
+                "metadata": {"created_at": "2025-01-03T00:00:00Z"}
+            }), encoding="utf-8")
+        (self.legacy_dir / "chunk-par-bad.json").write_text("{not json", encoding="utf-8")
+
+        files = list(self.legacy_dir.rglob("chunk-*.json"))
+        with mock.patch.object(migration_tool, "MIGRATION_PARALLEL_MIN_FILES", 0), \
+                mock.patch.object(migration_tool, "MIGRATION_PARSE_WINDOW", 2):
+            results = list(migration_tool._transform_all(
+                iter(files), "project_global", "2026-01-01T00:00:00Z", 2
+            ))
+
+        self.assertEqual([path for path, _, _ in results], [str(path) for path in files])
+        for path, record, error in results:
+            if path.endswith("chunk-par-bad.json"):
+                self.assertIsNone(record)
+                self.assertTrue(error)
+            else:
+                self.assertIsNone(error)
+                self.assertEqual(record["metadata"]["migrated_from"], path)
+
 if __name__ == "__main__":
     unittest.main()
@@ -118,6 +118,36 @@ class TestRememberBasic(unittest.TestCase):
         self.assertEqual(metadata["conversation_id"], "test-conv-index")
 
 
+class TestRememberMany(unittest.TestCase):
+    """Test batched REMEMBER."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = ChunkStore(self.temp_dir)
+        self.remember = RememberOperation(self.store)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_remember_many_returns_result_per_item(self):
+        """Should store each item and return results in input order."""
+        results = self.remember.remember_many([
+            {"content": "First batched note", "conversation_id": "batch-1", "tags": ["batch"]},
+            {"content": "   ", "conversation_id": "batch-1"},
+            {"content": "Second batched note", "conversation_id": "batch-1", "tags": ["batch"]},
+        ])
+        
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        first_id = results[0]["chunk_ids"][0]
+        second_id = results[2]["chunk_ids"][0]
+        second = self.store.get_chunk(second_id)
+        self.assertIn(first_id, second.links.context_of)
+    
+    def test_remember_many_empty(self):
+        """Should accept an empty batch."""
+        self.assertEqual(self.remember.remember_many([]), [])
+
+
 class TestRememberChunking(unittest.TestCase):
     """Test that REMEMBER properly chunks content."""
     
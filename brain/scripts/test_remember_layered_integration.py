@@ -6,7 +6,9 @@ Run: python -m unittest brain.scripts.test_remember_layered_integration -v
 
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
 from brain.scripts.layered_memory_store import LayeredMemoryStore
 from brain.scripts.memory_policy import MemoryPolicy
@@ -80,6 +82,35 @@ class TestRememberLayeredIntegration(unittest.TestCase):
             self.assertIsNotNone(chunk_obj)
             self.assertIn(chunk_obj.content, ["Content A", "Content B"])
 
+    def test_time_bounded_list_without_time_index_scans(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy = MemoryPolicy(project_root=Path(tmpdir))
+            layered_store = LayeredMemoryStore(policy=policy, agent_id="agent-1")
+            base = {"entry_type": "note", "content": "c", "project_id": "rlm-mem",
+                    "conversation_id": "conv-1"}
+            layered_store.append_entry("project_agent", dict(base, id="early", created_at="2026-02-11T00:00:00Z"))
+            layered_store.append_entry("project_agent", dict(base, id="late", created_at="2026-02-11T02:00:00Z"))
+
+            class ScanOnlyStore:
+                iter_all_records = layered_store.iter_all_records
+
+            adapter = LayeredChunkStoreAdapter(ScanOnlyStore())
+            self.assertEqual(
+                adapter.list_chunks(created_after=datetime(2026, 2, 11, 1, 0)), ["late"]
+            )
+            self.assertEqual(
+                adapter.list_chunks(conversation_id="conv-1",
+                                    created_before=datetime(2026, 2, 11, 1, 0)),
+                ["early"],
+            )
+
+            # Errors raised by the time index are not mistaken for "no matches"
+            adapter = LayeredChunkStoreAdapter(layered_store)
+            with mock.patch.object(layered_store, "get_records_in_time_range",
+                                   side_effect=AttributeError("broken plan")):
+                with self.assertRaises(AttributeError):
+                    adapter.list_chunks(created_after=datetime(2026, 2, 11, 1, 0))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -9,8 +9,9 @@ import json
 import tempfile
 import shutil
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+import memory_store
 from memory_store import (
     ChunkStore, ChunkIndex, Chunk, ChunkMetadata, 
     ChunkLinks, ChunkType, init_storage
@@ -175,6 +176,45 @@ class TestChunkRetrieval(unittest.TestCase):
             retrieved.metadata.last_accessed.replace("Z", "+00:00")
         )
         self.assertTrue(before <= accessed.replace(tzinfo=None) <= after)
+    
+    def test_access_tracking_is_buffered_until_flush(self):
+        """Reads should not rewrite the chunk file until counters are flushed."""
+        chunk_path = self.store._get_chunk_path(self.chunk.id)
+        original = chunk_path.read_text(encoding="utf-8")
+        
+        self.store.get_chunk(self.chunk.id)
+        self.store.get_chunk(self.chunk.id)
+        self.assertEqual(chunk_path.read_text(encoding="utf-8"), original)
+        
+        self.store.flush_access()
+        on_disk = json.loads(chunk_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["metadata"]["access_count"], 2)
+        
+        untracked = self.store.get_chunk(self.chunk.id, track_access=False)
+        self.assertEqual(untracked.metadata.access_count, 2)
+    
+    def test_pending_access_counters_flush_at_exit(self):
+        """The exit hook should write back counters nobody flushed."""
+        chunk_path = self.store._get_chunk_path(self.chunk.id)
+        self.store.get_chunk(self.chunk.id)
+        
+        memory_store._flush_pending_access()
+        on_disk = json.loads(chunk_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["metadata"]["access_count"], 1)
+    
+    def test_cached_chunk_tracks_file_changes(self):
+        """Edits made behind the store's back should be picked up."""
+        first = self.store.get_chunk(self.chunk.id)
+        first.tags.append("mutated")
+        
+        chunk_path = self.store._get_chunk_path(self.chunk.id)
+        data = json.loads(chunk_path.read_text(encoding="utf-8"))
+        data["content"] = "Edited elsewhere"
+        chunk_path.write_text(json.dumps(data), encoding="utf-8")
+        
+        retrieved = self.store.get_chunk(self.chunk.id)
+        self.assertEqual(retrieved.content, "Edited elsewhere")
+        self.assertEqual(retrieved.tags, [])
 
 
 class TestChunkUpdate(unittest.TestCase):
@@ -328,6 +368,50 @@ class TestChunkListing(unittest.TestCase):
         """Should require all tags."""
         chunks = self.store.list_chunks(tags=["tag1", "tag2"])
         self.assertEqual(len(chunks), 1)  # only chunk 3
+    
+    def test_filtered_listing_tracks_creates_and_deletes(self):
+        """Indexed conversation/tag filters should follow later mutations."""
+        before = self.store.list_chunks(conversation_id="conv-a", tags=["tag1"])
+        self.assertEqual(len(before), 1)
+        
+        extra = self.store.create_chunk(
+            content="Chunk 4", chunk_type="note", conversation_id="conv-a",
+            tokens=5, tags=["tag1"]
+        )
+        self.assertEqual(
+            self.store.list_chunks(conversation_id="conv-a", tags=["tag1"]),
+            before + [extra.id]
+        )
+        self.assertEqual(self.store.list_chunks(tags=["tag1"])[-1], extra.id)
+        
+        self.store.delete_chunk(extra.id)
+        self.assertNotIn(extra.id, self.store.list_chunks(tags=["tag1"]))
+        self.assertNotIn(extra.id, self.store.list_chunks(conversation_id="conv-a"))
+    
+    def test_list_by_date_range(self):
+        """Date filters should match both indexed and legacy metadata entries."""
+        legacy_id = "chunk-2020-01-01-legacy00"
+        self.store.metadata_index.add(legacy_id, {
+            "type": "note",
+            "conversation_id": "conv-a",
+            "created": "2020-01-01T00:00:00Z"
+        })
+        store = ChunkStore(self.store.base_path)
+        now = datetime.now(timezone.utc)
+        
+        recent = store.list_chunks(created_after=now - timedelta(hours=1))
+        self.assertEqual(len(recent), 3)
+        self.assertNotIn(legacy_id, recent)
+        
+        old = store.list_chunks(
+            created_after=datetime(2019, 12, 31, tzinfo=timezone.utc),
+            created_before=datetime(2020, 1, 1, tzinfo=timezone.utc)
+        )
+        self.assertEqual(old, [legacy_id])
+        self.assertEqual(
+            store.list_chunks(conversation_id="conv-a", created_before=now),
+            store.list_chunks(conversation_id="conv-a")
+        )
 
 
 class TestChunkIndex(unittest.TestCase):
@@ -364,6 +448,68 @@ class TestChunkIndex(unittest.TestCase):
         result = self.index.get_list("tag1")
         self.assertIn("chunk-a", result)
         self.assertIn("chunk-b", result)
+    
+    def test_batched_mutations_save_once_on_exit(self):
+        """Mutations inside a with-block should reach disk when it exits."""
+        with self.index:
+            self.index.add("key1", "value1")
+            self.index.add_to_list("tag1", "chunk-a")
+            self.assertFalse(self.index_path.exists())
+        
+        new_index = ChunkIndex(self.index_path)
+        self.assertEqual(new_index.get("key1"), "value1")
+        self.assertEqual(new_index.get_list("tag1"), ["chunk-a"])
+    
+    def test_index_file_is_read_on_first_access(self):
+        """The index file should be read lazily; saving creates its directory."""
+        nested_path = Path(self.temp_dir) / "nested" / "index.json"
+        index = ChunkIndex(nested_path)
+        self.assertFalse(nested_path.parent.exists())
+        
+        index.add("key1", "value1")
+        self.assertTrue(index.log_path.exists())
+        
+        lazy = ChunkIndex(nested_path)
+        index.add("key2", "value2")
+        self.assertEqual(sorted(lazy.get_all_keys()), ["key1", "key2"])
+    
+    def test_log_replays_and_compacts_into_snapshot(self):
+        """Logged mutations should survive reloads and compaction."""
+        self.index.add("key1", {"value": 1})
+        self.index.add("key2", "gone")
+        self.index.remove("key2")
+        self.index.add_to_list("tag1", "chunk-a")
+        self.index.add_to_list("tag1", "chunk-b")
+        self.index.remove_from_list("tag1", "chunk-a")
+        self.assertFalse(self.index_path.exists())
+        
+        replayed = ChunkIndex(self.index_path)
+        self.assertEqual(replayed.get_all_keys(), ["key1"])
+        self.assertEqual(replayed.get_list("tag1"), ["chunk-b"])
+        
+        # Force compaction on the next append
+        replayed.COMPACT_MIN_LOG_BYTES = 0
+        replayed.add("key3", "value3")
+        self.assertTrue(self.index_path.exists())
+        self.assertFalse(replayed.log_path.exists())
+        
+        compacted = ChunkIndex(self.index_path)
+        self.assertEqual(compacted.get_all_keys(), ["key1", "key3"])
+        self.assertEqual(compacted.get_list("tag1"), ["chunk-b"])
+
+    def test_torn_log_tail_does_not_swallow_next_entry(self):
+        """A crash mid-append should not cost the next logged mutation."""
+        self.index.add("a", 1)
+        with self.index.log_path.open("ab") as handle:
+            handle.write(b'{"op": "add", "k": "to')
+
+        reopened = ChunkIndex(self.index_path)
+        self.assertEqual(reopened.get_all_keys(), ["a"])
+        # Loading alone never rewrites the log
+        self.assertTrue(self.index.log_path.read_bytes().endswith(b'"to'))
+        reopened.add("b", 2)
+        self.assertEqual(sorted(reopened.get_all_keys()), ["a", "b"])
+        self.assertEqual(sorted(ChunkIndex(self.index_path).get_all_keys()), ["a", "b"])
 
 
 class TestChunkSerialization(unittest.TestCase):